@@ -8,3 +8,4 @@ class BaseConfig(AppConfig):
 
     def ready(self):
         import base.admin  # This ensures admin.py is loaded
+        import base.signals  # Registers model signal handlers
@@ -0,0 +1,143 @@
+import bisect
+from base.local_cache import VersionedValue
+from base.models.course_model import Course
+from base.models.department_model import Department
+from base.models.faculty_model import Faculty
+from base.utils import normalize_name
+
+
+# ============================================================================
+# NAME AUTOCOMPLETE
+# ============================================================================
+#
+# Typeahead for department, course and faculty names is answered from prefix
+# tries held in process memory, one per type, instead of an icontains query
+# per keystroke. Every trie node keeps its best MAX_AUTOCOMPLETE_RESULTS
+# entries, so a lookup only walks the typed prefix. Names are indexed from
+# their start and from the start of every later word (faculty also by slug);
+# matches on the start of the whole name rank first, then shorter names.
+#
+# The tries are rebuilt lazily: the signal handlers in base/signals.py store
+# a new content version in the cache whenever one of the names changes, and
+# the next lookup that sees a different version rebuilds. AUTOCOMPLETE_MAX_AGE
+# bounds staleness where the cache is not shared between processes.
+
+AUTOCOMPLETE_VERSION_KEY = 'base:autocomplete_version'
+AUTOCOMPLETE_MAX_AGE = 300
+
+MAX_AUTOCOMPLETE_RESULTS = 20
+DEFAULT_AUTOCOMPLETE_RESULTS = 10
+
+# entity type -> loader of (id, name, slug) rows
+AUTOCOMPLETE_SOURCES = {
+    'department': lambda: Department.objects.values_list('id', 'name', 'slug'),
+    'course': lambda: Course.objects.values_list('id', 'name', 'slug'),
+    'faculty': lambda: Faculty.objects.values_list('id', 'name', 'slug'),
+}
+
+# Types whose slug is indexed as another name (faculty slugs are often searched for)
+SLUG_INDEXED_TYPES = ('faculty',)
+
+
+class PrefixTrie:
+    """Prefix tree whose nodes keep their `limit` best (rank, entry) pairs, best first"""
+
+    __slots__ = ('children', 'top')
+
+    def __init__(self):
+        self.children = {}
+        self.top = []
+
+    def insert(self, key, rank, entry, limit=MAX_AUTOCOMPLETE_RESULTS):
+        """Offer `entry` to every prefix of `key`; a lower `rank` is better and must be unique"""
+        node = self
+        for char in key:
+            child = node.children.get(char)
+            if child is None:
+                child = node.children[char] = PrefixTrie()
+            node = child
+            node._offer(rank, entry, limit)
+
+    def _offer(self, rank, entry, limit):
+        if len(self.top) >= limit and rank >= self.top[-1][0]:
+            return
+        for i, (existing_rank, existing) in enumerate(self.top):
+            if existing is entry:
+                # Reached again through another key of the same name; keep the better rank
+                if existing_rank <= rank:
+                    return
+                del self.top[i]
+                break
+        bisect.insort(self.top, (rank, entry))
+        del self.top[limit:]
+
+    def find(self, prefix):
+        """The best (rank, entry) pairs under `prefix`"""
+        node = self
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return []
+        return node.top
+
+
+def autocomplete_keys(normalized_name, slug=None, index_slug=False):
+    """(key, is whole-name match) pairs a normalized name is found under"""
+    words = normalized_name.split(' ')
+    keys = [(' '.join(words[i:]), i == 0) for i in range(len(words)) if words[i]]
+    if index_slug and slug:
+        keys.append((normalize_name(slug.replace('-', ' ')), False))
+    return keys
+
+
+def build_trie(entity_type, rows):
+    """PrefixTrie of (id, name, slug) rows"""
+    trie = PrefixTrie()
+    for object_id, name, slug in rows:
+        if not name:
+            continue
+        normalized_name = normalize_name(name)
+        entry = {'type': entity_type, 'id': object_id, 'name': name, 'slug': slug or None}
+        for key, whole_name in autocomplete_keys(normalized_name, slug, entity_type in SLUG_INDEXED_TYPES):
+            # The id keeps ranks unique, so entries are never compared
+            trie.insert(key, (not whole_name, len(name), normalized_name, object_id), entry)
+    return trie
+
+
+class AutocompleteIndex:
+    """Prefix tries of every autocomplete type"""
+
+    def __init__(self, tries):
+        self.tries = tries
+
+    def lookup(self, prefix, types=None, limit=DEFAULT_AUTOCOMPLETE_RESULTS):
+        """The `limit` best entries of the given types (default all) starting with `prefix`"""
+        prefix = normalize_name(prefix)
+        if not prefix:
+            return []
+        matches = []
+        for entity_type in types or self.tries:
+            matches.extend(self.tries[entity_type].find(prefix))
+        matches.sort(key=lambda match: match[0])
+        return [dict(entry) for _, entry in matches[:limit]]
+
+
+def build_autocomplete_index():
+    """Load every name and build a fresh AutocompleteIndex (one query per type)"""
+    return AutocompleteIndex({
+        entity_type: build_trie(entity_type, load_rows())
+        for entity_type, load_rows in AUTOCOMPLETE_SOURCES.items()
+    })
+
+
+_index = VersionedValue(AUTOCOMPLETE_VERSION_KEY, build_autocomplete_index, AUTOCOMPLETE_MAX_AGE)
+
+
+def bump_autocomplete_version():
+    """Mark the autocomplete names as changed so every process rebuilds on its next lookup"""
+    _index.bump()
+
+
+def get_autocomplete_index():
+    """The process-wide AutocompleteIndex, rebuilt if the content version changed"""
+    return _index.get()
@@ -0,0 +1,81 @@
+import functools
+from django.utils.cache import patch_cache_control, patch_vary_headers
+
+
+# ============================================================================
+# EDGE CACHE POLICIES
+# ============================================================================
+#
+# Vercel's edge caches a function response when its Cache-Control allows a
+# shared cache to (s-maxage) and serves it stale while it refetches in the
+# background (stale-while-revalidate), so most page views never reach Python
+# or MySQL. Every route in base/urls.py is wrapped in the CachePolicy that
+# suits it. Browsers get max-age=0 and revalidate with the ETag from
+# base/response_cache.py, which costs a 304 without database queries; the
+# edge itself cannot be invalidated, so s-maxage bounds how long an edit
+# takes to show up.
+#
+# The policy only applies to successful GET/HEAD responses. Errors, other
+# methods and responses the view already marked no-store (such as the stale
+# copies base/response_cache.py serves during a rebuild) are marked private,
+# no-store so they never end up in a shared cache.
+
+SUCCESS_STATUSES = (200, 304)
+
+
+class CachePolicy:
+    """Cache-Control and Vary headers for the responses of a view"""
+
+    def __init__(self, public=True, max_age=0, s_maxage=None, stale_while_revalidate=None,
+                 stale_if_error=None, vary=(), no_store=False):
+        if no_store and public:
+            raise ValueError("A no-store policy cannot be public")
+        self.public = public
+        self.max_age = max_age
+        self.s_maxage = s_maxage
+        self.stale_while_revalidate = stale_while_revalidate
+        self.stale_if_error = stale_if_error
+        self.vary = tuple(vary)
+        self.no_store = no_store
+
+    def directives(self):
+        """Cache-Control directives as patch_cache_control() keyword arguments"""
+        if self.no_store:
+            return {'private': True, 'no_store': True}
+        directives = {'public': True} if self.public else {'private': True}
+        directives['max_age'] = self.max_age
+        if self.public and self.s_maxage is not None:
+            directives['s_maxage'] = self.s_maxage
+        if self.stale_while_revalidate is not None:
+            directives['stale_while_revalidate'] = self.stale_while_revalidate
+        if self.stale_if_error is not None:
+            directives['stale_if_error'] = self.stale_if_error
+        return directives
+
+    def apply(self, request, response):
+        cacheable = (
+            request.method in ('GET', 'HEAD')
+            and response.status_code in SUCCESS_STATUSES
+            and 'no-store' not in response.get('Cache-Control', '')
+        )
+        directives = self.directives() if cacheable else NO_STORE.directives()
+        # Replace rather than merge, so a view can tighten its policy but never loosen it
+        if response.has_header('Cache-Control'):
+            del response['Cache-Control']
+        patch_cache_control(response, **directives)
+        if self.vary:
+            patch_vary_headers(response, self.vary)
+        return response
+
+    def __call__(self, view):
+        """Wrap a URL pattern's view so its responses carry this policy"""
+        @functools.wraps(view)
+        def wrapper(request, *args, **kwargs):
+            return self.apply(request, view(request, *args, **kwargs))
+
+        wrapper.cache_policy = self
+        return wrapper
+
+
+# Never stored by browsers or the edge: personal data and writes
+NO_STORE = CachePolicy(public=False, no_store=True)
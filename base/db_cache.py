@@ -0,0 +1,213 @@
+import pickle
+import random
+import threading
+import time
+import zlib
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+from django.db import IntegrityError, connections, router, transaction
+from django.db.models import F, Q
+from base.local_cache import MISSING, BoundedTTLCache
+from base.models.cache_model import CacheEntry
+
+
+# ============================================================================
+# SHARED DATABASE CACHE
+# ============================================================================
+#
+# Every Vercel instance has its own memory, so a local-memory cache is only
+# shared by the requests one instance happens to serve. Without Redis the
+# database is the one store all instances share. CompressedDatabaseCache
+# keeps entries in the CacheEntry table, pickled and zlib-compressed (the
+# stock DatabaseCache stores base64 text and counts the table on every set).
+# It also keeps recently used entries in a per-process LRU for
+# LOCAL_TIMEOUT seconds, so hot keys such as the response cache versions
+# skip the database round trip. The LRU is also why a change made by
+# another instance can take up to LOCAL_TIMEOUT seconds to show here;
+# get_shared() reads past the LRU where that matters.
+#
+# get_many() is one query. Expired rows are skipped on read and deleted on
+# an occasional write (CULL_PROBABILITY), which also trims the table to
+# MAX_ENTRIES. Writes made inside a transaction roll back with it.
+#
+# OPTIONS: MAX_ENTRIES, CULL_FREQUENCY (as for the stock backends),
+# LOCAL_TIMEOUT, LOCAL_MAX_ENTRIES, COMPRESS_MIN_LENGTH, CULL_PROBABILITY.
+
+PLAIN = b'p'
+COMPRESSED = b'z'
+
+# Per-process LRUs by cache LOCATION; Django creates a backend per thread
+_local_caches = {}
+_local_caches_lock = threading.Lock()
+
+
+def encode_value(value, compress_min_length):
+    """Pickled value behind a one-byte marker, zlib-compressed if long enough and smaller that way"""
+    data = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+    if len(data) >= compress_min_length:
+        compressed = zlib.compress(data)
+        if len(compressed) < len(data):
+            return COMPRESSED + compressed
+    return PLAIN + data
+
+
+def decode_value(blob):
+    blob = bytes(blob)
+    data = zlib.decompress(blob[1:]) if blob[:1] == COMPRESSED else blob[1:]
+    return pickle.loads(data)
+
+
+class CompressedDatabaseCache(BaseCache):
+    """Django cache backend on the CacheEntry table with a per-process LRU in front"""
+
+    def __init__(self, location, params):
+        super().__init__(params)
+        options = params.get('OPTIONS', {})
+        self.local_timeout = options.get('LOCAL_TIMEOUT', 5)
+        self.compress_min_length = options.get('COMPRESS_MIN_LENGTH', 256)
+        self.cull_probability = options.get('CULL_PROBABILITY', 0.01)
+        with _local_caches_lock:
+            if location not in _local_caches:
+                _local_caches[location] = BoundedTTLCache(options.get('LOCAL_MAX_ENTRIES', 1000), self.local_timeout)
+            self._local = _local_caches[location]
+
+    def _remember(self, key, blob, expires, now):
+        timeout = self.local_timeout if expires is None else min(self.local_timeout, expires - now)
+        if timeout > 0:
+            self._local.set(key, blob, timeout)
+
+    def _select(self, keys):
+        """(key, value, expires) rows of the given keys; raw SQL, as the ORM would triple the cost of a read"""
+        connection = connections[router.db_for_read(CacheEntry)]
+        quote_name = connection.ops.quote_name
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT {quote_name('key')}, {quote_name('value')}, {quote_name('expires')} "
+                f"FROM {quote_name(CacheEntry._meta.db_table)} "
+                f"WHERE {quote_name('key')} IN ({', '.join(['%s'] * len(keys))})",
+                keys
+            )
+            return cursor.fetchall()
+
+    def _get_many(self, keys):
+        """{made key: value} of the live keys, reading the database only for keys not held locally"""
+        now = time.time()
+        blobs, missing = {}, []
+        for key in keys:
+            blob = self._local.get(key)
+            if blob is MISSING:
+                missing.append(key)
+            else:
+                blobs[key] = blob
+        if missing:
+            for key, blob, expires in self._select(missing):
+                if expires is not None and expires <= now:
+                    # Deleted by the next cull
+                    continue
+                blobs[key] = bytes(blob)
+                self._remember(key, blobs[key], expires, now)
+        return {key: decode_value(blob) for key, blob in blobs.items()}
+
+    def get(self, key, default=None, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        return self._get_many([key]).get(key, default)
+
+    def get_many(self, keys, version=None):
+        made_keys = {self.make_and_validate_key(key, version=version): key for key in keys}
+        return {made_keys[key]: value for key, value in self._get_many(list(made_keys)).items()}
+
+    def get_shared(self, key, default=None, version=None):
+        """Like get(), but always read from the database; for keys other processes change, such as locks"""
+        key = self.make_and_validate_key(key, version=version)
+        for _, blob, expires in self._select([key]):
+            if expires is None or expires > time.time():
+                return decode_value(blob)
+        return default
+
+    def has_key(self, key, version=None):
+        return self.get(key, MISSING, version=version) is not MISSING
+
+    def _set_many(self, data, timeout):
+        if not data:
+            return
+        now = time.time()
+        expires = self.get_backend_timeout(timeout)
+        entries = [
+            CacheEntry(key=key, value=encode_value(value, self.compress_min_length), expires=expires)
+            for key, value in data.items()
+        ]
+        # MySQL upserts on any unique key and does not accept a conflict target
+        supports_target = connections[CacheEntry.objects.db].features.supports_update_conflicts_with_target
+        CacheEntry.objects.bulk_create(
+            entries,
+            update_conflicts=True,
+            unique_fields=['key'] if supports_target else None,
+            update_fields=['value', 'expires']
+        )
+        for entry in entries:
+            self._remember(entry.key, entry.value, expires, now)
+        if random.random() < self.cull_probability:
+            self.cull()
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        self._set_many({self.make_and_validate_key(key, version=version): value}, timeout)
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None):
+        self._set_many(
+            {self.make_and_validate_key(key, version=version): value for key, value in data.items()}, timeout
+        )
+        return []
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        """Store only if the key is absent or expired; decided by the database, never the LRU"""
+        key = self.make_and_validate_key(key, version=version)
+        now = time.time()
+        expires = self.get_backend_timeout(timeout)
+        blob = encode_value(value, self.compress_min_length)
+        try:
+            with transaction.atomic(using=CacheEntry.objects.db):
+                CacheEntry.objects.create(key=key, value=blob, expires=expires)
+        except IntegrityError:
+            # Take over the row only if it has expired
+            if not CacheEntry.objects.filter(key=key, expires__lte=now).update(value=blob, expires=expires):
+                return False
+        self._remember(key, blob, expires, now)
+        return True
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        self._local.delete(key)
+        live = Q(expires__isnull=True) | Q(expires__gt=time.time())
+        return bool(CacheEntry.objects.filter(live, key=key).update(expires=self.get_backend_timeout(timeout)))
+
+    def delete(self, key, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        self._local.delete(key)
+        deleted, _ = CacheEntry.objects.filter(key=key).delete()
+        return bool(deleted)
+
+    def delete_many(self, keys, version=None):
+        keys = [self.make_and_validate_key(key, version=version) for key in keys]
+        for key in keys:
+            self._local.delete(key)
+        CacheEntry.objects.filter(key__in=keys).delete()
+
+    def clear(self):
+        """Delete every entry; other processes drop their local copies within LOCAL_TIMEOUT"""
+        self._local.clear()
+        CacheEntry.objects.all().delete()
+
+    def clear_local(self):
+        """Drop this process's copies; the shared entries stay"""
+        self._local.clear()
+
+    def cull(self):
+        """Delete expired entries, then the soonest-expiring ones while over MAX_ENTRIES"""
+        CacheEntry.objects.filter(expires__lte=time.time()).delete()
+        excess = CacheEntry.objects.count() - self._max_entries
+        if excess > 0:
+            # Like the stock backends, cull a further 1/CULL_FREQUENCY of the limit to leave room
+            excess += self._max_entries // max(self._cull_frequency, 1)
+            keys = list(
+                CacheEntry.objects.order_by(F('expires').asc(nulls_last=True)).values_list('key', flat=True)[:excess]
+            )
+            CacheEntry.objects.filter(key__in=keys).delete()
@@ -0,0 +1,58 @@
+import copy
+from django.http import Http404
+from base.local_cache import BoundedTTLCache, MISSING
+from base.models.department_model import Department
+from base.response_cache import model_versions
+
+
+# ============================================================================
+# DEPARTMENT ID / SLUG RESOLUTION
+# ============================================================================
+#
+# Department endpoints accept either a numeric ID or a slug. Resolved rows
+# are kept in process memory under both keys, and unknown identifiers are
+# remembered as misses so repeated probes for bad slugs never reach the
+# database. Entries are tagged with the Department content version from
+# base/response_cache.py, which the signal handlers in base/signals.py bump
+# on every save or delete, so a change made by any process retires them
+# everywhere; the same handlers also clear this process's map at once.
+
+_departments = BoundedTTLCache(max_entries=512, timeout=300)
+
+
+def find_department(department_id):
+    """Get a Department by ID or slug, or None if there is no such department"""
+    key = str(department_id)
+    version = model_versions((Department,))[0]
+    entry = _departments.get(key)
+    department = entry[1] if entry is not MISSING and entry[0] == version else MISSING
+    if department is MISSING:
+        try:
+            # Try to parse as integer first
+            lookup = {'id': int(key)}
+        except ValueError:
+            # If not an integer, treat as slug
+            lookup = {'slug': key}
+        department = Department.objects.filter(**lookup).first()
+
+        _departments.set(key, (version, department))
+        if department is not None:
+            _departments.set(str(department.id), (version, department))
+            if department.slug:
+                _departments.set(department.slug, (version, department))
+
+    # Hand out copies so callers never mutate the shared instance
+    return copy.copy(department) if department is not None else None
+
+
+def resolve_department(department_id):
+    """Get a Department by ID or slug, raising Http404 if there is no such department"""
+    department = find_department(department_id)
+    if department is None:
+        raise Http404("Department not found")
+    return department
+
+
+def clear_department_lookups():
+    """Forget every resolved department (called when any department changes)"""
+    _departments.clear()
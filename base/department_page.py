@@ -0,0 +1,402 @@
+from django.db.models import Prefetch, Q
+from django.http import Http404
+from base.department_lookup import resolve_department
+from base.models.course_model import Course
+from base.models.department_model import (
+    Department, AboutDepartment, NumberData, QuickLink, ProgramOffered, Curriculum,
+    Benefit, DepartmentContact, CTA, Facility, Banner, DepartmentStatistics, DepartmentSnapshot
+)
+
+
+# ============================================================================
+# DEPARTMENT PAGE ASSEMBLY
+# ============================================================================
+#
+# The department detail page is built from the department row plus ten
+# related tables. Every relation is loaded with a single prefetch query, so
+# the page costs the same number of queries however many sections it has.
+
+# Optional parts of the detail payload, selectable with ?include= / ?exclude=.
+# The scalar department fields (id, name, slug, ug, pg, phd, programs image)
+# are always returned.
+DEPARTMENT_PAGE_SECTIONS = (
+    'vision', 'mission', 'facilities_overview',
+    'about_sections', 'quick_links', 'programs', 'curriculum', 'benefits',
+    'contacts', 'ctas', 'facilities', 'banners', 'statistics',
+)
+
+# Rich text columns on Department that are only loaded when requested
+DEPARTMENT_TEXT_SECTIONS = ('vision', 'mission', 'facilities_overview')
+
+# Every table a detail payload is read from, snapshot included (see base/response_cache.py)
+DEPARTMENT_PAGE_MODELS = (
+    Department, DepartmentSnapshot, AboutDepartment, NumberData, QuickLink, ProgramOffered,
+    Course, Curriculum, Benefit, DepartmentContact, CTA, Facility, Banner, DepartmentStatistics
+)
+
+
+def parse_department_sections(include=None, exclude=None):
+    """Turn comma separated include/exclude parameters into a set of section names (None = all).
+
+    Raises ValueError naming any unknown section.
+    """
+    if not include and not exclude:
+        return None
+
+    include = [name.strip() for name in (include or '').split(',') if name.strip()]
+    exclude = [name.strip() for name in (exclude or '').split(',') if name.strip()]
+    unknown = [name for name in include + exclude if name not in DEPARTMENT_PAGE_SECTIONS]
+    if unknown:
+        raise ValueError(
+            f"Unknown section(s): {', '.join(unknown)}. "
+            f"Valid sections are: {', '.join(DEPARTMENT_PAGE_SECTIONS)}"
+        )
+
+    sections = set(include) if include else set(DEPARTMENT_PAGE_SECTIONS)
+    return sections - set(exclude)
+
+
+def department_page_queryset(sections=None):
+    """Department queryset with the detail page sections prefetched (all sections by default)"""
+    wanted = DEPARTMENT_PAGE_SECTIONS if sections is None else sections
+    relations = {
+        'about_sections': Prefetch(
+            'about_sections',
+            queryset=AboutDepartment.objects.prefetch_related('numbers')
+        ),
+        'quick_links': 'quick_links',
+        'programs': Prefetch(
+            'programs',
+            queryset=ProgramOffered.objects.select_related('course').only(
+                'department', 'course', 'display_order', 'description',
+                'explore_link', 'apply_link', 'course__name', 'course__slug'
+            )
+        ),
+        'curriculum': 'curriculum',
+        'contacts': 'contacts',
+        'ctas': 'ctas',
+        'facilities': 'facilities',
+        'banners': 'banners',
+        'statistics': 'statistics',
+    }
+
+    queryset = Department.objects.prefetch_related(
+        *[lookup for name, lookup in relations.items() if name in wanted]
+    )
+    skipped_text = [name for name in DEPARTMENT_TEXT_SECTIONS if name not in wanted]
+    if skipped_text:
+        queryset = queryset.defer(*skipped_text)
+    return queryset
+
+
+def file_to_dto(field_file, file_names=False):
+    """URL of a file field, or its storage name with `file_names`; None when empty"""
+    if not field_file:
+        return None
+    return field_file.name if file_names else field_file.url
+
+
+def about_section_to_dto(section, file_names=False):
+    """Convert AboutDepartment (with its numbers) to DTO"""
+    return {
+        'heading': section.heading,
+        'content': section.content,
+        'image': file_to_dto(section.image, file_names),
+        'alt': section.alt,
+        'numbers': [
+            {
+                'number': num.number,
+                'symbol': num.symbol,
+                'text': num.text,
+                'featured': num.featured,
+                'unique_id': num.unique_id
+            } for num in section.numbers.all()
+        ]
+    }
+
+
+def program_to_dto(prog):
+    """Convert ProgramOffered to DTO"""
+    return {
+        'id': prog.id,
+        'course': {
+            'id': prog.course.id,
+            'name': prog.course.name,
+            'slug': prog.course.slug
+        } if prog.course else None,
+        'display_order': prog.display_order,
+        'description': prog.description,
+        'explore_link': prog.explore_link,
+        'apply_link': prog.apply_link
+    }
+
+
+def curriculum_to_dto(curr, file_names=False):
+    """Convert department Curriculum to DTO"""
+    return {
+        'id': curr.id,
+        'title': curr.title,
+        'description': curr.description,
+        'file': file_to_dto(curr.file, file_names)
+    }
+
+
+def contact_to_dto(contact, file_names=False):
+    """Convert DepartmentContact to DTO"""
+    return {
+        'name': contact.name,
+        'position': contact.position,
+        'email': contact.email,
+        'phone': contact.phone,
+        'image': file_to_dto(contact.image, file_names),
+        'alt': contact.alt,
+        'heading': contact.heading
+    }
+
+
+def facility_to_dto(fac, file_names=False):
+    """Convert Facility to DTO"""
+    return {
+        'id': fac.id,
+        'heading': fac.heading,
+        'description': fac.description,
+        'image': file_to_dto(fac.image, file_names),
+        'alt': fac.alt
+    }
+
+
+def statistic_to_dto(stat):
+    """Convert DepartmentStatistics to DTO"""
+    return {
+        'id': stat.id,
+        'name': stat.name,
+        'number': stat.number,
+        'suffix': stat.suffix,
+        'featured': stat.featured,
+        'display_order': stat.display_order,
+        'display_value': f"{stat.number}{stat.suffix}" if stat.suffix else str(stat.number)
+    }
+
+
+def featured_statistic_to_dto(stat):
+    """Convert a DepartmentStatistics row (with its department selected) to DTO"""
+    data = statistic_to_dto(stat)
+    data['department'] = {
+        'id': stat.department.id,
+        'name': stat.department.name,
+        'slug': stat.department.slug
+    }
+    return data
+
+
+def department_page_to_dto(department, sections=None, file_names=False):
+    """Convert a department loaded through department_page_queryset() to the detail page DTO.
+
+    Only the requested sections are serialized; pass the same `sections` used
+    to build the queryset. `file_names` gives storage names instead of URLs
+    (see resolve_department_files).
+    """
+    def wanted(name):
+        return sections is None or name in sections
+
+    data = {
+        'id': department.id,
+        'name': department.name,
+        'slug': department.slug,
+        'ug': department.ug,
+        'pg': department.pg,
+        'phd': department.phd,
+    }
+    if wanted('vision'):
+        data['vision'] = department.vision
+    if wanted('mission'):
+        data['mission'] = department.mission
+    data['programs_image'] = file_to_dto(department.programs_image, file_names)
+    data['programs_image_alt'] = department.programs_image_alt
+    if wanted('facilities_overview'):
+        data['facilities_overview'] = department.facilities_overview
+
+    list_sections = {
+        'about_sections': lambda: [about_section_to_dto(section, file_names) for section in department.about_sections.all()],
+        'quick_links': lambda: [
+            {'name': link.name, 'link': link.link}
+            for link in department.quick_links.all()
+        ],
+        'programs': lambda: [program_to_dto(prog) for prog in department.programs.all()],
+        'curriculum': lambda: [curriculum_to_dto(curr, file_names) for curr in department.curriculum.all()],
+        # Benefit model removed from the department page - always empty
+        'benefits': lambda: [],
+        'contacts': lambda: [contact_to_dto(contact, file_names) for contact in department.contacts.all()],
+        'ctas': lambda: [
+            {'heading': cta.heading, 'link': cta.link}
+            for cta in department.ctas.all()
+        ],
+        'facilities': lambda: [facility_to_dto(fac, file_names) for fac in department.facilities.all()],
+        'banners': lambda: [
+            {
+                'image': file_to_dto(banner.image, file_names),
+                'alt': banner.alt
+            }
+            for banner in department.banners.all()
+        ],
+        'statistics': lambda: [statistic_to_dto(stat) for stat in department.statistics.all()],
+    }
+    for name, build in list_sections.items():
+        if wanted(name):
+            data[name] = build()
+    return data
+
+
+def select_department_sections(payload, sections):
+    """Trim a full detail payload down to the requested sections"""
+    if sections is None:
+        return payload
+    return {
+        key: value for key, value in payload.items()
+        if key not in DEPARTMENT_PAGE_SECTIONS or key in sections
+    }
+
+
+# ============================================================================
+# DEPARTMENT PAGE SNAPSHOTS
+# ============================================================================
+#
+# The assembled payload is persisted in DepartmentSnapshot so the detail
+# endpoint can be answered with one primary-key read (slugs are resolved to
+# IDs in memory by base/department_lookup.py). Snapshots are rebuilt
+# by the signal handlers in base/signals.py and filled lazily on a miss.
+# S3 URLs are signed and expire, so snapshots keep the storage name of each
+# file and resolve_department_files() turns them into URLs on every read.
+
+# File fields of the payload: (list section, or None for the department itself, key, model)
+DEPARTMENT_PAGE_FILES = (
+    (None, 'programs_image', Department),
+    ('about_sections', 'image', AboutDepartment),
+    ('curriculum', 'file', Curriculum),
+    ('contacts', 'image', DepartmentContact),
+    ('facilities', 'image', Facility),
+    ('banners', 'image', Banner),
+)
+
+
+def resolve_department_files(payload):
+    """Copy of a payload built with file_names=True, with storage names turned into URLs"""
+    payload = dict(payload)
+    for section, key, model in DEPARTMENT_PAGE_FILES:
+        storage = model._meta.get_field(key).storage
+        if section is None:
+            if payload.get(key):
+                payload[key] = storage.url(payload[key])
+        elif section in payload:
+            payload[section] = [
+                {**item, key: storage.url(item[key])} if item[key] else item
+                for item in payload[section]
+            ]
+    return payload
+
+
+def store_department_snapshot(department):
+    """Serialize a department loaded through department_page_queryset() and persist its snapshot.
+
+    Returns the stored payload, with storage names in its file fields.
+    """
+    payload = department_page_to_dto(department, file_names=True)
+    DepartmentSnapshot.objects.update_or_create(
+        department_id=department.id,
+        defaults={'slug': department.slug, 'payload': payload}
+    )
+    return payload
+
+
+def store_department_snapshots(departments):
+    """Serialize several prefetched departments and insert their missing snapshots in one query"""
+    payloads = {department.id: department_page_to_dto(department, file_names=True) for department in departments}
+    DepartmentSnapshot.objects.bulk_create(
+        [
+            DepartmentSnapshot(department_id=department.id, slug=department.slug, payload=payloads[department.id])
+            for department in departments
+        ],
+        ignore_conflicts=True
+    )
+    return payloads
+
+
+def rebuild_department_snapshot(department_id):
+    """Re-assemble the snapshot of one department, dropping it if the department is gone"""
+    department = department_page_queryset().filter(id=department_id).first()
+    if department is None:
+        DepartmentSnapshot.objects.filter(department_id=department_id).delete()
+        return None
+    return store_department_snapshot(department)
+
+
+def get_department_page(department_id, sections=None):
+    """Get the detail page payload for a department ID or slug, raising Http404 if unknown.
+
+    `sections` limits the payload to the named sections (see
+    parse_department_sections); None returns the full page.
+    """
+    department = resolve_department(department_id)
+
+    payload = DepartmentSnapshot.objects.filter(
+        department_id=department.id
+    ).values_list('payload', flat=True).first()
+    if payload is not None:
+        return resolve_department_files(select_department_sections(payload, sections))
+
+    department = department_page_queryset(sections).filter(id=department.id).first()
+    if department is None:
+        raise Http404("Department not found")
+    if sections is not None:
+        # Partial pages are not stored; only load what was asked for
+        return department_page_to_dto(department, sections)
+    # No snapshot yet - assemble it now and keep it for the next request
+    return resolve_department_files(store_department_snapshot(department))
+
+
+def get_department_pages(ids=(), slugs=(), sections=None):
+    """Get detail page payloads for several departments with set-based queries.
+
+    Returns (payloads, not_found): payloads in the order requested (IDs first,
+    then slugs, duplicates removed) and the identifiers that matched nothing.
+    The query count does not depend on how many departments are requested.
+    """
+    ids, slugs = list(dict.fromkeys(ids)), list(dict.fromkeys(slugs))
+    if not ids and not slugs:
+        return [], []
+
+    by_id = {}
+    snapshots = DepartmentSnapshot.objects.filter(
+        Q(department_id__in=ids) | Q(slug__in=slugs)
+    ).values_list('department_id', 'payload')
+    for department_id, payload in snapshots:
+        by_id[department_id] = select_department_sections(payload, sections)
+
+    found_slugs = {payload['slug'] for payload in by_id.values()}
+    missing_ids = [dept_id for dept_id in ids if dept_id not in by_id]
+    missing_slugs = [slug for slug in slugs if slug not in found_slugs]
+    if missing_ids or missing_slugs:
+        departments = list(department_page_queryset(sections).filter(
+            Q(id__in=missing_ids) | Q(slug__in=missing_slugs)
+        ))
+        if sections is None:
+            # Full pages double as snapshots for the next request
+            by_id.update(store_department_snapshots(departments))
+        else:
+            by_id.update({
+                department.id: department_page_to_dto(department, sections, file_names=True)
+                for department in departments
+            })
+
+    by_slug = {payload['slug']: payload for payload in by_id.values() if payload['slug']}
+    requested = [(dept_id, by_id.get(dept_id)) for dept_id in ids]
+    requested += [(slug, by_slug.get(slug)) for slug in slugs]
+
+    payloads, not_found, seen = [], [], set()
+    for identifier, payload in requested:
+        if payload is None:
+            not_found.append(identifier)
+        elif payload['id'] not in seen:
+            seen.add(payload['id'])
+            payloads.append(resolve_department_files(payload))
+    return payloads, not_found
@@ -0,0 +1,250 @@
+import csv
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from django.core.files import File
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from base.models.department_model import Department
+from base.models.faculty_model import Faculty, Designation, UNRANKED, designation_standing
+from base.signals import faculty_bulk_written
+from base.utils import next_free_slug, normalize_name, slug_base
+
+
+# ============================================================================
+# BULK FACULTY IMPORT
+# ============================================================================
+#
+# A new semester's faculty arrive as a spreadsheet of hundreds of rows. Saving
+# them one by one runs generate_seo_data() with its designation and department
+# lookups, a slug query and an image upload per row. The import instead
+# resolves every department, designation, existing faculty row and taken slug
+# with one query each, generates slugs and SEO fields in memory, uploads the
+# images on a thread pool and writes with bulk_create/bulk_update. Rows are
+# matched to existing faculty by (name, department), the model's unique key.
+# New designations are only saved in the write transaction, a row whose image
+# fails to upload is reported like an invalid one, and the uploads are
+# deleted again if the write fails.
+
+# Columns copied onto Faculty as given
+TEXT_COLUMNS = (
+    'name', 'qualification', 'mail_id', 'phone_number', 'link', 'alt',
+    'bio', 'publication', 'awards', 'workshop', 'work_experience', 'projects',
+)
+# `department` is an ID, slug or name; `designation` a name (created if new);
+# `image` a file path relative to the import file
+IMPORT_COLUMNS = TEXT_COLUMNS + ('department', 'designation', 'image', 'slug')
+
+DEFAULT_BATCH_SIZE = 200
+DEFAULT_UPLOAD_WORKERS = 8
+
+
+def read_faculty_rows(path):
+    """[(line number, {column: value})] from a .csv or .jsonl file. Raises ValueError"""
+    extension = os.path.splitext(path)[1].lower()
+    with open(path, encoding='utf-8-sig', newline='') as import_file:
+        if extension == '.csv':
+            # Line 1 is the header
+            rows = [(number, row) for number, row in enumerate(csv.DictReader(import_file), start=2)]
+        elif extension == '.jsonl':
+            rows = []
+            for number, line in enumerate(import_file, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    row = json.loads(line)
+                except json.JSONDecodeError as e:
+                    raise ValueError(f"Line {number}: invalid JSON ({e})")
+                if not isinstance(row, dict):
+                    raise ValueError(f"Line {number}: expected a JSON object")
+                rows.append((number, row))
+        else:
+            raise ValueError("Import file must be .csv or .jsonl")
+
+    unknown = sorted({column for _, row in rows for column in row if column not in IMPORT_COLUMNS})
+    if unknown:
+        raise ValueError(f"Unknown columns: {', '.join(unknown)}. Valid columns are: {', '.join(IMPORT_COLUMNS)}")
+    return [
+        (number, {column: str(value).strip() for column, value in row.items() if value not in (None, '')})
+        for number, row in rows
+    ]
+
+
+def _departments_by_key(keys):
+    """{ID, slug or normalized name: Department} for the given department keys (one query)"""
+    ids = [int(key) for key in keys if key.isdigit()]
+    departments = Department.objects.filter(Q(id__in=ids) | Q(slug__in=keys) | Q(name__in=keys))
+    by_key = {}
+    for department in departments:
+        by_key[str(department.id)] = department
+        if department.slug:
+            by_key[department.slug] = department
+        by_key[normalize_name(department.name)] = department
+    return by_key
+
+
+def _designations_by_name(names):
+    """{normalized name: Designation}, with unsaved instances for designations that do not exist yet"""
+    by_name = {
+        normalize_name(designation.name): designation
+        for designation in Designation.objects.filter(name__in=names)
+    }
+    for name in names:
+        if normalize_name(name) not in by_name:
+            designation = Designation(name=name)
+            designation.is_hod, designation.rank = designation_standing(name)
+            by_name[normalize_name(name)] = designation
+    return by_name
+
+
+def _upload_image(faculty, path):
+    """None once the image is stored, else the reason the upload failed"""
+    try:
+        with open(path, 'rb') as image_file:
+            faculty.image.save(os.path.basename(path), File(image_file), save=False)
+    except Exception as e:
+        # Storage backends raise their own error types (botocore for S3)
+        return str(e) or e.__class__.__name__
+    return None
+
+
+def import_faculty(rows, base_dir='.', batch_size=DEFAULT_BATCH_SIZE, workers=DEFAULT_UPLOAD_WORKERS, dry_run=False):
+    """Create or update Faculty from read_faculty_rows() output.
+
+    Invalid rows are skipped and reported in 'errors' as (line, message);
+    the valid rows are written in one transaction. Returns counts, errors
+    and the seconds spent in each phase under 'timings'.
+    """
+    timings = {}
+    errors = []
+    started = time.perf_counter()
+
+    departments = _departments_by_key({row['department'] for _, row in rows if 'department' in row})
+    designations = _designations_by_name(sorted({row['designation'] for _, row in rows if 'designation' in row}))
+    existing = {
+        (faculty.name_normalized, faculty.department_id): faculty
+        for faculty in Faculty.objects.filter(
+            name_normalized__in={normalize_name(row.get('name')) for _, row in rows}
+        ).select_related('designation', 'department')
+    }
+    taken_slugs = set(Faculty.objects.exclude(slug__isnull=True).values_list('slug', flat=True))
+    timings['resolve'] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    to_create, to_update, images, seen, new_designations = [], [], [], set(), {}
+    for number, row in rows:
+        if not row.get('name'):
+            errors.append((number, "name is required"))
+            continue
+        department = None
+        if 'department' in row:
+            key = row['department']
+            department = departments.get(key) or departments.get(normalize_name(key))
+            if department is None:
+                errors.append((number, f"Unknown department '{key}'"))
+                continue
+        key = (normalize_name(row['name']), department.id if department else None)
+        if key in seen:
+            errors.append((number, f"Duplicate of an earlier row for '{row['name']}'"))
+            continue
+        seen.add(key)
+        faculty = existing.get(key)
+        if 'slug' in row:
+            if row['slug'] in taken_slugs and (faculty is None or faculty.slug != row['slug']):
+                errors.append((number, f"Slug '{row['slug']}' is already taken"))
+                continue
+            taken_slugs.add(row['slug'])
+        if 'image' in row:
+            image_path = os.path.join(base_dir, row['image'])
+            if not os.path.isfile(image_path):
+                errors.append((number, f"Image not found: {row['image']}"))
+                continue
+
+        if faculty is None:
+            faculty = Faculty(department=department)
+            to_create.append(faculty)
+        else:
+            to_update.append(faculty)
+        for column in TEXT_COLUMNS:
+            if column in row:
+                setattr(faculty, column, row[column])
+        if 'designation' in row:
+            faculty.designation = designations[normalize_name(row['designation'])]
+            if faculty.designation.pk is None:
+                new_designations[normalize_name(row['designation'])] = faculty.designation
+        if 'slug' in row:
+            faculty.slug = row['slug']
+        if 'image' in row:
+            images.append((number, faculty, image_path))
+    timings['validate'] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    uploaded = []
+    if images and not dry_run:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            failures = list(pool.map(lambda upload: _upload_image(*upload[1:]), images))
+        failed = set()
+        for (number, faculty, _), failure in zip(images, failures):
+            if failure is None:
+                uploaded.append(faculty)
+            else:
+                errors.append((number, f"Image upload failed: {failure}"))
+                failed.add(id(faculty))
+        if failed:
+            to_create = [faculty for faculty in to_create if id(faculty) not in failed]
+            to_update = [faculty for faculty in to_update if id(faculty) not in failed]
+            images = [upload for upload in images if id(upload[1]) not in failed]
+    timings['images'] = time.perf_counter() - started
+
+    # The in-memory equivalent of Faculty.save() and SEOMixin.save()
+    started = time.perf_counter()
+    now = timezone.now()
+    for faculty in to_create + to_update:
+        faculty.name_normalized = normalize_name(faculty.name)
+        if faculty.designation:
+            faculty.is_hod, faculty.designation_rank = faculty.designation.is_hod, faculty.designation.rank
+        else:
+            faculty.is_hod, faculty.designation_rank = False, UNRANKED
+        if not faculty.slug:
+            faculty.slug = next_free_slug(slug_base(Faculty, faculty.name), taken_slugs) or None
+        taken_slugs.add(faculty.slug)
+        faculty.generate_seo_data()
+        faculty.updated_at = faculty.updated_date = now
+    timings['seo'] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    if not dry_run and (to_create or to_update):
+        update_fields = [
+            field.name for field in Faculty._meta.concrete_fields
+            if not field.primary_key and field.name != 'created_at'
+        ]
+        used = {id(faculty.designation) for faculty in to_create + to_update}
+        try:
+            with transaction.atomic():
+                for designation in new_designations.values():
+                    if id(designation) in used:
+                        # New designations are rare; save() derives their rank
+                        designation.save()
+                Faculty.objects.bulk_create(to_create, batch_size=batch_size)
+                Faculty.objects.bulk_update(to_update, update_fields, batch_size=batch_size)
+                # bulk_create does not return primary keys on MySQL, so read them back
+                created_ids = Faculty.objects.filter(
+                    slug__in=[faculty.slug for faculty in to_create if faculty.slug]
+                ).values_list('id', flat=True)
+                faculty_bulk_written([*created_ids, *(faculty.id for faculty in to_update)])
+        except Exception:
+            # No row refers to the new uploads
+            for faculty in uploaded:
+                faculty.image.delete(save=False)
+            raise
+    timings['write'] = time.perf_counter() - started
+
+    return {
+        'created': len(to_create),
+        'updated': len(to_update),
+        'images': len(images),
+        'errors': errors,
+        'timings': timings,
+    }
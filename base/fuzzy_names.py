@@ -0,0 +1,125 @@
+import re
+from collections import Counter, defaultdict
+from base.local_cache import VersionedValue
+from base.models.faculty_model import Faculty
+from base.utils import normalize_name
+
+
+# ============================================================================
+# TYPO-TOLERANT NAME SEARCH
+# ============================================================================
+#
+# Names typed by visitors often differ from the stored spelling in
+# transliteration (Lakshmi / Laxmi, Karthik / Karthick, Mohammed / Muhammad)
+# or by a typo. Names and queries are folded to a common spelling, then
+# compared by trigram overlap against an in-process index of every faculty
+# name. The index is rebuilt lazily when the Faculty signal handlers in
+# base/signals.py bump FACULTY_NAMES_VERSION_KEY.
+
+FACULTY_NAMES_VERSION_KEY = 'base:faculty_names_version'
+
+# Spelling variants folded together, applied in order; doubled letters are collapsed afterwards
+TRANSLITERATION_RULES = (
+    ('ksh', 'x'), ('ks', 'x'),
+    ('aa', 'a'), ('ee', 'i'), ('ii', 'i'), ('oo', 'u'), ('uu', 'u'), ('ou', 'u'),
+    ('th', 't'), ('dh', 'd'), ('bh', 'b'), ('ph', 'f'), ('kh', 'k'), ('gh', 'g'),
+    ('jh', 'j'), ('sh', 's'), ('ck', 'k'), ('ch', 'c'),
+    ('q', 'k'), ('w', 'v'), ('z', 'j'), ('y', 'i'),
+)
+
+# Share of the query's trigrams a name must contain to be a candidate
+MIN_QUERY_COVERAGE = 0.5
+
+DEFAULT_FUZZY_RESULTS = 10
+MAX_FUZZY_RESULTS = 50
+
+
+def fold_spelling(name):
+    """Name folded to a common transliteration: normalized, variant spellings merged"""
+    name = normalize_name(name)
+    for variant, replacement in TRANSLITERATION_RULES:
+        name = name.replace(variant, replacement)
+    return re.sub(r'(.)\1+', r'\1', name)
+
+
+def _word_trigrams(word, pad):
+    padded = f'{pad}{pad}{word}{pad}'
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def name_trigrams(name):
+    """Set of trigrams of a name's words, each padded like PostgreSQL's pg_trgm.
+
+    Each word's consonant skeleton contributes its own trigrams (padded with
+    '#' so they never collide with the word's), which keeps names whose
+    vowels were transliterated differently (Mohammed / Muhammad) close.
+    """
+    trigrams = set()
+    for word in re.findall(r'\w+', fold_spelling(name)):
+        trigrams |= _word_trigrams(word, ' ')
+        skeleton = re.sub(r'(?<=.)[aeiou]', '', word)
+        if len(skeleton) > 1:
+            trigrams |= _word_trigrams(skeleton, '#')
+    return trigrams
+
+
+class FuzzyNameIndex:
+    """Trigram index of (id, name) rows answering typo-tolerant name queries"""
+
+    def __init__(self, rows):
+        self.sizes = {}
+        self.names = {}
+        self.postings = defaultdict(list)
+        for object_id, name in rows:
+            trigrams = name_trigrams(name)
+            if not trigrams:
+                continue
+            self.sizes[object_id] = len(trigrams)
+            self.names[object_id] = name
+            for trigram in trigrams:
+                self.postings[trigram].append(object_id)
+
+    def search(self, query, limit=DEFAULT_FUZZY_RESULTS):
+        """[(id, score)] of the best matching names, best first; scores run from 0 to 1.
+
+        The score averages how much of the query the name contains with the
+        overall similarity of the two, so closer lengths win among names that
+        contain the query equally well.
+        """
+        query_trigrams = name_trigrams(query)
+        if not query_trigrams:
+            return []
+
+        shared = Counter()
+        for trigram in query_trigrams:
+            shared.update(self.postings.get(trigram, ()))
+
+        query_size = len(query_trigrams)
+        matches = []
+        for object_id, count in shared.items():
+            coverage = count / query_size
+            if coverage < MIN_QUERY_COVERAGE:
+                continue
+            similarity = count / (query_size + self.sizes[object_id] - count)
+            matches.append(((coverage + similarity) / 2, object_id))
+
+        matches.sort(key=lambda match: (-match[0], self.names[match[1]], match[1]))
+        return [(object_id, round(score, 3)) for score, object_id in matches[:limit]]
+
+
+def build_faculty_name_index():
+    """FuzzyNameIndex of every faculty name (one query)"""
+    return FuzzyNameIndex(Faculty.objects.values_list('id', 'name'))
+
+
+_faculty_names = VersionedValue(FACULTY_NAMES_VERSION_KEY, build_faculty_name_index)
+
+
+def bump_faculty_names_version():
+    """Mark faculty names as changed so every process rebuilds its index on the next search"""
+    _faculty_names.bump()
+
+
+def search_faculty_names(query, limit=DEFAULT_FUZZY_RESULTS):
+    """[(faculty id, score)] of the faculty names closest to `query`, best first"""
+    return _faculty_names.get().search(query, limit)
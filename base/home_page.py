@@ -0,0 +1,113 @@
+import time
+from django.core.cache import cache
+from base.department_page import featured_statistic_to_dto
+from base.models.carrer_model import Company
+from base.models.course_model import NumberDataATD
+from base.models.department_model import DepartmentStatistics
+from base.models.news_events_models import NewsEvents
+from base.models.placement_name_model import PlacementName, ResearchName
+from base.views.company_views import company_to_dto
+from base.views.course_view import number_data_to_dto
+from base.views.news_events_views import active_images_prefetch, image_to_dto
+from base.views.placement_name_views import placement_name_to_dto, research_name_to_dto
+
+
+# ============================================================================
+# HOMEPAGE ASSEMBLY
+# ============================================================================
+#
+# The homepage used to call six endpoints. Each section below is loaded with
+# a fixed number of queries, and the assembled payload is cached as one unit
+# under HOME_PAGE_CACHE_KEY. The signal handlers in base/signals.py drop the
+# cached copy whenever any of the source tables change.
+
+HOME_PAGE_CACHE_KEY = 'base:home_page'
+HOME_PAGE_CACHE_TIMEOUT = 60 * 10
+
+# Number of featured news/event cards shown on the homepage
+HOME_NEWS_LIMIT = 6
+
+
+def news_card_to_dto(news_event):
+    """Convert NewsEvents loaded by home_news_queryset() to a homepage card DTO"""
+    primary_image = news_event.get_primary_image()
+    return {
+        'id': news_event.id,
+        'heading': news_event.heading,
+        'slug': news_event.slug,
+        'date': news_event.date.isoformat() if news_event.date else None,
+        'link': news_event.link,
+        'category': news_event.get_category_display(),
+        'category_value': news_event.category,
+        'department': {
+            'id': news_event.department.id,
+            'name': news_event.department.name,
+            'slug': news_event.department.slug
+        } if news_event.department else None,
+        'is_featured': news_event.is_featured,
+        'primary_image': image_to_dto(primary_image) if primary_image else None,
+    }
+
+
+def home_news_queryset():
+    """Published, featured news with department and active images loaded up front"""
+    return NewsEvents.objects.filter(
+        is_published=True, is_featured=True
+    ).select_related('department').only(
+        'heading', 'slug', 'date', 'link', 'category', 'is_featured', 'department',
+        'department__id', 'department__name', 'department__slug'
+    ).prefetch_related(active_images_prefetch())[:HOME_NEWS_LIMIT]
+
+
+# Each section is (name, builder); builders must run a fixed number of queries
+HOME_PAGE_SECTIONS = (
+    ('featured_statistics', lambda: [
+        featured_statistic_to_dto(stat)
+        for stat in DepartmentStatistics.objects.filter(featured=True).select_related('department')
+    ]),
+    ('featured_data', lambda: [
+        number_data_to_dto(data) for data in NumberDataATD.objects.filter(featured=True)
+    ]),
+    ('placements', lambda: [
+        placement_name_to_dto(placement) for placement in PlacementName.objects.all()
+    ]),
+    ('research', lambda: [
+        research_name_to_dto(research) for research in ResearchName.objects.all()
+    ]),
+    ('featured_news', lambda: [
+        news_card_to_dto(news_event) for news_event in home_news_queryset()
+    ]),
+    ('companies', lambda: [
+        company_to_dto(company) for company in Company.objects.all()
+    ]),
+)
+
+
+def build_home_page():
+    """Assemble the homepage payload, returning (payload, timings in milliseconds)"""
+    payload, timings = {}, {}
+    for name, build in HOME_PAGE_SECTIONS:
+        started = time.perf_counter()
+        payload[name] = build()
+        timings[name] = round((time.perf_counter() - started) * 1000, 2)
+    return payload, timings
+
+
+def get_home_page():
+    """Get the homepage payload, building and caching it on a miss.
+
+    Returns (payload, timings, cached) where timings are those of the build
+    that produced the payload.
+    """
+    entry = cache.get(HOME_PAGE_CACHE_KEY)
+    if entry is not None:
+        return entry['payload'], entry['timings'], True
+
+    payload, timings = build_home_page()
+    cache.set(HOME_PAGE_CACHE_KEY, {'payload': payload, 'timings': timings}, HOME_PAGE_CACHE_TIMEOUT)
+    return payload, timings, False
+
+
+def clear_home_page():
+    """Drop the cached homepage payload"""
+    cache.delete(HOME_PAGE_CACHE_KEY)
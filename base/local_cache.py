@@ -0,0 +1,100 @@
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from django.core.cache import cache
+
+
+MISSING = object()
+
+
+class BoundedTTLCache:
+    """Thread-safe in-process LRU map whose entries also expire after a timeout.
+
+    Used for small, hot lookups that are worth keeping in process memory
+    between requests. Each process holds its own copy, so entries are only
+    invalidated locally; the timeout bounds how long other processes can
+    serve a stale value.
+    """
+
+    def __init__(self, max_entries=256, timeout=300):
+        self.max_entries = max_entries
+        self.timeout = timeout
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=MISSING):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, timeout=MISSING):
+        timeout = self.timeout if timeout is MISSING else timeout
+        expires_at = time.monotonic() + timeout if timeout is not None else None
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+class VersionedValue:
+    """Process-local value rebuilt lazily whenever a version token in the Django cache changes.
+
+    bump() stores a new token and every process rebuilds on its next get().
+    Where the Django cache is not shared between processes, `max_age` bounds
+    how long another process can keep serving its old value.
+    """
+
+    def __init__(self, version_key, build, max_age=300):
+        self.version_key = version_key
+        self.build = build
+        self.max_age = max_age
+        self._entry = None
+        self._lock = threading.Lock()
+
+    def bump(self):
+        cache.set(self.version_key, uuid.uuid4().hex, None)
+
+    def _version(self):
+        version = cache.get(self.version_key)
+        if version is None:
+            cache.add(self.version_key, uuid.uuid4().hex, None)
+            version = cache.get(self.version_key)
+        return version
+
+    def _is_current(self, entry, version):
+        return (
+            entry is not None
+            and entry[0] == version
+            and time.monotonic() - entry[1] < self.max_age
+        )
+
+    def get(self):
+        version = self._version()
+        entry = self._entry
+        if not self._is_current(entry, version):
+            with self._lock:
+                # Another thread may have rebuilt while this one waited
+                entry = self._entry
+                if not self._is_current(entry, version):
+                    entry = self._entry = (version, time.monotonic(), self.build())
+        return entry[2]
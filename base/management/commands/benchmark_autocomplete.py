@@ -0,0 +1,50 @@
+import random
+import string
+import time
+from django.core.management.base import BaseCommand
+from base.autocomplete import AUTOCOMPLETE_SOURCES, AutocompleteIndex, build_autocomplete_index, build_trie
+
+
+class Command(BaseCommand):
+    help = 'Times building the autocomplete index and answering prefix lookups from it'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--synthetic', type=int, default=0, help='Index this many generated names per type instead of the database rows')
+        parser.add_argument('--lookups', type=int, default=10000, help='Number of lookups to time')
+        parser.add_argument('--seed', type=int, default=0, help='Random seed for generated names and prefixes')
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+
+        start = time.perf_counter()
+        if options['synthetic']:
+            index = AutocompleteIndex({
+                entity_type: build_trie(entity_type, [
+                    (i, self.random_name(rng), None) for i in range(options['synthetic'])
+                ])
+                for entity_type in AUTOCOMPLETE_SOURCES
+            })
+        else:
+            index = build_autocomplete_index()
+        build_ms = (time.perf_counter() - start) * 1000
+
+        # Prefixes of one to four letters, as typed in a search box
+        prefixes = [
+            ''.join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 4)))
+            for _ in range(options['lookups'])
+        ]
+        start = time.perf_counter()
+        hits = sum(len(index.lookup(prefix)) for prefix in prefixes)
+        lookup_us = (time.perf_counter() - start) * 1e6 / max(len(prefixes), 1)
+
+        self.stdout.write(f'Build: {build_ms:.1f} ms')
+        self.stdout.write(f'Lookups: {len(prefixes)}, {hits} suggestions returned')
+        self.stdout.write(self.style.SUCCESS(f'Mean lookup: {lookup_us:.1f} us'))
+
+    @staticmethod
+    def random_name(rng):
+        words = rng.randint(1, 4)
+        return ' '.join(
+            ''.join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 10))).capitalize()
+            for _ in range(words)
+        )
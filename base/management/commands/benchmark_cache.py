@@ -0,0 +1,110 @@
+import time
+from django.core.cache.backends.db import DatabaseCache
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from base.db_cache import CompressedDatabaseCache
+from base.models.cache_model import CacheEntry
+
+BENCHMARK_TABLE = 'base_benchmark_cache'
+BENCHMARK_KEY_PREFIX = 'benchmark'
+GET_MANY_CHUNK = 50
+
+
+def sample_payload(number):
+    """Response data shaped like a department's faculty list"""
+    return [
+        {
+            'id': number * 100 + i,
+            'name': f'Faculty Member {number}-{i}',
+            'slug': f'faculty-member-{number}-{i}',
+            'designation': {'id': i % 5, 'name': 'Assistant Professor'},
+            'department': {'id': number % 12, 'name': 'Computer Science and Engineering', 'slug': 'cse'},
+            'qualification': 'M.E., Ph.D.',
+            'mail_id': f'faculty{number}{i}@example.edu',
+            'image': f'https://media.example.edu/faculty/{number}-{i}.jpg',
+            'bio': 'Teaches data structures and machine learning; research in distributed systems. ' * 3,
+        }
+        for i in range(30)
+    ]
+
+
+class Command(BaseCommand):
+    help = (
+        "Compares CompressedDatabaseCache with Django's DatabaseCache on the default database "
+        "(run once with SQLite and once with MySQL settings). Only touches benchmark keys."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--keys', type=int, default=200, help='Entries written and read per phase')
+
+    def handle(self, *args, **options):
+        count = options['keys']
+        if count < 1:
+            raise CommandError('--keys must be at least 1')
+
+        params = {'KEY_PREFIX': BENCHMARK_KEY_PREFIX, 'OPTIONS': {'MAX_ENTRIES': count * 2}}
+        call_command('createcachetable', BENCHMARK_TABLE, verbosity=0)
+        backends = {
+            'DatabaseCache': DatabaseCache(BENCHMARK_TABLE, params),
+            'CompressedDatabaseCache': CompressedDatabaseCache(
+                BENCHMARK_KEY_PREFIX, {**params, 'OPTIONS': {**params['OPTIONS'], 'CULL_PROBABILITY': 0}}
+            ),
+        }
+        keys = [f'response:{number}' for number in range(count)]
+        payloads = {key: sample_payload(number) for number, key in enumerate(keys)}
+
+        self.stdout.write(f'{connection.vendor}, {count} keys')
+        try:
+            for name, backend in backends.items():
+                self.run_phases(name, backend, keys, payloads)
+                self.stdout.write(f'{name:<24} stored {self.stored_bytes(name) / count / 1024:.1f} KiB per entry')
+        finally:
+            backends['CompressedDatabaseCache'].delete_many(keys)
+            with connection.cursor() as cursor:
+                cursor.execute(f'DROP TABLE {connection.ops.quote_name(BENCHMARK_TABLE)}')
+
+    def run_phases(self, name, backend, keys, payloads):
+        def forget_local():
+            if isinstance(backend, CompressedDatabaseCache):
+                backend.clear_local()
+
+        def set_all():
+            for key in keys:
+                backend.set(key, payloads[key])
+
+        def get_all():
+            for key in keys:
+                backend.get(key)
+
+        def get_many_all():
+            for start in range(0, len(keys), GET_MANY_CHUNK):
+                backend.get_many(keys[start:start + GET_MANY_CHUNK])
+
+        phases = [
+            ('set', None, set_all),
+            ('get (database)', forget_local, get_all),
+            # The LRU only helps the compressed backend; the stock one reads the database again
+            ('get (repeated)', None, get_all),
+            (f'get_many ({GET_MANY_CHUNK})', forget_local, get_many_all),
+        ]
+        for phase, prepare, run in phases:
+            if prepare:
+                prepare()
+            started = time.perf_counter()
+            run()
+            elapsed = time.perf_counter() - started
+            self.stdout.write(
+                f'{name:<24} {phase:<16} {len(keys) / elapsed:>9.0f} keys/s  '
+                f'{elapsed / len(keys) * 1000:.2f} ms/key'
+            )
+
+    def stored_bytes(self, name):
+        if name == 'DatabaseCache':
+            table, where, params = BENCHMARK_TABLE, '', []
+        else:
+            table, params = CacheEntry._meta.db_table, [f'{BENCHMARK_KEY_PREFIX}:%']
+            where = f" WHERE {connection.ops.quote_name('key')} LIKE %s"
+        with connection.cursor() as cursor:
+            cursor.execute(f'SELECT SUM(LENGTH(value)) FROM {connection.ops.quote_name(table)}{where}', params)
+            return cursor.fetchone()[0] or 0
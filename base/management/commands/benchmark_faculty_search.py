@@ -0,0 +1,64 @@
+import random
+import string
+import time
+from django.core.management.base import BaseCommand
+from base.fuzzy_names import FuzzyNameIndex, build_faculty_name_index
+
+SYLLABLES = (
+    'ra', 'ma', 'ka', 'vi', 'ja', 'ya', 'su', 'ri', 'ni', 'va', 'san', 'kri', 'sh', 'na',
+    'an', 'dha', 'la', 'ksh', 'mi', 'pri', 'thi', 'ku', 'mar', 'esh', 'deep', 'ga', 'ee'
+)
+
+
+class Command(BaseCommand):
+    help = 'Times building the fuzzy faculty name index and answering misspelled queries from it'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--synthetic', type=int, default=5000, help='Index this many generated names (0 uses the database rows)')
+        parser.add_argument('--queries', type=int, default=1000, help='Number of misspelled queries to time')
+        parser.add_argument('--seed', type=int, default=0, help='Random seed for generated names and typos')
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+
+        start = time.perf_counter()
+        if options['synthetic']:
+            index = FuzzyNameIndex([(i, self.random_name(rng)) for i in range(options['synthetic'])])
+        else:
+            index = build_faculty_name_index()
+        build_ms = (time.perf_counter() - start) * 1000
+        if not index.names:
+            self.stdout.write(self.style.WARNING('No names to search.'))
+            return
+
+        # Each query is an indexed name with one typo; a hit finds that name in the top 10
+        targets = rng.choices(list(index.names), k=options['queries'])
+        queries = [self.misspell(rng, index.names[target]) for target in targets]
+        start = time.perf_counter()
+        results = [index.search(query) for query in queries]
+        search_ms = (time.perf_counter() - start) * 1000 / len(queries)
+        hits = sum(
+            target in [object_id for object_id, _ in found]
+            for target, found in zip(targets, results)
+        )
+
+        self.stdout.write(f'Names: {len(index.names)}, build: {build_ms:.1f} ms')
+        self.stdout.write(f'Queries: {len(queries)}, original name in top 10: {hits / len(queries):.1%}')
+        self.stdout.write(self.style.SUCCESS(f'Mean search: {search_ms:.2f} ms'))
+
+    @staticmethod
+    def random_name(rng):
+        return ' '.join(
+            ''.join(rng.choices(SYLLABLES, k=rng.randint(2, 4))).capitalize()
+            for _ in range(rng.randint(1, 3))
+        )
+
+    @staticmethod
+    def misspell(rng, name):
+        position = rng.randrange(len(name))
+        typo = rng.choice(('drop', 'swap', 'replace'))
+        if typo == 'drop':
+            return name[:position] + name[position + 1:]
+        if typo == 'swap' and position + 1 < len(name):
+            return name[:position] + name[position + 1] + name[position] + name[position + 2:]
+        return name[:position] + rng.choice(string.ascii_lowercase) + name[position + 1:]
@@ -0,0 +1,51 @@
+import os
+import time
+from django.core.management.base import BaseCommand, CommandError
+from base.faculty_import import (
+    DEFAULT_BATCH_SIZE, DEFAULT_UPLOAD_WORKERS, IMPORT_COLUMNS, import_faculty, read_faculty_rows
+)
+
+
+class Command(BaseCommand):
+    help = (
+        'Creates or updates faculty from a .csv or .jsonl file in bulk. '
+        f'Columns: {", ".join(IMPORT_COLUMNS)}'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='CSV (with a header row) or JSON Lines file')
+        parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE, help='Rows per INSERT/UPDATE statement')
+        parser.add_argument('--workers', type=int, default=DEFAULT_UPLOAD_WORKERS, help='Concurrent image uploads')
+        parser.add_argument('--dry-run', action='store_true', help='Validate and report without writing anything')
+
+    def handle(self, *args, **options):
+        path = options['path']
+        if options['batch_size'] < 1 or options['workers'] < 1:
+            raise CommandError('--batch-size and --workers must be at least 1')
+
+        start = time.perf_counter()
+        try:
+            rows = read_faculty_rows(path)
+        except (OSError, ValueError) as e:
+            raise CommandError(str(e))
+        result = import_faculty(
+            rows,
+            base_dir=os.path.dirname(os.path.abspath(path)),
+            batch_size=options['batch_size'],
+            workers=options['workers'],
+            dry_run=options['dry_run']
+        )
+        elapsed = time.perf_counter() - start
+
+        for line, message in result['errors']:
+            self.stderr.write(f'Line {line}: {message}')
+        self.stdout.write(', '.join(f'{phase}: {seconds * 1000:.0f} ms' for phase, seconds in result['timings'].items()))
+
+        written = result['created'] + result['updated']
+        summary = (
+            f"{'Would write' if options['dry_run'] else 'Wrote'} {written} faculty "
+            f"({result['created']} new, {result['updated']} updated, {result['images']} image(s)), "
+            f"skipped {len(result['errors'])} row(s) in {elapsed:.2f} s "
+            f"({written / elapsed if elapsed else 0:.0f} rows/s)."
+        )
+        self.stdout.write(self.style.WARNING(summary) if result['errors'] else self.style.SUCCESS(summary))
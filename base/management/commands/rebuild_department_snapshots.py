@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+from base.department_page import department_page_queryset, store_department_snapshot
+
+
+class Command(BaseCommand):
+    help = 'Rebuilds the pre-rendered department detail page snapshots'
+
+    def add_arguments(self, parser):
+        parser.add_argument('departments', nargs='*', type=int, help='Department IDs to rebuild (default: all)')
+
+    def handle(self, *args, **options):
+        departments = department_page_queryset()
+        if options['departments']:
+            departments = departments.filter(id__in=options['departments'])
+
+        count = 0
+        for department in departments:
+            store_department_snapshot(department)
+            count += 1
+
+        self.stdout.write(
+            self.style.SUCCESS(f'Rebuilt {count} department snapshot(s).')
+        )
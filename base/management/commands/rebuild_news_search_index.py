@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+from base.models.news_events_models import NewsEvents
+from base.news_search import index_news_event
+
+
+class Command(BaseCommand):
+    help = 'Rebuilds the news & events search index'
+
+    def add_arguments(self, parser):
+        parser.add_argument('news_events', nargs='*', type=int, help='News/event IDs to re-index (default: all)')
+
+    def handle(self, *args, **options):
+        news_event_ids = options['news_events'] or NewsEvents.objects.values_list('id', flat=True)
+
+        count = 0
+        for news_event_id in news_event_ids:
+            index_news_event(news_event_id)
+            count += 1
+
+        self.stdout.write(
+            self.style.SUCCESS(f'Re-indexed {count} news/event(s).')
+        )
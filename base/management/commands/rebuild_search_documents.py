@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand, CommandError
+from base.site_search import index_search_documents, parse_search_types
+
+
+class Command(BaseCommand):
+    help = 'Rebuilds the site search documents'
+
+    def add_arguments(self, parser):
+        parser.add_argument('types', nargs='*', help='Types to rebuild, e.g. course faculty (default: all)')
+
+    def handle(self, *args, **options):
+        try:
+            types = parse_search_types(','.join(options['types']))
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        for entity_type in types:
+            count = index_search_documents(entity_type)
+            self.stdout.write(f'{entity_type}: {count} document(s)')
+
+        self.stdout.write(
+            self.style.SUCCESS(f'Rebuilt search documents for {len(types)} type(s).')
+        )
@@ -0,0 +1,27 @@
+# Generated by Django 4.2.7 on 2026-10-16 21:07
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0049_course_og_locale_course_og_site_name_course_og_url_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DepartmentSnapshot',
+            fields=[
+                ('department', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='snapshot', serialize=False, to='base.department')),
+                ('slug', models.SlugField(blank=True, help_text='Copy of the department slug for slug lookups', max_length=200, null=True)),
+                ('payload', models.JSONField(default=dict, help_text='Department detail page JSON payload')),
+                ('built_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Department Snapshot',
+                'verbose_name_plural': 'Department Snapshots',
+            },
+        ),
+    ]
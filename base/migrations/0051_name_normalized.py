@@ -0,0 +1,45 @@
+# Generated by Django 4.2.7 on 2026-10-16 21:18
+
+import re
+import unicodedata
+
+from django.db import migrations, models
+
+
+# Frozen copy of base.utils.normalize_name as of this migration
+def normalize_name(name):
+    if not name:
+        return ''
+    name = unicodedata.normalize('NFKD', str(name))
+    name = ''.join(char for char in name if not unicodedata.combining(char))
+    return re.sub(r'\s+', ' ', name).strip().casefold()
+
+
+def backfill_normalized_names(apps, schema_editor):
+    for model_name in ('Course', 'Faculty'):
+        model = apps.get_model('base', model_name)
+        rows = list(model.objects.only('id', 'name'))
+        for row in rows:
+            row.name_normalized = normalize_name(row.name)
+        model.objects.bulk_update(rows, ['name_normalized'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0050_department_snapshot'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='course',
+            name='name_normalized',
+            field=models.CharField(blank=True, db_index=True, default='', editable=False, help_text='Case and accent folded name used for exact lookups', max_length=255),
+        ),
+        migrations.AddField(
+            model_name='faculty',
+            name='name_normalized',
+            field=models.CharField(blank=True, db_index=True, default='', editable=False, help_text='Case and accent folded name used for exact lookups', max_length=255),
+        ),
+        migrations.RunPython(backfill_normalized_names, migrations.RunPython.noop),
+    ]
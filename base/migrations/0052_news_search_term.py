@@ -0,0 +1,95 @@
+# Generated by Django 4.2.7 on 2026-10-16 21:30
+
+import re
+import unicodedata
+from collections import Counter
+from html import unescape
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+# Frozen copy of the tokenizer and weights in base/utils.py and
+# base/news_search.py as of this migration
+MAX_TERM_LENGTH = 64
+MAX_OCCURRENCES = 5
+HEADING_WEIGHT = 10
+TAG_WEIGHT = 6
+DEPARTMENT_WEIGHT = 3
+CONTENT_WEIGHT = 1
+
+
+def normalize_name(name):
+    if not name:
+        return ''
+    name = unicodedata.normalize('NFKD', str(name))
+    name = ''.join(char for char in name if not unicodedata.combining(char))
+    return re.sub(r'\s+', ' ', name).strip().casefold()
+
+
+def plain_text(html):
+    if not html:
+        return ''
+    text = unescape(re.sub(r'<[^>]+>', ' ', str(html)))
+    return re.sub(r'\s+', ' ', text).strip()
+
+
+def search_words(text):
+    return [word[:MAX_TERM_LENGTH] for word in re.findall(r'\w+', normalize_name(plain_text(text)))]
+
+
+def build_search_terms(heading, content, tag_names, department_name):
+    weights = Counter()
+    weighted_texts = (
+        (heading, HEADING_WEIGHT),
+        (' '.join(name for name in tag_names if name), TAG_WEIGHT),
+        (department_name, DEPARTMENT_WEIGHT),
+        (content, CONTENT_WEIGHT),
+    )
+    for text, weight in weighted_texts:
+        for term, count in Counter(search_words(text)).items():
+            weights[term] += weight * min(count, MAX_OCCURRENCES)
+    return dict(weights)
+
+
+def build_search_index(apps, schema_editor):
+    NewsEvents = apps.get_model('base', 'NewsEvents')
+    NewsSearchTerm = apps.get_model('base', 'NewsSearchTerm')
+    news_events = NewsEvents.objects.select_related('department').prefetch_related('tags')
+    for news_event in news_events.iterator(chunk_size=200):
+        terms = build_search_terms(
+            news_event.heading,
+            news_event.content,
+            [tag.tag_name for tag in news_event.tags.all()],
+            news_event.department.name if news_event.department else None
+        )
+        NewsSearchTerm.objects.bulk_create([
+            NewsSearchTerm(news_event_id=news_event.id, term=term, weight=weight)
+            for term, weight in terms.items()
+        ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0051_name_normalized'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NewsSearchTerm',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('term', models.CharField(help_text='Case and accent folded word from the heading, content, tags or department', max_length=64)),
+                ('weight', models.PositiveIntegerField(default=1, help_text='Relevance of the term, higher for headings and tags than for body text')),
+                ('news_event', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='search_terms', to='base.newsevents')),
+            ],
+            options={
+                'verbose_name': 'News Search Term',
+                'verbose_name_plural': 'News Search Terms',
+                'indexes': [models.Index(fields=['term', 'news_event'], name='news_search_term_idx')],
+                'unique_together': {('news_event', 'term')},
+            },
+        ),
+        migrations.RunPython(build_search_index, migrations.RunPython.noop),
+    ]
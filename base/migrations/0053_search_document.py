@@ -0,0 +1,46 @@
+# Generated by Django 4.2.7 on 2026-10-16 21:45
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0052_news_search_term'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('entity_type', models.CharField(choices=[('department', 'Department'), ('course', 'Course'), ('faculty', 'Faculty'), ('news', 'News & Event'), ('college_achievement', 'College Achievement'), ('student_achievement', 'Student Achievement'), ('company', 'Company')], max_length=30)),
+                ('object_id', models.PositiveBigIntegerField(help_text='ID of the object in its own table')),
+                ('title', models.CharField(blank=True, default='', max_length=255)),
+                ('subtitle', models.CharField(blank=True, default='', help_text='Secondary line, e.g. the department or designation', max_length=255)),
+                ('slug', models.CharField(blank=True, max_length=255, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Search Document',
+                'verbose_name_plural': 'Search Documents',
+                'unique_together': {('entity_type', 'object_id')},
+            },
+        ),
+        migrations.CreateModel(
+            name='SearchDocumentTerm',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('term', models.CharField(help_text='Case and accent folded word of the document', max_length=64)),
+                ('weight', models.PositiveIntegerField(default=1, help_text='Relevance of the term, higher for titles than for body text')),
+                ('document', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='terms', to='base.searchdocument')),
+            ],
+            options={
+                'verbose_name': 'Search Document Term',
+                'verbose_name_plural': 'Search Document Terms',
+                'indexes': [models.Index(fields=['term', 'document'], name='search_document_term_idx')],
+                'unique_together': {('document', 'term')},
+            },
+        ),
+    ]
@@ -0,0 +1,72 @@
+# Generated by Django 4.2.7 on 2026-10-16 21:52
+
+from django.db import migrations, models
+
+
+# Frozen copy of the ranking rules in base/models/faculty_model.py as of this migration
+HOD_DESIGNATION_KEYWORDS = ('head', 'hod', 'chair', 'director', 'principal')
+HOD_RANK = 0
+DESIGNATION_RANKS = (
+    ('associate professor', 2),
+    ('assistant professor', 3),
+    ('professor', 1),
+    ('lecturer', 4),
+)
+UNRANKED = 5
+
+
+def designation_standing(name):
+    name = (name or '').lower()
+    if any(keyword in name for keyword in HOD_DESIGNATION_KEYWORDS):
+        return True, HOD_RANK
+    for keyword, rank in DESIGNATION_RANKS:
+        if keyword in name:
+            return False, rank
+    return False, UNRANKED
+
+
+def backfill_designation_ranks(apps, schema_editor):
+    Designation = apps.get_model('base', 'Designation')
+    Faculty = apps.get_model('base', 'Faculty')
+    designations = list(Designation.objects.only('id', 'name'))
+    for designation in designations:
+        designation.is_hod, designation.rank = designation_standing(designation.name)
+        Faculty.objects.filter(designation_id=designation.id).update(
+            is_hod=designation.is_hod, designation_rank=designation.rank
+        )
+    Designation.objects.bulk_update(designations, ['is_hod', 'rank'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0053_search_document'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='designation',
+            name='is_hod',
+            field=models.BooleanField(default=False, editable=False, help_text='Head of department designation, derived from the name'),
+        ),
+        migrations.AddField(
+            model_name='designation',
+            name='rank',
+            field=models.PositiveSmallIntegerField(default=5, editable=False, help_text='Seniority used to order faculty lists, derived from the name'),
+        ),
+        migrations.AddField(
+            model_name='faculty',
+            name='is_hod',
+            field=models.BooleanField(default=False, editable=False, help_text='Copy of designation.is_hod'),
+        ),
+        migrations.AddField(
+            model_name='faculty',
+            name='designation_rank',
+            field=models.PositiveSmallIntegerField(default=5, editable=False, help_text='Copy of designation.rank'),
+        ),
+        migrations.AddIndex(
+            model_name='faculty',
+            index=models.Index(fields=['department', 'designation_rank', 'name'], name='faculty_dept_rank_idx'),
+        ),
+        migrations.RunPython(backfill_designation_ranks, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 4.2.7 on 2026-10-16 23:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0054_designation_rank'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CacheEntry',
+            fields=[
+                ('key', models.CharField(max_length=255, primary_key=True, serialize=False)),
+                ('value', models.BinaryField(help_text='Pickled value, zlib-compressed when that makes it smaller')),
+                ('expires', models.FloatField(db_index=True, help_text='Unix time the entry expires at; empty for never', null=True)),
+            ],
+            options={
+                'verbose_name': 'Cache Entry',
+                'verbose_name_plural': 'Cache Entries',
+            },
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 4.2.7 on 2026-10-16 23:45
+
+from django.db import migrations
+
+
+def drop_department_snapshots(apps, schema_editor):
+    # Snapshots stored so far hold signed file URLs rather than storage names;
+    # get_department_page() rebuilds them on the next read
+    apps.get_model('base', 'DepartmentSnapshot').objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0055_cache_entry'),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_department_snapshots, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,15 @@
+from django.db import models
+
+
+class CacheEntry(models.Model):
+    """One key of the shared cache backend in base/db_cache.py"""
+    key = models.CharField(max_length=255, primary_key=True)
+    value = models.BinaryField(help_text="Pickled value, zlib-compressed when that makes it smaller")
+    expires = models.FloatField(null=True, db_index=True, help_text="Unix time the entry expires at; empty for never")
+
+    def __str__(self):
+        return self.key
+
+    class Meta:
+        verbose_name = "Cache Entry"
+        verbose_name_plural = "Cache Entries"
@@ -2,12 +2,15 @@ from django.db import models
 from django.utils import timezone
 from ckeditor.fields import RichTextField
 from base.models.department_model import Department, SEOMixin
+from base.utils import normalize_name
 import uuid
 
 
 class Course(SEOMixin):
     name = models.CharField(max_length=255, blank=True, null=True)
+    name_normalized = models.CharField(max_length=255, blank=True, default='', db_index=True, editable=False, help_text="Case and accent folded name used for exact lookups")
     slug = models.SlugField(max_length=255, blank=True, null=True, unique=True, help_text="URL-friendly identifier (auto-generated from name if not provided)")
+    slug_source_field = 'name'
     department = models.ForeignKey(Department, on_delete=models.CASCADE, related_name='courses', null=True, blank=True)
     ug = models.BooleanField(default=False, help_text="Undergraduate program available")
     pg = models.BooleanField(default=False, help_text="Postgraduate program available")
@@ -165,6 +168,13 @@ class Course(SEOMixin):
             }
             self.schema_json = json.dumps(schema, indent=2)
 
+    def save(self, *args, **kwargs):
+        self.name_normalized = normalize_name(self.name)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'name' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'name_normalized'}
+        super().save(*args, **kwargs)
+
     class Meta:
         ordering = ['name']
 
@@ -1,6 +1,11 @@
-from django.db import models
+from django.db import IntegrityError, models, transaction
 from ckeditor.fields import RichTextField
 from django.utils import timezone
+from base.utils import unique_slug
+
+
+# Saves retried when a concurrent save took the generated slug first
+SLUG_SAVE_ATTEMPTS = 3
 
 
 class SEOMixin(models.Model):
@@ -46,6 +51,9 @@ class SEOMixin(models.Model):
     created_at = models.DateTimeField(default=timezone.now)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # Field a blank `slug` is generated from; None for models without a slug
+    slug_source_field = None
+
     class Meta:
         abstract = True  # This is a mixin, not a standalone model
 
@@ -54,15 +62,47 @@ class SEOMixin(models.Model):
         # This method should be overridden by child classes
         pass
 
+    def generate_slug(self):
+        """Fill a blank slug from the source field; True if a slug was generated"""
+        if self.slug_source_field is None or self.slug:
+            return False
+        self.slug = unique_slug(type(self), getattr(self, self.slug_source_field), exclude_id=self.pk)
+        return self.slug is not None
+
     def save(self, *args, **kwargs):
-        # Generate SEO data before saving (works for both new and existing objects)
+        # Blank fields are filled below; remember them so a retry can regenerate them
+        blank_fields = {
+            field.attname: getattr(self, field.attname)
+            for field in self._meta.concrete_fields
+            if getattr(self, field.attname) in (None, '')
+        }
+        # Generate the slug and SEO data before saving (works for both new and existing objects)
+        generated_slug = self.generate_slug()
         self.generate_seo_data()
-        super().save(*args, **kwargs)
+        if not generated_slug:
+            super().save(*args, **kwargs)
+            return
+
+        for attempt in range(SLUG_SAVE_ATTEMPTS):
+            try:
+                with transaction.atomic():
+                    super().save(*args, **kwargs)
+                return
+            except IntegrityError:
+                slug_taken = type(self).objects.filter(slug=self.slug).exclude(pk=self.pk).exists()
+                if not slug_taken or attempt == SLUG_SAVE_ATTEMPTS - 1:
+                    raise
+            # A concurrent save took the slug; start again from the blank fields
+            for attname, value in blank_fields.items():
+                setattr(self, attname, value)
+            self.generate_slug()
+            self.generate_seo_data()
 
 
 class Department(SEOMixin):
     name = models.CharField(max_length=200, blank=True, null=True)
     slug = models.SlugField(max_length=200, blank=True, null=True, unique=True, help_text="URL-friendly identifier (auto-generated from name if not provided)")
+    slug_source_field = 'name'
     ug = models.BooleanField(default=False)
     pg = models.BooleanField(default=False)
     phd = models.BooleanField(default=False)
@@ -352,4 +392,19 @@ class DepartmentStatistics(models.Model):
     class Meta:
         ordering = ['display_order', 'id']
         verbose_name = "Department Statistic"
-        verbose_name_plural = "Department Statistics" 
\ No newline at end of file
+        verbose_name_plural = "Department Statistics"
+
+
+class DepartmentSnapshot(models.Model):
+    """Pre-rendered department detail payload, rebuilt whenever the department or any of its sections change"""
+    department = models.OneToOneField(Department, on_delete=models.CASCADE, primary_key=True, related_name='snapshot')
+    slug = models.SlugField(max_length=200, blank=True, null=True, db_index=True, help_text="Copy of the department slug for slug lookups")
+    payload = models.JSONField(default=dict, help_text="Department detail page JSON payload")
+    built_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Snapshot of {self.department_id} ({self.slug})"
+
+    class Meta:
+        verbose_name = "Department Snapshot"
+        verbose_name_plural = "Department Snapshots"
@@ -1,31 +1,73 @@
 from django.db import models
 from django.utils import timezone
-from django.utils.text import slugify
 from ckeditor.fields import RichTextField
 from base.models.department_model import Department, SEOMixin
+from base.utils import normalize_name
 import uuid
 import re
 
 
+# Designations containing one of these words head a department
+HOD_DESIGNATION_KEYWORDS = ('head', 'hod', 'chair', 'director', 'principal')
+
+# Sort rank of designations within a department, first match wins; heads rank first
+HOD_RANK = 0
+DESIGNATION_RANKS = (
+    ('associate professor', 2),
+    ('assistant professor', 3),
+    ('professor', 1),
+    ('lecturer', 4),
+)
+UNRANKED = 5
+
+
+def designation_standing(name):
+    """(is_hod, rank) of a designation name"""
+    name = (name or '').lower()
+    if any(keyword in name for keyword in HOD_DESIGNATION_KEYWORDS):
+        return True, HOD_RANK
+    for keyword, rank in DESIGNATION_RANKS:
+        if keyword in name:
+            return False, rank
+    return False, UNRANKED
+
+
 class Designation(models.Model):
     name = models.CharField(max_length=255, unique=True)
     unique_id = models.UUIDField(default=uuid.uuid4, editable=False, unique=True)
+    is_hod = models.BooleanField(default=False, editable=False, help_text="Head of department designation, derived from the name")
+    rank = models.PositiveSmallIntegerField(default=UNRANKED, editable=False, help_text="Seniority used to order faculty lists, derived from the name")
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return self.name
 
+    def save(self, *args, **kwargs):
+        self.is_hod, self.rank = designation_standing(self.name)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'name' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'is_hod', 'rank'}
+        super().save(*args, **kwargs)
+        # Faculty rows carry a copy so department lists sort without a join
+        self.faculty_members.exclude(is_hod=self.is_hod, designation_rank=self.rank).update(
+            is_hod=self.is_hod, designation_rank=self.rank
+        )
+
     class Meta:
         ordering = ['name']
 
 
 class Faculty(SEOMixin):
     name = models.CharField(max_length=255, blank=True, null=True)
+    name_normalized = models.CharField(max_length=255, blank=True, default='', db_index=True, editable=False, help_text="Case and accent folded name used for exact lookups")
     slug = models.SlugField(max_length=255, blank=True, null=True, unique=True, help_text="URL-friendly identifier (auto-generated from name if not provided)")
+    slug_source_field = 'name'
     alt = models.CharField(max_length=255, help_text="Alt text for image", blank=True, null=True)
     image = models.ImageField(upload_to='faculty/images/', blank=True, null=True)
     designation = models.ForeignKey(Designation, on_delete=models.SET_NULL, null=True, blank=True, related_name='faculty_members')
+    is_hod = models.BooleanField(default=False, editable=False, help_text="Copy of designation.is_hod")
+    designation_rank = models.PositiveSmallIntegerField(default=UNRANKED, editable=False, help_text="Copy of designation.rank")
     department = models.ForeignKey(Department, on_delete=models.SET_NULL, null=True, blank=True, related_name='faculty_members')
     mail_id = models.EmailField(blank=True, null=True)
     phone_number = models.CharField(max_length=20, blank=True, null=True)
@@ -59,24 +101,6 @@ class Faculty(SEOMixin):
 
     def generate_seo_data(self):
         """Generate SEO data for faculty - all fields auto-generated without HTML"""
-        # Auto-generate slug from name if not provided
-        if not self.slug and self.name:
-            base_slug = slugify(self.name)
-            # Ensure uniqueness
-            if self.id:
-                existing = Faculty.objects.filter(slug=base_slug).exclude(id=self.id).exists()
-            else:
-                existing = Faculty.objects.filter(slug=base_slug).exists()
-            
-            if existing:
-                # Add unique suffix
-                counter = 1
-                while Faculty.objects.filter(slug=f"{base_slug}-{counter}").exists():
-                    counter += 1
-                self.slug = f"{base_slug}-{counter}"
-            else:
-                self.slug = base_slug
-        
         # Clean name and designation for use in titles (remove any HTML)
         clean_name = self.clean_text(self.name) if self.name else "Faculty"
         desig = self.clean_text(self.designation.name) if self.designation else "Faculty"
@@ -203,9 +227,28 @@ class Faculty(SEOMixin):
             import json
             self.schema_json = json.dumps(schema)
 
+    def save(self, *args, **kwargs):
+        self.name_normalized = normalize_name(self.name)
+        if self.designation_id:
+            self.is_hod, self.designation_rank = self.designation.is_hod, self.designation.rank
+        else:
+            self.is_hod, self.designation_rank = False, UNRANKED
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            update_fields = set(update_fields)
+            if 'name' in update_fields:
+                update_fields.add('name_normalized')
+            if 'designation' in update_fields:
+                update_fields |= {'is_hod', 'designation_rank'}
+            kwargs['update_fields'] = update_fields
+        super().save(*args, **kwargs)
+
     class Meta:
         ordering = ['name']
         unique_together = ['name', 'department']
+        indexes = [
+            models.Index(fields=['department', 'designation_rank', 'name'], name='faculty_dept_rank_idx'),
+        ]
 
 
 class FacultyBanner(models.Model):
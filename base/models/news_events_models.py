@@ -1,6 +1,5 @@
 from django.db import models
 from django.utils import timezone
-from django.utils.text import slugify
 from ckeditor.fields import RichTextField
 from base.models.department_model import Department, SEOMixin
 import uuid
@@ -76,6 +75,7 @@ class NewsEvents(SEOMixin):
 
     heading = models.CharField(max_length=255, blank=True, null=True)
     slug = models.SlugField(max_length=255, blank=True, null=True, unique=True, help_text="URL-friendly identifier (auto-generated from heading if not provided)")
+    slug_source_field = 'heading'
     date = models.DateField(blank=True, null=True)
     link = models.URLField(blank=True, null=True, help_text="External link for the news/event")
     category = models.CharField(max_length=20, choices=CATEGORY_CHOICES, blank=True, null=True)
@@ -112,24 +112,6 @@ class NewsEvents(SEOMixin):
 
     def generate_seo_data(self):
         """Generate SEO data for news/events - all fields auto-generated without HTML"""
-        # Auto-generate slug from heading if not provided
-        if not self.slug and self.heading:
-            base_slug = slugify(self.heading)
-            # Ensure uniqueness
-            if self.id:
-                existing = NewsEvents.objects.filter(slug=base_slug).exclude(id=self.id).exists()
-            else:
-                existing = NewsEvents.objects.filter(slug=base_slug).exists()
-            
-            if existing:
-                # Add unique suffix
-                counter = 1
-                while NewsEvents.objects.filter(slug=f"{base_slug}-{counter}").exists():
-                    counter += 1
-                self.slug = f"{base_slug}-{counter}"
-            else:
-                self.slug = base_slug
-        
         # Clean heading for use in titles (remove any HTML)
         clean_heading = self.clean_text(self.heading) if self.heading else "News & Event"
         category_display = self.get_category_display() if self.category else "News"
@@ -264,9 +246,27 @@ class NewsEvents(SEOMixin):
         verbose_name_plural = "News & Events"
 
     def get_primary_image(self):
-        """Get the first active image"""
+        """Get the first active image, from the active_images prefetch when it was loaded"""
+        if hasattr(self, 'active_images'):
+            return self.active_images[0] if self.active_images else None
         return self.images.filter(is_active=True).first()
 
     def get_all_tags(self):
         """Get all tag names as a string"""
-        return ", ".join([tag.tag_name for tag in self.tags.all()]) 
\ No newline at end of file
+        return ", ".join([tag.tag_name for tag in self.tags.all()])
+
+
+class NewsSearchTerm(models.Model):
+    """Inverted index row: one search term of a news/event with its relevance weight"""
+    news_event = models.ForeignKey(NewsEvents, on_delete=models.CASCADE, related_name='search_terms')
+    term = models.CharField(max_length=64, help_text="Case and accent folded word from the heading, content, tags or department")
+    weight = models.PositiveIntegerField(default=1, help_text="Relevance of the term, higher for headings and tags than for body text")
+
+    def __str__(self):
+        return f"{self.term} ({self.weight}) -> {self.news_event_id}"
+
+    class Meta:
+        unique_together = ['news_event', 'term']
+        indexes = [models.Index(fields=['term', 'news_event'], name='news_search_term_idx')]
+        verbose_name = "News Search Term"
+        verbose_name_plural = "News Search Terms"
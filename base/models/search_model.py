@@ -0,0 +1,45 @@
+from django.db import models
+
+
+class SearchDocument(models.Model):
+    """One searchable object in the site search, maintained from model signals"""
+    ENTITY_TYPE_CHOICES = [
+        ('department', 'Department'),
+        ('course', 'Course'),
+        ('faculty', 'Faculty'),
+        ('news', 'News & Event'),
+        ('college_achievement', 'College Achievement'),
+        ('student_achievement', 'Student Achievement'),
+        ('company', 'Company'),
+    ]
+
+    entity_type = models.CharField(max_length=30, choices=ENTITY_TYPE_CHOICES)
+    object_id = models.PositiveBigIntegerField(help_text="ID of the object in its own table")
+    title = models.CharField(max_length=255, blank=True, default='')
+    subtitle = models.CharField(max_length=255, blank=True, default='', help_text="Secondary line, e.g. the department or designation")
+    slug = models.CharField(max_length=255, blank=True, null=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.entity_type} {self.object_id}: {self.title}"
+
+    class Meta:
+        unique_together = ['entity_type', 'object_id']
+        verbose_name = "Search Document"
+        verbose_name_plural = "Search Documents"
+
+
+class SearchDocumentTerm(models.Model):
+    """Inverted index row: one search term of a site search document with its relevance weight"""
+    document = models.ForeignKey(SearchDocument, on_delete=models.CASCADE, related_name='terms')
+    term = models.CharField(max_length=64, help_text="Case and accent folded word of the document")
+    weight = models.PositiveIntegerField(default=1, help_text="Relevance of the term, higher for titles than for body text")
+
+    def __str__(self):
+        return f"{self.term} ({self.weight}) -> {self.document_id}"
+
+    class Meta:
+        unique_together = ['document', 'term']
+        indexes = [models.Index(fields=['term', 'document'], name='search_document_term_idx')]
+        verbose_name = "Search Document Term"
+        verbose_name_plural = "Search Document Terms"
@@ -0,0 +1,90 @@
+from django.db import transaction
+from django.db.models import Exists, IntegerField, OuterRef, Q, Subquery, Sum
+from django.db.models.functions import Coalesce
+from base.models.news_events_models import NewsEvents, NewsSearchTerm
+from base.utils import search_words, weigh_search_terms
+
+
+# ============================================================================
+# NEWS & EVENTS SEARCH INDEX
+# ============================================================================
+#
+# `?search=` used to OR icontains filters over the heading, the rich-text
+# content, tag names and department name, which scanned the content of every
+# row. Each news/event now keeps its words in NewsSearchTerm, an inverted
+# index keyed on (term, news_event). A search keeps the rows that contain
+# every query word as a term prefix and ranks them by the summed weight of
+# the matched terms. The signal handlers in base/signals.py re-index news
+# after commit when it changes or its tags or department are renamed. The
+# index is plain tables and LIKE 'prefix%' lookups, so MySQL and SQLite run
+# the same queries.
+
+# Weight of one occurrence of a word in each indexed field
+HEADING_WEIGHT = 10
+TAG_WEIGHT = 6
+DEPARTMENT_WEIGHT = 3
+CONTENT_WEIGHT = 1
+
+
+def build_search_terms(heading, content, tag_names, department_name):
+    """{term: weight} for the searchable fields of one news/event"""
+    return weigh_search_terms((
+        (heading, HEADING_WEIGHT),
+        (' '.join(name for name in tag_names if name), TAG_WEIGHT),
+        (department_name, DEPARTMENT_WEIGHT),
+        (content, CONTENT_WEIGHT),
+    ))
+
+
+def index_news_events(news_event_ids):
+    """Rebuild the search terms of the given news/events in one pass; returns the number of terms stored"""
+    news_event_ids = set(news_event_ids)
+    if not news_event_ids:
+        return 0
+    news_events = NewsEvents.objects.select_related('department').only(
+        'heading', 'content', 'department', 'department__name'
+    ).prefetch_related('tags').filter(id__in=news_event_ids)
+
+    terms = [
+        NewsSearchTerm(news_event_id=news_event.id, term=term, weight=weight)
+        for news_event in news_events
+        for term, weight in build_search_terms(
+            news_event.heading,
+            news_event.content,
+            [tag.tag_name for tag in news_event.tags.all()],
+            news_event.department.name if news_event.department else None
+        ).items()
+    ]
+
+    with transaction.atomic():
+        NewsSearchTerm.objects.filter(news_event_id__in=news_event_ids).delete()
+        NewsSearchTerm.objects.bulk_create(terms)
+    return len(terms)
+
+
+def index_news_event(news_event_id):
+    """Rebuild the search terms of one news/event; returns the number of terms stored"""
+    return index_news_events([news_event_id])
+
+
+def search_news_events(queryset, search_term):
+    """Narrow `queryset` to rows matching every word of `search_term`, best match first.
+
+    Rows are annotated with `search_rank`; equal ranks keep the model ordering.
+    """
+    words = list(dict.fromkeys(search_words(search_term)))
+    if not words:
+        return queryset.none()
+
+    # Terms are stored folded, so the case-insensitive prefix lookup is exact
+    # and compiles to a plain LIKE 'word%' that can use the term index
+    terms = NewsSearchTerm.objects.filter(news_event=OuterRef('pk'))
+    matched = Q()
+    for word in words:
+        queryset = queryset.filter(Exists(terms.filter(term__istartswith=word)))
+        matched |= Q(term__istartswith=word)
+
+    rank = terms.filter(matched).values('news_event').annotate(total=Sum('weight')).values('total')
+    return queryset.annotate(
+        search_rank=Coalesce(Subquery(rank, output_field=IntegerField()), 0)
+    ).order_by('-search_rank', *queryset.model._meta.ordering)
@@ -0,0 +1,206 @@
+import base64
+import datetime
+import json
+from decimal import Decimal
+from uuid import UUID
+from django.db.models import F, Q
+from drf_yasg import openapi
+from rest_framework import status
+from rest_framework.response import Response
+
+
+# ============================================================================
+# KEYSET (CURSOR) PAGINATION
+# ============================================================================
+#
+# List endpoints return every row unless the client passes `limit` or
+# `cursor`. A page is then read with a WHERE clause on the ordering columns
+# (the queryset's order_by, else Meta.ordering, with the primary key as the
+# final tiebreaker; annotations such as a search rank count as columns)
+# instead of an OFFSET, so each page costs the same however deep it is.
+# The `next` cursor is an opaque token holding the ordering values of the
+# last row returned. NULLs sort as the smallest value on every database.
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+PAGINATION_PARAMETERS = [
+    openapi.Parameter(
+        'limit',
+        openapi.IN_QUERY,
+        description=f"Page size (default {DEFAULT_PAGE_SIZE}, max {MAX_PAGE_SIZE}). "
+                    "Passing `limit` or `cursor` switches the response to a page: {results, next}",
+        type=openapi.TYPE_INTEGER,
+        required=False
+    ),
+    openapi.Parameter(
+        'cursor',
+        openapi.IN_QUERY,
+        description="The `next` value of the previous page",
+        type=openapi.TYPE_STRING,
+        required=False
+    ),
+]
+
+
+class InvalidPageRequest(ValueError):
+    """Raised for a malformed cursor or page size"""
+
+
+def _ordering(queryset):
+    """(field path, descending) pairs that totally order the queryset"""
+    ordering = list(queryset.query.order_by or queryset.model._meta.ordering or [])
+    keys = []
+    for item in ordering:
+        if not isinstance(item, str) or item == '?':
+            raise InvalidPageRequest(f"Cannot paginate on ordering {item!r}")
+        descending = item.startswith('-')
+        name = item.lstrip('-+')
+        if name == 'pk':
+            name = queryset.model._meta.pk.name
+        keys.append((name, descending))
+
+    pk_name = queryset.model._meta.pk.name
+    if pk_name not in [name for name, _ in keys]:
+        keys.append((pk_name, keys[-1][1] if keys else False))
+    return keys
+
+
+def _model_field(model, path):
+    """The model field at the end of a `relation__field` path"""
+    field = None
+    for part in path.split('__'):
+        field = model._meta.get_field(part)
+        if field.is_relation:
+            model = field.related_model
+    if field.is_relation:
+        field = field.target_field
+    return field
+
+
+def _key_field(queryset, path):
+    """The field of an ordering path: an annotation's output field or a model field"""
+    if path in queryset.query.annotations:
+        return queryset.query.annotations[path].output_field
+    return _model_field(queryset.model, path)
+
+
+def _row_value(row, path):
+    for part in path.split('__'):
+        if row is None:
+            return None
+        row = getattr(row, part)
+    # An ordering on a relation itself sorts by its key
+    return row.pk if hasattr(row, '_meta') else row
+
+
+def _encode_value(value):
+    if isinstance(value, (datetime.date, datetime.time)):
+        # Full precision; truncating microseconds would skip or repeat rows
+        return value.isoformat()
+    if isinstance(value, (Decimal, UUID)):
+        return str(value)
+    return value
+
+
+def _encode_cursor(keys, values):
+    data = {'o': [path for path, _ in keys], 'v': [_encode_value(value) for value in values]}
+    raw = json.dumps(data, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def _decode_cursor(cursor, keys, queryset):
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if data['o'] != [path for path, _ in keys] or len(data['v']) != len(keys):
+            raise InvalidPageRequest("Cursor does not belong to this listing")
+        return [
+            None if value is None else _key_field(queryset, path).to_python(value)
+            for (path, _), value in zip(keys, data['v'])
+        ]
+    except InvalidPageRequest:
+        raise
+    except Exception:
+        raise InvalidPageRequest("Invalid cursor")
+
+
+def _after(keys, values, queryset):
+    """Q matching the rows that sort after `values`"""
+    condition = Q(pk__in=[])
+    equal = Q()
+    for (path, descending), value in zip(keys, values):
+        nullable = _key_field(queryset, path).null or '__' in path
+        if descending:
+            # Descending with NULLs last: after v is anything smaller, then NULL
+            if value is not None:
+                later = Q(**{f'{path}__lt': value})
+                if nullable:
+                    later |= Q(**{f'{path}__isnull': True})
+                condition |= equal & later
+        else:
+            # Ascending with NULLs first: after NULL is any value
+            later = Q(**{f'{path}__isnull': False}) if value is None else Q(**{f'{path}__gt': value})
+            condition |= equal & later
+        equal &= Q(**{f'{path}__isnull': True}) if value is None else Q(**{path: value})
+    return condition
+
+
+def order_by_keyset(queryset):
+    """Order `queryset` by its full keyset; returns (queryset, keys)"""
+    keys = _ordering(queryset)
+    queryset = queryset.order_by(*[
+        F(path).desc(nulls_last=True) if descending else F(path).asc(nulls_first=True)
+        for path, descending in keys
+    ])
+    return queryset, keys
+
+
+def wants_page(request):
+    """Whether the client asked for a page (`limit` or `cursor`) rather than the full list"""
+    return 'limit' in request.query_params or 'cursor' in request.query_params
+
+
+def keyset_paginate(queryset, cursor=None, limit=None):
+    """Return (rows, next_cursor) for one page of `queryset` ordered by its keyset.
+
+    Raises InvalidPageRequest for a bad cursor or limit.
+    """
+    try:
+        limit = DEFAULT_PAGE_SIZE if limit in (None, '') else int(limit)
+    except (TypeError, ValueError):
+        raise InvalidPageRequest("limit must be an integer")
+    if not 1 <= limit <= MAX_PAGE_SIZE:
+        raise InvalidPageRequest(f"limit must be between 1 and {MAX_PAGE_SIZE}")
+
+    queryset, keys = order_by_keyset(queryset)
+    if cursor:
+        queryset = queryset.filter(_after(keys, _decode_cursor(cursor, keys, queryset), queryset))
+
+    rows = list(queryset[:limit + 1])
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, _encode_cursor(keys, [_row_value(rows[-1], path) for path, _ in keys])
+
+
+def list_response(request, queryset, to_dto):
+    """Respond with every row as a list, or with one keyset page when `limit`/`cursor` is given"""
+    if not wants_page(request):
+        # Same order as the pages, so ties do not shuffle between the two forms
+        queryset, _ = order_by_keyset(queryset)
+        return Response([to_dto(row) for row in queryset], status=status.HTTP_200_OK)
+
+    try:
+        rows, next_cursor = keyset_paginate(
+            queryset,
+            request.query_params.get('cursor'),
+            request.query_params.get('limit')
+        )
+    except InvalidPageRequest as e:
+        return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    return Response({
+        'results': [to_dto(row) for row in rows],
+        'next': next_cursor
+    }, status=status.HTTP_200_OK)
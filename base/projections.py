@@ -0,0 +1,29 @@
+from drf_yasg import openapi
+
+
+# ============================================================================
+# LIST PROJECTIONS
+# ============================================================================
+#
+# List endpoints return a slim row by default: the columns a listing card
+# needs, loaded with only(), without rich text, SEO or JSON-LD fields.
+# `?view=full` restores the complete per-row shape for clients that need it.
+
+LIST_VIEWS = ('list', 'full')
+
+VIEW_PARAMETER = openapi.Parameter(
+    'view',
+    openapi.IN_QUERY,
+    description="`list` (default) returns slim rows without rich-text and SEO fields; `full` returns every field",
+    type=openapi.TYPE_STRING,
+    enum=list(LIST_VIEWS),
+    required=False
+)
+
+
+def wants_full_view(request):
+    """Whether the client asked for ?view=full. Raises ValueError for an unknown view"""
+    view = request.query_params.get('view') or 'list'
+    if view not in LIST_VIEWS:
+        raise ValueError(f"Unknown view '{view}'. Valid views are: {', '.join(LIST_VIEWS)}")
+    return view == 'full'
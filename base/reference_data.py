@@ -0,0 +1,65 @@
+import hashlib
+import json
+from base.local_cache import BoundedTTLCache, MISSING
+from base.response_cache import model_versions
+
+
+# ============================================================================
+# REFERENCE DATA
+# ============================================================================
+#
+# Designations, committee categories, tags, companies and the department
+# list are small and change rarely, but the pages that list them are not
+# worth a MySQL round trip each time. Each is declared next to its DTO
+# function as a ReferenceTable and kept in process memory as a list of DTOs,
+# tagged with its model's content version from base/response_cache.py. The
+# signal handlers in base/signals.py store a new version on every save or
+# delete, and the next get() in any process reloads the table. File fields
+# are kept as storage names, which the content hash covers, and turned into
+# URLs per call, since S3 URLs are signed and expire. Tables over
+# REFERENCE_TABLE_MAX_ROWS are never kept, and REFERENCE_DATA_TIMEOUT bounds
+# staleness where the Django cache is not shared between processes.
+
+REFERENCE_DATA_TIMEOUT = 300
+REFERENCE_TABLE_MAX_ROWS = 1000
+
+_tables = BoundedTTLCache(max_entries=32, timeout=REFERENCE_DATA_TIMEOUT)
+
+
+def content_hash(data):
+    """Stable hash of JSON-like data, the same in every process for the same content"""
+    encoded = json.dumps(data, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha1(encoded.encode()).hexdigest()
+
+
+class ReferenceTable:
+    """Rows of a small model, as DTOs, loaded once per content version and process"""
+
+    def __init__(self, name, model, load, file_fields=()):
+        """`load` returns the DTOs, with the storage name in each of the `file_fields`"""
+        self.name = name
+        self.model = model
+        self.load = load
+        self.storages = {field: model._meta.get_field(field).storage for field in file_fields}
+
+    def _resolved(self, row):
+        row = dict(row)
+        for field, storage in self.storages.items():
+            if row[field]:
+                row[field] = storage.url(row[field])
+        return row
+
+    def get(self):
+        """(copies of the table's DTOs with file URLs, content hash of the stored DTOs)"""
+        version = model_versions((self.model,))[0]
+        entry = _tables.get(self.name)
+        if entry is MISSING or entry[0] != version:
+            rows = list(self.load())
+            entry = (version, rows, content_hash(rows))
+            if len(rows) <= REFERENCE_TABLE_MAX_ROWS:
+                _tables.set(self.name, entry)
+        return [self._resolved(row) for row in entry[1]], entry[2]
+
+    def rows(self):
+        """Copies of the table's DTOs"""
+        return self.get()[0]
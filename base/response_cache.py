@@ -0,0 +1,236 @@
+import functools
+import hashlib
+import time
+import uuid
+from urllib.parse import urlencode
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.cache import patch_cache_control
+from django.utils.http import http_date, parse_etags, parse_http_date_safe, quote_etag
+from rest_framework import status
+from rest_framework.response import Response
+
+
+# ============================================================================
+# RESPONSE CACHE
+# ============================================================================
+#
+# Public GET endpoints keep their response data in the Django cache, keyed by
+# path, normalized query string and the current content version of every
+# model the endpoint declares with @cache_response(...). The signal handlers
+# in base/signals.py store a new version for a model whenever one of its rows
+# is saved or deleted, so exactly the entries of the endpoints that depend on
+# it stop matching; entries of other endpoints stay cached. The timeout only
+# clears orphaned entries and bounds staleness where the cache is not shared
+# between processes.
+#
+# The same versions are the conditional GET validators: the ETag is the hash
+# behind the cache key and Last-Modified the time of the newest version, so
+# If-None-Match / If-Modified-Since requests are answered with 304 before the
+# cache or the database is read for the payload. Response data holds
+# presigned S3 URLs, which expire AWS_QUERYSTRING_EXPIRE seconds after they
+# are signed, so the validators and the cache key also change with every
+# RESPONSE_CACHE_URL_BUCKET seconds of wall time; a client revalidating in
+# a new bucket gets a body with freshly signed URLs.
+#
+# A miss is rebuilt by one worker at a time (single flight): the first takes
+# a lock key with a lease timeout via cache.add(), the others serve the last
+# response built for the same URL under older versions, or, if there is none,
+# poll briefly for the new entry. The lease frees the key if the builder dies;
+# a waiter that gives up builds the response itself.
+
+RESPONSE_CACHE_PREFIX = 'base:response'
+MODEL_VERSION_PREFIX = 'base:model_version'
+RESPONSE_CACHE_LOCK_PREFIX = 'base:response_lock'
+RESPONSE_CACHE_TIMEOUT = getattr(settings, 'RESPONSE_CACHE_TIMEOUT', 60 * 5)
+# Lifetime of the presigned storage URLs in response data (django-storages' default is one hour)
+SIGNED_URL_LIFETIME = getattr(settings, 'AWS_QUERYSTRING_EXPIRE', 60 * 60)
+# Last good response per URL, served while a newer version is being built; kept
+# well inside SIGNED_URL_LIFETIME so its URLs are still valid when delivered
+RESPONSE_CACHE_STALE_TIMEOUT = getattr(settings, 'RESPONSE_CACHE_STALE_TIMEOUT', SIGNED_URL_LIFETIME // 4)
+# Seconds a builder holds the lock at most, and a waiter waits for it at most
+RESPONSE_CACHE_LOCK_TIMEOUT = getattr(settings, 'RESPONSE_CACHE_LOCK_TIMEOUT', 10)
+RESPONSE_CACHE_WAIT = getattr(settings, 'RESPONSE_CACHE_WAIT', 2)
+# Validators roll over this often, well inside SIGNED_URL_LIFETIME
+RESPONSE_CACHE_URL_BUCKET = getattr(settings, 'RESPONSE_CACHE_URL_BUCKET', SIGNED_URL_LIFETIME // 4)
+RESPONSE_CACHE_POLL_INTERVAL = 0.05
+
+
+def model_version_key(model):
+    return f'{MODEL_VERSION_PREFIX}:{model._meta.label_lower}'
+
+
+def new_version():
+    """Content version token: the current time plus a random part"""
+    return f'{time.time():.6f}-{uuid.uuid4().hex[:8]}'
+
+
+def version_time(version):
+    """Seconds since the epoch when a version was stored, or None for a malformed token"""
+    try:
+        return float(version.split('-', 1)[0])
+    except ValueError:
+        return None
+
+
+def bump_model_versions(*models):
+    """Store a new content version for each model, invalidating the responses that depend on it"""
+    cache.set_many({model_version_key(model): new_version() for model in models}, None)
+
+
+def model_versions(models):
+    """Current content version of each model (one cache round trip once they exist)"""
+    keys = [model_version_key(model) for model in models]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            cache.add(key, new_version(), None)
+            versions[key] = cache.get(key)
+    return [versions[key] for key in keys]
+
+
+def url_bucket():
+    """Number of the current RESPONSE_CACHE_URL_BUCKET period"""
+    return int(time.time() // RESPONSE_CACHE_URL_BUCKET)
+
+
+def normalized_query_string(query_params):
+    """Query string with parameters and repeated values sorted, so equivalent URLs share a key"""
+    return urlencode(sorted(
+        (key, value) for key in query_params for value in query_params.getlist(key)
+    ))
+
+
+def response_digest(request, versions, bucket=None):
+    """Hash of a request's path, normalized query string, the content versions it depends on and the URL bucket"""
+    raw = f"{request.path}?{normalized_query_string(request.query_params)}#{':'.join(versions)}"
+    if bucket is not None:
+        raw += f"@{bucket}"
+    return hashlib.sha1(raw.encode()).hexdigest()
+
+
+def last_modified(versions, bucket):
+    """Last-Modified timestamp for the given versions and URL bucket (None if a version is malformed)"""
+    times = [version_time(version) for version in versions]
+    if None in times:
+        return None
+    return int(max(times + [bucket * RESPONSE_CACHE_URL_BUCKET]))
+
+
+def is_not_modified(request, etag, modified):
+    """Whether the client's validators still match; If-None-Match wins over If-Modified-Since"""
+    if_none_match = request.META.get('HTTP_IF_NONE_MATCH')
+    if if_none_match:
+        # Weak comparison, as RFC 9110 requires for If-None-Match
+        tags = parse_etags(if_none_match)
+        return '*' in tags or etag.removeprefix('W/') in [tag.removeprefix('W/') for tag in tags]
+    if_modified_since = parse_http_date_safe(request.META.get('HTTP_IF_MODIFIED_SINCE') or '')
+    return modified is not None and if_modified_since is not None and modified <= if_modified_since
+
+
+def set_validators(response, etag, modified):
+    response['ETag'] = etag
+    if modified is not None:
+        response['Last-Modified'] = http_date(modified)
+    return response
+
+
+def acquire_build_lock(key):
+    """Lock token if this worker may build `key`, None if another worker holds the lease"""
+    token = uuid.uuid4().hex
+    if cache.add(f'{RESPONSE_CACHE_LOCK_PREFIX}:{key}', token, RESPONSE_CACHE_LOCK_TIMEOUT):
+        return token
+    return None
+
+
+def build_lock_holder(key):
+    """Token of the worker building `key`, or None; read past any per-process copy the backend keeps"""
+    lock_key = f'{RESPONSE_CACHE_LOCK_PREFIX}:{key}'
+    # CompressedDatabaseCache (base/db_cache.py) would otherwise answer from its
+    # LRU for longer than RESPONSE_CACHE_WAIT
+    get = getattr(cache, 'get_shared', cache.get)
+    return get(lock_key)
+
+
+def release_build_lock(key, token):
+    lock_key = f'{RESPONSE_CACHE_LOCK_PREFIX}:{key}'
+    # Leave the lock alone if the lease ran out and another worker took it
+    if build_lock_holder(key) == token:
+        cache.delete(lock_key)
+
+
+def wait_for_build(key):
+    """Data another worker stores under `key`, or None if it gives up or RESPONSE_CACHE_WAIT passes"""
+    deadline = time.monotonic() + RESPONSE_CACHE_WAIT
+    while time.monotonic() < deadline:
+        time.sleep(RESPONSE_CACHE_POLL_INTERVAL)
+        data = cache.get(key)
+        if data is not None:
+            return data
+        if build_lock_holder(key) is None:
+            # The builder finished without a cacheable response
+            return None
+    return None
+
+
+def cache_response(*models, timeout=None):
+    """Cache a GET view's successful response data until one of `models` changes.
+
+    Goes below @api_view, so cached data is still content negotiated and
+    rendered by DRF. Successful responses carry ETag and Last-Modified, and
+    matching conditional requests get a 304. Concurrent misses of the same
+    response are built once. Error responses and other methods are never
+    cached.
+    """
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(request, *args, **kwargs):
+            if request.method not in ('GET', 'HEAD'):
+                return view(request, *args, **kwargs)
+
+            versions = model_versions(models)
+            bucket = url_bucket()
+            digest = response_digest(request, versions, bucket)
+            # Weak: the same data is rendered as JSON or as the browsable API
+            etag = 'W/' + quote_etag(digest)
+            modified = last_modified(versions, bucket)
+            if is_not_modified(request, etag, modified):
+                return set_validators(Response(status=status.HTTP_304_NOT_MODIFIED), etag, modified)
+
+            key = f'{RESPONSE_CACHE_PREFIX}:{digest}'
+            data = cache.get(key)
+            if data is not None:
+                return set_validators(Response(data), etag, modified)
+
+            stale_key = f'{RESPONSE_CACHE_PREFIX}:stale:{response_digest(request, ())}'
+            token = acquire_build_lock(key)
+            if token is None:
+                data = cache.get(stale_key)
+                if data is not None:
+                    # Older content: no validators and no-store, so neither clients nor the edge keep it
+                    response = Response(data)
+                    patch_cache_control(response, no_store=True)
+                    return response
+                data = wait_for_build(key)
+            else:
+                # The previous builder may have finished between the miss and the lock
+                data = cache.get(key)
+            if data is not None:
+                if token is not None:
+                    release_build_lock(key, token)
+                return set_validators(Response(data), etag, modified)
+
+            try:
+                response = view(request, *args, **kwargs)
+                if response.status_code != 200:
+                    return response
+                cache.set(key, response.data, RESPONSE_CACHE_TIMEOUT if timeout is None else timeout)
+                cache.set(stale_key, response.data, RESPONSE_CACHE_STALE_TIMEOUT)
+            finally:
+                if token is not None:
+                    release_build_lock(key, token)
+            return set_validators(response, etag, modified)
+
+        wrapper.cache_models = models
+        return wrapper
+    return decorator
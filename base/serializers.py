@@ -5,5 +5,13 @@ from .models.department_model import DepartmentStatistics
 class DepartmentStatisticsSerializer(serializers.ModelSerializer):
     class Meta:
         model = DepartmentStatistics
-        fields = ['id', 'department', 'name', 'number', 'suffix', 'description', 'featured', 'display_order']
+        fields = ['id', 'department', 'name', 'number', 'suffix', 'featured', 'display_order']
         read_only_fields = ['id']
+
+
+class DepartmentStatisticsBulkSerializer(DepartmentStatisticsSerializer):
+    """One item of a bulk statistics write: items with an `id` update that row, the rest are created"""
+    id = serializers.IntegerField(required=False)
+
+    class Meta(DepartmentStatisticsSerializer.Meta):
+        read_only_fields = ['department']
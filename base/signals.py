@@ -0,0 +1,337 @@
+from django.apps import apps
+from django.db import transaction
+from django.db.models.signals import post_init, post_save, post_delete, pre_delete, m2m_changed
+from django.dispatch import receiver
+from base.models.achivements_model import CollegeAchievement, StudentAchievement
+from base.models.carrer_model import Company
+from base.models.course_model import Course, NumberDataATD
+from base.models.department_model import (
+    Department, AboutDepartment, NumberData, QuickLink,
+    ProgramOffered, Curriculum, DepartmentContact,
+    CTA, Facility, Banner, DepartmentStatistics
+)
+from base.models.faculty_model import Faculty, Designation, UNRANKED
+from base.models.news_events_models import NewsEvents, ImageModel, TagModel, NewsSearchTerm
+from base.models.cache_model import CacheEntry
+from base.models.search_model import SearchDocument, SearchDocumentTerm
+from base.models.placement_name_model import PlacementName, ResearchName
+from base.autocomplete import bump_autocomplete_version
+from base.department_lookup import clear_department_lookups
+from base.department_page import rebuild_department_snapshot
+from base.fuzzy_names import bump_faculty_names_version
+from base.home_page import clear_home_page
+from base.local_cache import MISSING
+from base.news_search import index_news_events
+from base.response_cache import bump_model_versions
+from base.site_search import index_search_documents
+
+
+# ============================================================================
+# DEPARTMENT LOOKUPS
+# ============================================================================
+
+@receiver(post_save, sender=Department)
+@receiver(post_delete, sender=Department)
+def department_lookups_changed(sender, instance, **kwargs):
+    # Clear now for this request and again after commit, so a lookup racing
+    # the transaction cannot keep the old row cached
+    clear_department_lookups()
+    transaction.on_commit(clear_department_lookups)
+
+
+# ============================================================================
+# DEPARTMENT PAGE SNAPSHOTS
+# ============================================================================
+
+DEPARTMENT_SECTION_MODELS = (
+    AboutDepartment, QuickLink, ProgramOffered, Curriculum,
+    DepartmentContact, CTA, Facility, Banner, DepartmentStatistics
+)
+
+
+def schedule_snapshot_rebuild(department_id):
+    """Rebuild a department snapshot once the current transaction commits"""
+    if department_id:
+        transaction.on_commit(lambda: rebuild_department_snapshot(department_id))
+
+
+@receiver(post_save, sender=Department)
+@receiver(post_delete, sender=Department)
+def department_changed(sender, instance, **kwargs):
+    schedule_snapshot_rebuild(instance.id)
+
+
+@receiver(post_init, sender=NumberData)
+def remember_snapshot_parent(sender, instance, **kwargs):
+    # The department (or about section) a row was loaded with, so moving it rebuilds both pages
+    field = 'about_department_id' if sender is NumberData else 'department_id'
+    instance._snapshot_parent_id = instance.__dict__.get(field)
+
+
+def department_section_changed(sender, instance, **kwargs):
+    for department_id in {instance._snapshot_parent_id, instance.department_id}:
+        schedule_snapshot_rebuild(department_id)
+    instance._snapshot_parent_id = instance.department_id
+
+
+for section_model in DEPARTMENT_SECTION_MODELS:
+    post_init.connect(remember_snapshot_parent, sender=section_model, dispatch_uid=f'snapshot_{section_model.__name__}_init')
+    post_save.connect(department_section_changed, sender=section_model, dispatch_uid=f'snapshot_{section_model.__name__}_saved')
+    post_delete.connect(department_section_changed, sender=section_model, dispatch_uid=f'snapshot_{section_model.__name__}_deleted')
+
+
+@receiver(post_save, sender=NumberData)
+@receiver(post_delete, sender=NumberData)
+def number_data_changed(sender, instance, **kwargs):
+    # When the about section itself is being deleted its own handler covers the department
+    about_ids = {instance._snapshot_parent_id, instance.about_department_id}
+    department_ids = AboutDepartment.objects.filter(
+        id__in=about_ids
+    ).values_list('department_id', flat=True).distinct()
+    for department_id in department_ids:
+        schedule_snapshot_rebuild(department_id)
+    instance._snapshot_parent_id = instance.about_department_id
+
+
+@receiver(post_save, sender=Course)
+@receiver(pre_delete, sender=Course)
+def program_course_changed(sender, instance, **kwargs):
+    # Programs embed the course name and slug; collect before delete nulls the link
+    department_ids = ProgramOffered.objects.filter(
+        course_id=instance.id
+    ).values_list('department_id', flat=True).distinct()
+    for department_id in department_ids:
+        schedule_snapshot_rebuild(department_id)
+
+
+# ============================================================================
+# FACULTY DESIGNATION RANKS
+# ============================================================================
+
+@receiver(pre_delete, sender=Designation)
+def designation_deleted(sender, instance, **kwargs):
+    # SET_NULL clears the designation with an UPDATE that skips Faculty.save(),
+    # so reset the copied rank here
+    instance.faculty_members.update(is_hod=False, designation_rank=UNRANKED)
+
+
+# ============================================================================
+# NEWS SEARCH INDEX
+# ============================================================================
+
+def schedule_news_reindex(news_event_ids):
+    """Re-index news/events in the news and site search after commit (once admin has saved their tags)"""
+    news_event_ids = set(news_event_ids)
+    if news_event_ids:
+        transaction.on_commit(lambda: index_news_events(news_event_ids))
+    schedule_search_reindex('news', news_event_ids)
+
+
+@receiver(post_save, sender=NewsEvents)
+def news_event_saved(sender, instance, **kwargs):
+    schedule_news_reindex([instance.id])
+
+
+@receiver(m2m_changed, sender=NewsEvents.tags.through)
+def news_tags_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if not reverse:
+        if action in ('post_add', 'post_remove', 'post_clear'):
+            schedule_news_reindex([instance.id])
+    elif action in ('post_add', 'post_remove'):
+        schedule_news_reindex(pk_set)
+    elif action == 'pre_clear':
+        # Collect before the links are gone
+        schedule_news_reindex(instance.news_events.values_list('id', flat=True))
+
+
+# Name field of each model that news/events (tags, departments) or site search
+# documents (departments, courses, designations) are indexed by
+INDEXED_NAME_FIELDS = {TagModel: 'tag_name', Department: 'name', Course: 'name', Designation: 'name'}
+
+
+@receiver(post_init, sender=TagModel)
+@receiver(post_init, sender=Department)
+@receiver(post_init, sender=Course)
+@receiver(post_init, sender=Designation)
+def remember_indexed_name(sender, instance, **kwargs):
+    # Absent when the field was deferred; such a save is treated as a rename
+    instance._indexed_name = instance.__dict__.get(INDEXED_NAME_FIELDS[sender], MISSING)
+
+
+@receiver(post_save, sender=TagModel)
+@receiver(post_save, sender=Department)
+@receiver(post_save, sender=Course)
+@receiver(post_save, sender=Designation)
+def indexed_name_saved(sender, instance, created, update_fields, **kwargs):
+    field = INDEXED_NAME_FIELDS[sender]
+    name = getattr(instance, field)
+    renamed = (
+        not created
+        and (update_fields is None or field in update_fields)
+        and instance._indexed_name != name
+    )
+    instance._indexed_name = name
+    if not renamed:
+        return
+    if sender in (TagModel, Department):
+        # News is searchable by tag and department name
+        schedule_news_reindex(instance.news_events.values_list('id', flat=True))
+    if sender in SEARCH_NAME_DEPENDENTS:
+        search_dependents_changed(sender, instance)
+
+
+@receiver(pre_delete, sender=TagModel)
+def tag_deleted(sender, instance, **kwargs):
+    # Deleting a tag drops its links without an m2m_changed signal
+    schedule_news_reindex(instance.news_events.values_list('id', flat=True))
+
+
+# ============================================================================
+# SITE SEARCH DOCUMENTS
+# ============================================================================
+
+# Models with a site search document; news saves are covered by news_event_saved
+SEARCH_DOCUMENT_MODELS = {
+    Department: 'department',
+    Course: 'course',
+    Faculty: 'faculty',
+    NewsEvents: 'news',
+    CollegeAchievement: 'college_achievement',
+    StudentAchievement: 'student_achievement',
+    Company: 'company',
+}
+
+
+def schedule_search_reindex(entity_type, object_ids):
+    """Rebuild site search documents once the current transaction commits"""
+    object_ids = set(object_ids)
+    if object_ids:
+        transaction.on_commit(lambda: index_search_documents(entity_type, object_ids))
+
+
+def search_source_changed(sender, instance, **kwargs):
+    schedule_search_reindex(SEARCH_DOCUMENT_MODELS[sender], [instance.id])
+
+
+for search_model, entity_type in SEARCH_DOCUMENT_MODELS.items():
+    if search_model is not NewsEvents:
+        post_save.connect(search_source_changed, sender=search_model, dispatch_uid=f'search_{entity_type}_saved')
+    post_delete.connect(search_source_changed, sender=search_model, dispatch_uid=f'search_{entity_type}_deleted')
+
+
+# Documents that embed a model's name, as (entity type, related manager) pairs
+SEARCH_NAME_DEPENDENTS = {
+    Department: (
+        ('course', 'courses'),
+        ('faculty', 'faculty_members'),
+        ('college_achievement', 'college_achievements'),
+        ('student_achievement', 'student_achievements'),
+    ),
+    Course: (
+        ('college_achievement', 'college_achievements'),
+        ('student_achievement', 'student_achievements'),
+    ),
+    Designation: (
+        ('faculty', 'faculty_members'),
+    ),
+}
+
+
+@receiver(pre_delete, sender=Department)
+@receiver(pre_delete, sender=Course)
+@receiver(pre_delete, sender=Designation)
+def search_dependents_changed(sender, instance, **kwargs):
+    # Saves only get here through indexed_name_saved, when the name changed
+    for entity_type, related_name in SEARCH_NAME_DEPENDENTS[sender]:
+        schedule_search_reindex(entity_type, getattr(instance, related_name).values_list('id', flat=True))
+
+
+# ============================================================================
+# IN-PROCESS NAME INDEXES
+# ============================================================================
+
+@receiver(post_save, sender=Department)
+@receiver(post_delete, sender=Department)
+@receiver(post_save, sender=Course)
+@receiver(post_delete, sender=Course)
+@receiver(post_save, sender=Faculty)
+@receiver(post_delete, sender=Faculty)
+def autocomplete_names_changed(sender, instance, **kwargs):
+    # Bumped again after commit so no process keeps a trie built mid-transaction
+    bump_autocomplete_version()
+    transaction.on_commit(bump_autocomplete_version)
+
+
+@receiver(post_save, sender=Faculty)
+@receiver(post_delete, sender=Faculty)
+def faculty_names_changed(sender, instance, **kwargs):
+    # Same double bump as the autocomplete version above
+    bump_faculty_names_version()
+    transaction.on_commit(bump_faculty_names_version)
+
+
+def faculty_bulk_written(faculty_ids):
+    """Run the Faculty save follow-ups after a bulk_create/bulk_update, which send no signals"""
+    schedule_search_reindex('faculty', faculty_ids)
+    autocomplete_names_changed(Faculty, None)
+    faculty_names_changed(Faculty, None)
+    content_changed(Faculty)
+
+
+# ============================================================================
+# HOMEPAGE PAYLOAD
+# ============================================================================
+
+# Every table whose rows (or names) appear on the homepage
+HOME_PAGE_MODELS = (
+    Department, DepartmentStatistics, NumberDataATD, PlacementName,
+    ResearchName, NewsEvents, ImageModel, Company
+)
+
+
+def home_page_changed(sender, **kwargs):
+    # Same double clear as the department lookups above
+    clear_home_page()
+    transaction.on_commit(clear_home_page)
+
+
+def statistics_bulk_written(department_id):
+    """Run the statistics save follow-ups after a bulk_create/bulk_update, which send no signals"""
+    schedule_snapshot_rebuild(department_id)
+    home_page_changed(DepartmentStatistics)
+    content_changed(DepartmentStatistics)
+
+
+for home_model in HOME_PAGE_MODELS:
+    post_save.connect(home_page_changed, sender=home_model, dispatch_uid=f'home_{home_model.__name__}_saved')
+    post_delete.connect(home_page_changed, sender=home_model, dispatch_uid=f'home_{home_model.__name__}_deleted')
+m2m_changed.connect(home_page_changed, sender=NewsEvents.images.through, dispatch_uid='home_news_images_changed')
+
+
+# ============================================================================
+# RESPONSE CACHE
+# ============================================================================
+
+# Derived tables written in bulk by the index rebuilds, and the shared cache
+# itself; a receiver on them would also stop Django from fast-deleting their rows
+UNVERSIONED_MODELS = (NewsSearchTerm, SearchDocument, SearchDocumentTerm, CacheEntry)
+
+
+def content_changed(sender, **kwargs):
+    # Bumped again after commit so no response read mid-transaction stays cached
+    bump_model_versions(sender)
+    transaction.on_commit(lambda: bump_model_versions(sender))
+
+
+@receiver(m2m_changed)
+def content_relation_changed(sender, instance, action, model, **kwargs):
+    if instance._meta.app_label == 'base' and action in ('post_add', 'post_remove', 'post_clear'):
+        # Either side of the relation may be serialized with the other
+        for changed_model in (sender, type(instance), model):
+            content_changed(changed_model)
+
+
+for versioned_model in apps.get_app_config('base').get_models():
+    if versioned_model not in UNVERSIONED_MODELS:
+        post_save.connect(content_changed, sender=versioned_model, dispatch_uid=f'version_{versioned_model.__name__}_saved')
+        post_delete.connect(content_changed, sender=versioned_model, dispatch_uid=f'version_{versioned_model.__name__}_deleted')
@@ -0,0 +1,250 @@
+from django.db import transaction
+from django.db.models import Exists, IntegerField, OuterRef, Q, Subquery, Sum
+from django.db.models.functions import Coalesce
+from django.utils.text import Truncator
+from base.models.achivements_model import CollegeAchievement, StudentAchievement
+from base.models.carrer_model import Company
+from base.models.course_model import Course
+from base.models.department_model import Department
+from base.models.faculty_model import Faculty
+from base.models.news_events_models import NewsEvents
+from base.models.search_model import SearchDocument, SearchDocumentTerm
+from base.utils import plain_text, search_words, weigh_search_terms
+
+
+# ============================================================================
+# SITE SEARCH
+# ============================================================================
+#
+# The site search box used to call five search endpoints per keystroke. All
+# searchable objects now have a row in SearchDocument (type, id, title,
+# subtitle, slug) and their weighted words in SearchDocumentTerm, so one
+# query answers a search across every type. Matching and ranking work like
+# the news index (base/news_search.py): every query word must match a term
+# prefix, and documents are ranked by the summed weight of matched terms.
+# The signal handlers in base/signals.py re-index objects after commit; the
+# rebuild_search_documents command rebuilds whole types in bulk.
+
+# Weight of one occurrence of a word in a document's title, its related
+# names (department, designation, course, tags) and its body text
+TITLE_WEIGHT = 10
+RELATED_WEIGHT = 3
+BODY_WEIGHT = 1
+
+DEFAULT_SEARCH_LIMIT = 20
+MAX_SEARCH_LIMIT = 50
+
+
+def _name(related):
+    return related.name if related else None
+
+
+def department_document(department):
+    return {
+        'title': department.name,
+        'slug': department.slug,
+        'texts': ((department.name, TITLE_WEIGHT),),
+    }
+
+
+def course_document(course):
+    return {
+        'title': course.name,
+        'subtitle': _name(course.department),
+        'slug': course.slug,
+        'texts': ((course.name, TITLE_WEIGHT), (_name(course.department), RELATED_WEIGHT)),
+    }
+
+
+def faculty_document(faculty):
+    return {
+        'title': faculty.name,
+        'subtitle': _name(faculty.designation),
+        'slug': faculty.slug,
+        'texts': (
+            (faculty.name, TITLE_WEIGHT),
+            (_name(faculty.designation), RELATED_WEIGHT),
+            (_name(faculty.department), RELATED_WEIGHT),
+        ),
+    }
+
+
+def news_document(news_event):
+    if not news_event.is_published:
+        return None
+    return {
+        'title': news_event.heading,
+        'subtitle': news_event.get_category_display(),
+        'slug': news_event.slug,
+        'texts': (
+            (news_event.heading, TITLE_WEIGHT),
+            (' '.join(tag.tag_name for tag in news_event.tags.all() if tag.tag_name), RELATED_WEIGHT),
+            (_name(news_event.department), RELATED_WEIGHT),
+            (news_event.content, BODY_WEIGHT),
+        ),
+    }
+
+
+def college_achievement_document(achievement):
+    # College achievements have no name; the start of the description stands in
+    return {
+        'title': Truncator(plain_text(achievement.description)).chars(120),
+        'subtitle': _name(achievement.department),
+        'texts': (
+            (_name(achievement.department), RELATED_WEIGHT),
+            (_name(achievement.course), RELATED_WEIGHT),
+            (achievement.description, BODY_WEIGHT),
+        ),
+    }
+
+
+def student_achievement_document(achievement):
+    return {
+        'title': achievement.achievement_name or Truncator(plain_text(achievement.description)).chars(120),
+        'subtitle': _name(achievement.department),
+        'texts': (
+            (achievement.achievement_name, TITLE_WEIGHT),
+            (_name(achievement.department), RELATED_WEIGHT),
+            (_name(achievement.course), RELATED_WEIGHT),
+            (achievement.description, BODY_WEIGHT),
+        ),
+    }
+
+
+def company_document(company):
+    return {
+        'title': company.name,
+        'texts': ((company.name, TITLE_WEIGHT), (company.description, BODY_WEIGHT)),
+    }
+
+
+# entity type -> (queryset loading everything the builder reads, document builder).
+# A builder returns None for objects that must not appear in search.
+SEARCH_SOURCES = {
+    'department': (
+        lambda: Department.objects.only('name', 'slug'),
+        department_document
+    ),
+    'course': (
+        lambda: Course.objects.select_related('department').only('name', 'slug', 'department', 'department__name'),
+        course_document
+    ),
+    'faculty': (
+        lambda: Faculty.objects.select_related('designation', 'department').only(
+            'name', 'slug', 'designation', 'designation__name', 'department', 'department__name'
+        ),
+        faculty_document
+    ),
+    'news': (
+        lambda: NewsEvents.objects.select_related('department').only(
+            'heading', 'slug', 'category', 'content', 'is_published', 'department', 'department__name'
+        ).prefetch_related('tags'),
+        news_document
+    ),
+    'college_achievement': (
+        lambda: CollegeAchievement.objects.select_related('department', 'course').only(
+            'description', 'department', 'department__name', 'course', 'course__name'
+        ),
+        college_achievement_document
+    ),
+    'student_achievement': (
+        lambda: StudentAchievement.objects.select_related('department', 'course').only(
+            'achievement_name', 'description', 'department', 'department__name', 'course', 'course__name'
+        ),
+        student_achievement_document
+    ),
+    'company': (
+        lambda: Company.objects.only('name', 'description'),
+        company_document
+    ),
+}
+
+
+def index_search_documents(entity_type, object_ids=None):
+    """Rebuild the search documents of one type, for the given IDs or (None) all of them.
+
+    Objects that no longer exist or are excluded from search lose their
+    document. Returns the number of documents stored.
+    """
+    queryset, to_document = SEARCH_SOURCES[entity_type]
+    rows = queryset()
+    existing = SearchDocument.objects.filter(entity_type=entity_type)
+    if object_ids is not None:
+        object_ids = list(object_ids)
+        rows = rows.filter(id__in=object_ids)
+        existing = existing.filter(object_id__in=object_ids)
+
+    documents, terms = [], {}
+    for row in rows:
+        document = to_document(row)
+        if document is None:
+            continue
+        documents.append(SearchDocument(
+            entity_type=entity_type,
+            object_id=row.id,
+            title=(document['title'] or '')[:255],
+            subtitle=(document.get('subtitle') or '')[:255],
+            slug=document.get('slug') or None
+        ))
+        terms[row.id] = weigh_search_terms(document['texts'])
+
+    with transaction.atomic():
+        existing.delete()
+        SearchDocument.objects.bulk_create(documents, batch_size=500)
+        # bulk_create does not return primary keys on MySQL, so read them back
+        document_ids = dict(existing.values_list('object_id', 'id'))
+        SearchDocumentTerm.objects.bulk_create([
+            SearchDocumentTerm(document_id=document_ids[object_id], term=term, weight=weight)
+            for object_id, weights in terms.items()
+            for term, weight in weights.items()
+        ], batch_size=1000)
+    return len(documents)
+
+
+def parse_search_types(types, valid_types=SEARCH_SOURCES):
+    """Entity types from a comma-separated ?types= value (all when empty); raises ValueError"""
+    if not types:
+        return list(valid_types)
+    requested = [entity_type.strip() for entity_type in types.split(',') if entity_type.strip()]
+    invalid = [entity_type for entity_type in requested if entity_type not in valid_types]
+    if invalid:
+        raise ValueError(
+            f"Invalid types: {', '.join(invalid)}. Valid types are: {', '.join(valid_types)}"
+        )
+    return requested
+
+
+def search_documents(query, types=None, limit=DEFAULT_SEARCH_LIMIT):
+    """Best matching search documents for `query`, as type-tagged result dicts"""
+    words = list(dict.fromkeys(search_words(query)))
+    if not words:
+        return []
+
+    documents = SearchDocument.objects.all()
+    if types:
+        documents = documents.filter(entity_type__in=types)
+
+    # Terms are stored folded, so the case-insensitive prefix lookup is exact
+    # and compiles to a plain LIKE 'word%' that can use the term index
+    terms = SearchDocumentTerm.objects.filter(document=OuterRef('pk'))
+    matched = Q()
+    for word in words:
+        documents = documents.filter(Exists(terms.filter(term__istartswith=word)))
+        matched |= Q(term__istartswith=word)
+
+    rank = terms.filter(matched).values('document').annotate(total=Sum('weight')).values('total')
+    documents = documents.annotate(
+        rank=Coalesce(Subquery(rank, output_field=IntegerField()), 0)
+    ).order_by('-rank', 'title', 'id')[:limit]
+
+    return [
+        {
+            'type': document.entity_type,
+            'id': document.object_id,
+            'title': document.title,
+            'subtitle': document.subtitle or None,
+            'slug': document.slug,
+            'rank': document.rank,
+        }
+        for document in documents
+    ]
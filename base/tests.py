@@ -1,3 +1,1486 @@
-from django.test import TestCase
+import datetime
+import json
+import os
+import tempfile
+import threading
+import time
+from io import StringIO
+from unittest import mock
 
-# Create your tests here.
+from django.core.cache import cache
+from django.core.management import call_command
+from django.http import HttpResponse
+from django.db import connection
+from django.test import RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.http import parse_http_date
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from base.autocomplete import build_trie
+from base.urls import CONTENT
+from base.db_cache import CompressedDatabaseCache, encode_value
+from base.department_lookup import find_department
+from base.pagination import keyset_paginate
+from base.response_cache import (
+    RESPONSE_CACHE_LOCK_PREFIX, RESPONSE_CACHE_PREFIX, RESPONSE_CACHE_URL_BUCKET, acquire_build_lock,
+    bump_model_versions, cache_response, model_versions, release_build_lock, url_bucket, wait_for_build
+)
+from base.site_search import SEARCH_SOURCES, index_search_documents
+from base.views.faculty_views import DESIGNATION_TABLE
+from base.utils import normalize_name, unique_slug
+from base.department_page import (
+    DEPARTMENT_PAGE_SECTIONS, department_page_queryset, department_page_to_dto, get_department_page,
+    get_department_pages
+)
+from base.models.achivements_model import StudentAchievement
+from base.models.carrer_model import Company
+from base.models.course_model import (
+    Course, AboutTheCourseModel, NumberDataATD, QuickLinksModel,
+    SubjectsModel, LabModel, CurriculumModel, BenefitsModel,
+    CourseContact, CTAModel, CourseBanner, POPSOPEO
+)
+from base.models.department_model import (
+    Department, AboutDepartment, NumberData, QuickLink,
+    ProgramOffered, Curriculum, DepartmentContact,
+    CTA, Facility, Banner, DepartmentStatistics, DepartmentSnapshot
+)
+from base.models.faculty_model import Faculty, Designation
+from base.models.news_events_models import NewsEvents, ImageModel, TagModel
+from base.models.cache_model import CacheEntry
+from base.models.search_model import SearchDocument
+
+# Django's in-memory cache, for tests whose query counts or threads assume a
+# cache that never touches the database
+LOCMEM_CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+# The shared cache used in production, for tests that exercise it end to end
+COMPRESSED_DB_CACHES = {
+    'default': {
+        'BACKEND': 'base.db_cache.CompressedDatabaseCache',
+        'LOCATION': 'tests-default',
+        'OPTIONS': {'CULL_PROBABILITY': 0},
+    }
+}
+
+
+def create_department_sections(department, count, start=0):
+    """Attach `count` rows of every detail page section to a department"""
+    for i in range(start, start + count):
+        about = AboutDepartment.objects.create(department=department, heading=f"About {i}")
+        NumberData.objects.create(about_department=about, number=str(i), text="Labs")
+        NumberData.objects.create(about_department=about, number=str(i * 10), text="Papers")
+        QuickLink.objects.create(department=department, name=f"Link {i}", link="/link/")
+        course = Course.objects.create(name=f"{department.name} Course {i}", slug=f"{department.slug}-course-{i}")
+        ProgramOffered.objects.create(department=department, course=course, display_order=i)
+        Curriculum.objects.create(department=department, title=f"Regulation {i}")
+        DepartmentContact.objects.create(department=department, name=f"Contact {i}")
+        CTA.objects.create(department=department, heading=f"Apply {i}")
+        Facility.objects.create(department=department, heading=f"Lab {i}")
+        Banner.objects.create(department=department, alt=f"Banner {i}")
+        DepartmentStatistics.objects.create(department=department, name=f"Stat {i}", number=i)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class DepartmentPageQueryBudgetTests(TestCase):
+    # One query for the department plus one per prefetched relation
+    QUERY_BUDGET = 11
+
+    def setUp(self):
+        self.department = Department.objects.create(name="Computer Science", slug="cse")
+
+    def assemble(self):
+        with self.assertNumQueries(self.QUERY_BUDGET):
+            department = department_page_queryset().get(id=self.department.id)
+            return department_page_to_dto(department)
+
+    def test_query_count_does_not_grow_with_sections(self):
+        create_department_sections(self.department, 1)
+        self.assertEqual(len(self.assemble()['about_sections']), 1)
+
+        create_department_sections(self.department, 5, start=1)
+        data = self.assemble()
+        self.assertEqual(len(data['about_sections']), 6)
+        self.assertEqual(len(data['about_sections'][0]['numbers']), 2)
+        self.assertEqual(len(data['programs']), 6)
+        self.assertEqual(data['programs'][0]['course']['slug'], 'cse-course-0')
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class DepartmentSnapshotTests(TestCase):
+    def setUp(self):
+        self.department = Department.objects.create(name="Computer Science", slug="cse")
+        create_department_sections(self.department, 2)
+
+    def get_detail(self, department_id):
+        return self.client.get(reverse('base:department_detail', args=[department_id]))
+
+    def test_detail_is_served_from_snapshot(self):
+        first = self.get_detail(self.department.slug)
+        self.assertTrue(DepartmentSnapshot.objects.filter(department=self.department).exists())
+
+        with self.assertNumQueries(1):
+            response = self.get_detail(self.department.id)
+        self.assertEqual(response.json(), first.json())
+        with self.assertNumQueries(1):
+            self.get_detail(self.department.slug)
+
+    def test_section_changes_rebuild_snapshot(self):
+        self.get_detail(self.department.id)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Banner.objects.create(department=self.department, alt="New banner")
+        self.assertEqual(len(self.get_detail(self.department.id).json()['banners']), 3)
+
+        about = self.department.about_sections.first()
+        with self.captureOnCommitCallbacks(execute=True):
+            NumberData.objects.create(about_department=about, number="7", text="Awards")
+        self.assertEqual(len(self.get_detail(self.department.id).json()['about_sections'][0]['numbers']), 3)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.department.name = "Computer Science and Engineering"
+            self.department.slug = "cse-new"
+            self.department.save()
+        self.assertEqual(self.get_detail('cse-new').json()['name'], "Computer Science and Engineering")
+
+    def test_course_rename_rebuilds_program_entries(self):
+        self.get_detail(self.department.id)
+        course = self.department.programs.first().course
+
+        with self.captureOnCommitCallbacks(execute=True):
+            course.name = "Renamed Course"
+            course.save()
+        self.assertEqual(self.get_detail(self.department.id).json()['programs'][0]['course']['name'], "Renamed Course")
+
+    def test_moved_sections_rebuild_both_snapshots(self):
+        other = Department.objects.create(name="Civil Engineering", slug="civil")
+        create_department_sections(other, 1)
+        self.get_detail(self.department.id)
+        self.get_detail(other.id)
+
+        banner = Banner.objects.filter(department=self.department).first()
+        number = NumberData.objects.filter(about_department__department=self.department).first()
+        with self.captureOnCommitCallbacks(execute=True):
+            banner.department = other
+            banner.save()
+            number.about_department = other.about_sections.first()
+            number.save()
+
+        self.assertEqual(len(self.get_detail(self.department.id).json()['banners']), 1)
+        self.assertEqual(len(self.get_detail(other.id).json()['banners']), 2)
+        numbers = [
+            len(section['numbers']) for section in self.get_detail(self.department.id).json()['about_sections']
+        ]
+        self.assertEqual(numbers, [1, 2])
+        self.assertEqual(len(self.get_detail(other.id).json()['about_sections'][0]['numbers']), 3)
+
+    def test_department_delete_removes_snapshot(self):
+        self.get_detail(self.department.id)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.department.delete()
+        self.assertFalse(DepartmentSnapshot.objects.exists())
+
+    def test_unknown_department_returns_404(self):
+        self.assertEqual(self.get_detail('no-such-department').status_code, 404)
+        self.assertEqual(self.get_detail(999).status_code, 404)
+
+    def test_snapshot_keeps_file_names_and_resolves_urls_on_read(self):
+        Department.objects.filter(id=self.department.id).update(programs_image='departments/cse.png')
+        Banner.objects.filter(department=self.department).update(image='banners/cse.png')
+        signatures = iter(range(100))
+        with mock.patch.object(
+            Banner._meta.get_field('image').storage, 'url',
+            side_effect=lambda name: f'https://storage.example/{name}?signature={next(signatures)}'
+        ):
+            first = get_department_page(self.department.id)
+            second = get_department_page(self.department.id)
+            [batched], _ = get_department_pages(ids=[self.department.id])
+
+        payload = DepartmentSnapshot.objects.get(department=self.department).payload
+        self.assertEqual(payload['programs_image'], 'departments/cse.png')
+        self.assertEqual({banner['image'] for banner in payload['banners']}, {'banners/cse.png'})
+        self.assertTrue(first['programs_image'].startswith('https://storage.example/departments/cse.png?signature='))
+        self.assertNotEqual(first['banners'][0]['image'], second['banners'][0]['image'])
+        self.assertTrue(batched['banners'][0]['image'].startswith('https://storage.example/banners/cse.png'))
+        self.assertIsNone(first['contacts'][0]['image'])
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class DepartmentLookupTests(TestCase):
+    def setUp(self):
+        self.department = Department.objects.create(name="Mechanical Engineering", slug="mech")
+
+    def test_id_and_slug_share_one_query(self):
+        with self.assertNumQueries(1):
+            self.assertEqual(find_department('mech').id, self.department.id)
+            self.assertEqual(find_department(self.department.id).slug, 'mech')
+            self.assertEqual(find_department(str(self.department.id)).name, "Mechanical Engineering")
+
+    def test_unknown_slugs_are_cached(self):
+        with self.assertNumQueries(1):
+            self.assertIsNone(find_department('wp-admin'))
+            self.assertIsNone(find_department('wp-admin'))
+        with self.assertNumQueries(0):
+            response = self.client.get(reverse('base:department_detail', args=['wp-admin']))
+        self.assertEqual(response.status_code, 404)
+
+    def test_department_save_invalidates_lookups(self):
+        self.assertIsNone(find_department('civil'))
+        Department.objects.create(name="Civil Engineering", slug="civil")
+        self.assertEqual(find_department('civil').name, "Civil Engineering")
+
+        self.department.slug = "mechanical"
+        self.department.save()
+        self.assertIsNone(find_department('mech'))
+        self.assertEqual(find_department('mechanical').id, self.department.id)
+
+    def test_version_bump_from_another_process_invalidates_lookups(self):
+        self.assertIsNone(find_department('civil'))
+        self.assertEqual(find_department('mech').id, self.department.id)
+        # Writes made elsewhere only reach this process through the shared version
+        Department.objects.bulk_create([Department(name="Civil Engineering", slug="civil")])
+        Department.objects.filter(id=self.department.id).update(slug="mechanical")
+        bump_model_versions(Department)
+        self.assertEqual(find_department('civil').name, "Civil Engineering")
+        self.assertIsNone(find_department('mech'))
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class DepartmentSectionSelectionTests(TestCase):
+    def setUp(self):
+        self.department = Department.objects.create(name="Electrical Engineering", slug="eee", vision="<p>Vision</p>")
+        create_department_sections(self.department, 2)
+        self.url = reverse('base:department_detail', args=['eee'])
+
+    def test_default_response_has_every_section(self):
+        data = self.client.get(self.url).json()
+        for section in DEPARTMENT_PAGE_SECTIONS:
+            self.assertIn(section, data)
+
+    def test_include_loads_only_requested_sections(self):
+        find_department('eee')
+        # Department row plus the banners and programs prefetches
+        with self.assertNumQueries(4):
+            response = self.client.get(self.url, {'include': 'banners,programs'})
+        data = response.json()
+        self.assertEqual(len(data['banners']), 2)
+        self.assertEqual(len(data['programs']), 2)
+        self.assertNotIn('vision', data)
+        self.assertNotIn('facilities', data)
+        self.assertEqual(data['slug'], 'eee')
+
+    def test_selection_is_applied_to_snapshot(self):
+        full = self.client.get(self.url).json()
+        with self.assertNumQueries(1):
+            data = self.client.get(self.url, {'exclude': 'vision,mission,facilities'}).json()
+        self.assertNotIn('facilities', data)
+        self.assertNotIn('vision', data)
+        self.assertEqual(data['banners'], full['banners'])
+
+    def test_unknown_section_is_rejected(self):
+        self.assertEqual(self.client.get(self.url, {'include': 'secrets'}).status_code, 400)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class DepartmentBatchTests(TestCase):
+    def setUp(self):
+        self.departments = []
+        for index, slug in enumerate(['cse', 'ece', 'mech']):
+            department = Department.objects.create(name=slug.upper(), slug=slug)
+            create_department_sections(department, index + 1)
+            self.departments.append(department)
+        self.url = reverse('base:departments_batch')
+
+    def count_queries(self, params):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, 200)
+        return len(queries), response.json()
+
+    def test_query_count_is_independent_of_batch_size(self):
+        one, _ = self.count_queries({'ids': str(self.departments[0].id)})
+        DepartmentSnapshot.objects.all().delete()
+        three, data = self.count_queries({
+            'ids': f"{self.departments[0].id},{self.departments[1].id}",
+            'slugs': 'mech,unknown'
+        })
+        self.assertEqual(one, three)
+        self.assertEqual([d['slug'] for d in data['departments']], ['cse', 'ece', 'mech'])
+        self.assertEqual(data['not_found'], ['unknown'])
+        self.assertEqual(len(data['departments'][2]['about_sections']), 3)
+
+    def test_batch_reuses_snapshots(self):
+        self.count_queries({'slugs': 'cse,ece,mech'})
+        self.assertEqual(DepartmentSnapshot.objects.count(), 3)
+        queries, data = self.count_queries({'slugs': 'mech,cse', 'include': 'banners'})
+        self.assertEqual(queries, 1)
+        self.assertEqual([d['slug'] for d in data['departments']], ['mech', 'cse'])
+        self.assertNotIn('programs', data['departments'][0])
+
+    def test_matches_detail_payload(self):
+        detail = self.client.get(reverse('base:department_detail', args=['ece'])).json()
+        _, data = self.count_queries({'slugs': 'ece'})
+        self.assertEqual(data['departments'], [detail])
+
+    def test_requires_identifiers(self):
+        self.assertEqual(self.client.get(self.url).status_code, 400)
+        self.assertEqual(self.client.get(self.url, {'ids': 'a,b'}).status_code, 400)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class HomePageTests(TestCase):
+    # One query per section plus the news images prefetch
+    QUERY_BUDGET = 7
+
+    def setUp(self):
+        cache.clear()
+        self.url = reverse('base:home_page')
+        department = Department.objects.create(name="Computer Science", slug="cse")
+        DepartmentStatistics.objects.create(department=department, name="Students", number=900, featured=True)
+        Company.objects.create(name="Acme")
+
+    def add_news(self, count, start=0):
+        for i in range(start, start + count):
+            news = NewsEvents.objects.create(heading=f"News {i}", is_featured=True)
+            news.images.add(ImageModel.objects.create(alt=f"Image {i}"))
+
+    def test_query_count_is_fixed_and_cached(self):
+        self.add_news(1)
+        with self.assertNumQueries(self.QUERY_BUDGET):
+            self.client.get(self.url)
+        self.add_news(4, start=1)
+        with self.assertNumQueries(self.QUERY_BUDGET):
+            data = self.client.get(self.url).json()
+        self.assertEqual(len(data['featured_news']), 5)
+        self.assertEqual(data['featured_news'][0]['primary_image']['alt'], 'Image 4')
+        self.assertEqual(data['featured_statistics'][0]['department']['slug'], 'cse')
+
+        with self.assertNumQueries(0):
+            self.client.get(self.url)
+
+    def test_saves_invalidate_cached_payload(self):
+        self.client.get(self.url)
+        with self.captureOnCommitCallbacks(execute=True):
+            Company.objects.create(name="Globex")
+        data = self.client.get(self.url).json()
+        self.assertEqual([c['name'] for c in data['companies']], ['Acme', 'Globex'])
+
+    @override_settings(DEBUG=True)
+    def test_debug_reports_section_timings(self):
+        data = self.client.get(self.url).json()
+        self.assertFalse(data['debug']['cached'])
+        self.assertEqual(set(data['debug']['timings_ms']), {
+            'featured_statistics', 'featured_data', 'placements',
+            'research', 'featured_news', 'companies'
+        })
+        self.assertTrue(self.client.get(self.url).json()['debug']['cached'])
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class DepartmentStatisticsBulkTests(TestCase):
+    def setUp(self):
+        self.department = Department.objects.create(name="Computer Science", slug="cse")
+        self.other = Department.objects.create(name="Mechanical", slug="mech")
+        self.first = DepartmentStatistics.objects.create(department=self.department, name="Labs", number=5)
+        self.second = DepartmentStatistics.objects.create(department=self.department, name="Papers", number=40, display_order=1)
+        self.foreign = DepartmentStatistics.objects.create(department=self.other, name="Alumni", number=900)
+        self.url = reverse('base:bulk_write_department_statistics', args=['cse'])
+
+    def post(self, body):
+        return self.client.post(self.url, body, content_type='application/json')
+
+    def test_creates_updates_and_reorders_in_one_call(self):
+        with CaptureQueriesContext(connection) as small:
+            self.post({'statistics': [{'name': 'New 0', 'number': 1}]})
+        response = self.post({
+            'statistics': [
+                {'id': self.first.id, 'name': 'Labs', 'number': 7},
+                {'name': 'Students', 'number': 1200, 'suffix': '+'},
+                {'name': 'Faculty', 'number': 80},
+            ],
+            'order': [self.second.id, self.first.id]
+        })
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual((data['created'], data['updated']), (2, 2))
+        self.assertEqual(data['statistics'][0]['name'], 'Papers')
+        self.first.refresh_from_db()
+        self.assertEqual((self.first.number, self.first.display_order), (7, 1))
+        self.assertEqual(DepartmentStatistics.objects.filter(department=self.department).count(), 5)
+
+        with CaptureQueriesContext(connection) as large:
+            self.post({'statistics': [{'name': f'New {i}', 'number': i} for i in range(10)]})
+        self.assertEqual(len(small), len(large))
+
+    def test_invalid_item_aborts_whole_request(self):
+        response = self.post({'statistics': [
+            {'name': 'Students', 'number': 1200},
+            {'name': 'Broken', 'number': 'many'},
+            {'id': self.foreign.id, 'number': 1},
+        ]})
+        self.assertEqual(response.status_code, 400)
+        errors = response.json()['errors']
+        self.assertEqual(errors[0], {})
+        self.assertIn('number', errors[1])
+        self.assertIn('id', errors[2])
+        self.assertEqual(DepartmentStatistics.objects.count(), 3)
+
+    def test_partial_mode_writes_valid_items(self):
+        response = self.post({'partial': True, 'statistics': [
+            {'name': 'Students', 'number': 1200},
+            {'name': 'Broken', 'number': 'many'},
+        ]})
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data['created'], 1)
+        self.assertEqual(data['errors'][0], {})
+        self.assertIn('number', data['errors'][1])
+
+    def test_rejects_order_outside_department(self):
+        response = self.post({'order': [self.first.id, self.foreign.id]})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['unknown_ids'], [self.foreign.id])
+
+    def test_bulk_write_rebuilds_department_snapshot(self):
+        self.client.get(reverse('base:department_detail', args=['cse']))
+        with self.captureOnCommitCallbacks(execute=True):
+            self.post({'statistics': [{'name': 'Students', 'number': 1200}]})
+        payload = DepartmentSnapshot.objects.get(department=self.department).payload
+        self.assertIn('Students', [stat['name'] for stat in payload['statistics']])
+
+
+def create_course_sections(course, count, start=0):
+    """Attach `count` rows of every course page section to a course"""
+    for i in range(start, start + count):
+        about = AboutTheCourseModel.objects.create(course=course, heading=f"About {i}")
+        NumberDataATD.objects.create(about_section=about, number=i, text="Labs")
+        NumberDataATD.objects.create(about_section=about, number=i * 10, text="Papers")
+        QuickLinksModel.objects.create(course=course, name=f"Link {i}", link="/link/")
+        SubjectsModel.objects.create(course=course, name=f"Subject {i}")
+        LabModel.objects.create(course=course, heading=f"Lab {i}")
+        CurriculumModel.objects.create(course=course, title=f"Regulation {i}")
+        BenefitsModel.objects.create(course=course, text=f"Benefit {i}")
+        CourseContact.objects.create(course=course, name=f"Contact {i}")
+        CTAModel.objects.create(course=course, heading=f"Apply {i}")
+        CourseBanner.objects.create(course=course, alt=f"Banner {i}")
+        POPSOPEO.objects.create(course=course, name=f"PO{i}")
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class CoursePageQueryBudgetTests(TestCase):
+    # Course with its department, one query per prefetched relation and one for the about-section numbers
+    QUERY_BUDGET = 12
+
+    def setUp(self):
+        department = Department.objects.create(name="Computer Science", slug="cse")
+        self.course = Course.objects.create(name="B.Tech CSE", slug="btech-cse", department=department)
+
+    def fetch(self, url):
+        with self.assertNumQueries(self.QUERY_BUDGET):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_query_count_does_not_grow_with_sections(self):
+        detail_url = reverse('base:course_detail', args=[self.course.id])
+        create_course_sections(self.course, 1)
+        self.assertEqual(len(self.fetch(detail_url)['about_sections']), 1)
+
+        create_course_sections(self.course, 4, start=1)
+        data = self.fetch(detail_url)
+        self.assertEqual(len(data['about_sections']), 5)
+        self.assertEqual(len(data['about_sections'][0]['number_data']), 2)
+        self.assertEqual(len(data['po_pso_peo']), 5)
+        self.assertEqual(data['course']['department']['slug'], 'cse')
+
+        by_name = self.fetch(reverse('base:course_by_name', args=['b.tech cse']))
+        self.assertEqual(by_name, data)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class NormalizedNameLookupTests(TestCase):
+    def setUp(self):
+        self.cse = Department.objects.create(name="Computer Science", slug="cse")
+        self.ece = Department.objects.create(name="Electronics", slug="ece")
+
+    def test_normalize_name(self):
+        self.assertEqual(normalize_name("  Dr. Ananya   RÁO "), "dr. ananya rao")
+        self.assertEqual(normalize_name(None), "")
+
+    def test_name_normalized_follows_saves(self):
+        course = Course.objects.create(name="B.Tech  CSE", slug="btech-cse")
+        self.assertEqual(course.name_normalized, "b.tech cse")
+        course.name = "B.Tech Computer Science"
+        course.save(update_fields=['name'])
+        course.refresh_from_db()
+        self.assertEqual(course.name_normalized, "b.tech computer science")
+
+    def test_faculty_lookup_is_exact_and_deterministic(self):
+        first = Faculty.objects.create(name="Priya Raman", department=self.cse)
+        Faculty.objects.create(name="priya  raman", department=self.ece)
+        url = reverse('base:faculty_by_name', args=['PRIYA RAMAN'])
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['id'], first.id)
+        self.assertIn('name_normalized', queries[0]['sql'])
+        self.assertEqual(self.client.get(reverse('base:faculty_by_name', args=['Priya'])).status_code, 404)
+
+    def test_course_lookup_handles_duplicates(self):
+        first = Course.objects.create(name="MBA", slug="mba")
+        Course.objects.create(name="mba", slug="mba-2")
+        response = self.client.get(reverse('base:course_by_name', args=['Mba']))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['course']['id'], first.id)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class KeysetPaginationTests(TestCase):
+    def setUp(self):
+        self.url = reverse('base:get_all_news_events')
+        created = timezone.now()
+        for i in range(7):
+            # Repeated dates, a NULL date and identical timestamps exercise every tiebreak
+            NewsEvents.objects.create(
+                heading=f"News {i}",
+                date=None if i == 3 else datetime.date(2024, 1, 1 + i % 3),
+                created_at=created
+            )
+
+    def walk(self, limit):
+        ids, cursor, pages = [], None, 0
+        while True:
+            params = {'limit': limit}
+            if cursor:
+                params['cursor'] = cursor
+            response = self.client.get(self.url, params)
+            self.assertEqual(response.status_code, 200)
+            data = response.json()
+            ids += [item['id'] for item in data['results']]
+            pages += 1
+            cursor = data['next']
+            if not cursor:
+                return ids, pages
+
+    def test_pages_follow_meta_ordering(self):
+        full = [item['id'] for item in self.client.get(self.url).json()]
+        self.assertEqual(len(full), 7)
+        for limit in (1, 2, 3, 7):
+            ids, pages = self.walk(limit)
+            self.assertEqual(ids, full)
+            self.assertEqual(pages, -(-7 // limit))
+
+    def test_page_query_count_is_constant(self):
+        _, cursor = keyset_paginate(NewsEvents.objects.all(), limit=2)
+        with self.assertNumQueries(1):
+            first, _ = keyset_paginate(NewsEvents.objects.all(), limit=2)
+        with self.assertNumQueries(1):
+            later, _ = keyset_paginate(NewsEvents.objects.all(), cursor=cursor, limit=2)
+        self.assertNotEqual(first, later)
+
+    def test_rejects_bad_cursor_and_limit(self):
+        self.assertEqual(self.client.get(self.url, {'cursor': 'garbage'}).status_code, 400)
+        self.assertEqual(self.client.get(self.url, {'limit': 0}).status_code, 400)
+        Department.objects.create(name="A", slug="a")
+        Department.objects.create(name="B", slug="b")
+        _, cursor = keyset_paginate(Department.objects.all(), limit=1)
+        self.assertEqual(self.client.get(self.url, {'cursor': cursor}).status_code, 400)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class ListProjectionTests(TestCase):
+    def setUp(self):
+        department = Department.objects.create(name="Computer Science", slug="cse", vision="<p>" + "Vision " * 500 + "</p>")
+        for i in range(3):
+            Faculty.objects.create(name=f"Faculty {i}", department=department, bio="<p>" + "Biography " * 500 + "</p>")
+            NewsEvents.objects.create(heading=f"News {i}", department=department, content="<p>" + "Content " * 500 + "</p>")
+            Course.objects.create(name=f"Course {i}", slug=f"course-{i}", department=department, about_the_course="About " * 500)
+
+    def fetch(self, name, params=None):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse(name), params or {})
+        self.assertEqual(response.status_code, 200)
+        return response, ' '.join(query['sql'] for query in queries)
+
+    def test_list_view_skips_rich_text_and_seo_columns(self):
+        for name, skipped, trims_rich_text in (
+            ('base:faculty_list', ('"bio"', '"schema_json"', '"vision"'), True),
+            ('base:get_all_news_events', ('"content"', '"schema_json"', '"vision"'), True),
+            ('base:courses_list', ('"about_the_course"', '"schema_json"', '"vision"'), True),
+            # The department list never carried rich text; the full view only adds facilities_overview
+            ('base:departments_list', ('"vision"', '"facilities_overview"'), False),
+        ):
+            slim, sql = self.fetch(name)
+            for column in skipped:
+                self.assertNotIn(column, sql, name)
+            if trims_rich_text:
+                full, _ = self.fetch(name, {'view': 'full'})
+                self.assertLess(len(slim.content) * 3, len(full.content), name)
+
+    def test_full_view_restores_previous_shape(self):
+        slim, _ = self.fetch('base:faculty_list')
+        full, _ = self.fetch('base:faculty_list', {'view': 'full'})
+        self.assertNotIn('schema_json', slim.json()[0])
+        self.assertIn('schema_json', full.json()[0])
+        self.assertEqual({k: v for k, v in full.json()[0].items() if k in slim.json()[0]}, slim.json()[0])
+        self.assertEqual(self.client.get(reverse('base:faculty_list'), {'view': 'bogus'}).status_code, 400)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class NewsListQueryBudgetTests(TestCase):
+    def add_news(self, count, start=0):
+        for i in range(start, start + count):
+            news = NewsEvents.objects.create(heading=f"News {i}")
+            news.images.add(
+                ImageModel.objects.create(alt=f"Hidden {i}", is_active=False),
+                ImageModel.objects.create(alt=f"Image {i}"),
+            )
+
+    def count_queries(self, params):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('base:get_all_news_events'), params)
+        self.assertEqual(response.status_code, 200)
+        return len(queries), response.json()
+
+    def test_query_count_does_not_grow_with_items(self):
+        for params in ({}, {'view': 'full'}):
+            NewsEvents.objects.all().delete()
+            self.add_news(1)
+            small, _ = self.count_queries(params)
+            self.add_news(5, start=1)
+            large, data = self.count_queries(params)
+            self.assertEqual(small, large, params)
+            self.assertEqual(len(data), 6)
+            for item in data:
+                self.assertEqual(item['primary_image']['alt'], item['heading'].replace('News', 'Image'))
+                self.assertEqual(item['images_count'], 2)
+
+
+class NewsSearchIndexTests(TestCase):
+    def setUp(self):
+        self.url = reverse('base:get_all_news_events')
+        self.department = Department.objects.create(name="Mechanical Engineering", slug="mech")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.robotics = NewsEvents.objects.create(heading="Robotics Workshop", content="<p>Hands-on session</p>")
+            self.mention = NewsEvents.objects.create(
+                heading="Annual Day", department=self.department,
+                content="<p>Prizes for the <b>robotics</b> club and the café</p>"
+            )
+
+    def search(self, term, **params):
+        response = self.client.get(self.url, {'search': term, **params})
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def headings(self, term):
+        return [item['heading'] for item in self.search(term)]
+
+    def test_matches_are_ranked_by_relevance(self):
+        self.assertEqual(self.headings('robotics'), ["Robotics Workshop", "Annual Day"])
+        self.assertEqual(self.headings('ROBOT'), ["Robotics Workshop", "Annual Day"])
+        self.assertEqual(self.headings('robotics prizes'), ["Annual Day"])
+        self.assertEqual(self.headings('Cafe'), ["Annual Day"])
+        self.assertEqual(self.headings('mechanical'), ["Annual Day"])
+        self.assertEqual(self.headings('chemistry'), [])
+
+    def test_index_follows_content_and_tag_changes(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.robotics.heading = "Drone Workshop"
+            self.robotics.save()
+        self.assertEqual(self.headings('robotics'), ["Annual Day"])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            tag = TagModel.objects.create(tag_name="Aeromodelling")
+            self.robotics.tags.add(tag)
+        self.assertEqual(self.headings('aeromodelling'), ["Drone Workshop"])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            tag.tag_name = "Aviation"
+            tag.save()
+        self.assertEqual(self.headings('aeromodelling'), [])
+        self.assertEqual(self.headings('aviation'), ["Drone Workshop"])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            tag.delete()
+        self.assertEqual(self.headings('aviation'), [])
+
+    def test_only_renames_reindex_linked_news(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            tag = TagModel.objects.create(tag_name="Robotics")
+            self.mention.tags.add(tag)
+
+        with mock.patch('base.signals.index_news_events') as index:
+            with self.captureOnCommitCallbacks(execute=True):
+                self.department.ug = True
+                self.department.save()
+                tag.save()
+                Department.objects.get(pk=self.department.pk).save(update_fields=['ug'])
+            index.assert_not_called()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.department.name = "Mechatronics"
+            self.department.save()
+        self.assertEqual(self.headings('mechatronics'), ["Annual Day"])
+        self.assertEqual(self.headings('mechanical'), [])
+
+    def test_ranked_results_paginate(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            for i in range(3):
+                NewsEvents.objects.create(heading=f"Robotics Meetup {i}")
+        headings, cursor = [], None
+        while True:
+            page = self.search('robotics', limit=2, **({'cursor': cursor} if cursor else {}))
+            headings += [item['heading'] for item in page['results']]
+            cursor = page['next']
+            if not cursor:
+                break
+        self.assertEqual(headings, self.headings('robotics'))
+        self.assertEqual(len(headings), 5)
+        self.assertEqual(headings[-1], "Annual Day")
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class SiteSearchTests(TestCase):
+    def setUp(self):
+        self.url = reverse('base:site_search')
+        with self.captureOnCommitCallbacks(execute=True):
+            self.department = Department.objects.create(name="Robotics and Automation", slug="ra")
+            self.professor = Designation.objects.create(name="Professor")
+            self.course = Course.objects.create(name="B.E. Robotics", slug="be-robotics", department=self.department)
+            self.faculty = Faculty.objects.create(name="Anita Raman", designation=self.professor, department=self.department)
+            self.news = NewsEvents.objects.create(heading="Robotics Workshop", category='events', content="<p>Hands-on</p>")
+            StudentAchievement.objects.create(
+                achievement_name="Hackathon Winners", department=self.department,
+                date=datetime.date(2025, 1, 1), description="<p>Built a <b>robot</b> arm</p>"
+            )
+            Company.objects.create(name="Robotics Inc", description="Industrial arms")
+
+    def search(self, q, **params):
+        response = self.client.get(self.url, {'q': q, **params})
+        self.assertEqual(response.status_code, 200)
+        return [(result['type'], result['title']) for result in response.json()['results']]
+
+    def test_results_are_ranked_and_type_tagged(self):
+        results = self.search('robot')
+        self.assertEqual(len(results), 6)
+        # Title match plus department name beats a title match; a department name alone ranks last
+        self.assertEqual(results[0], ('course', "B.E. Robotics"))
+        self.assertEqual(results[-1], ('faculty', "Anita Raman"))
+        self.assertEqual({type_ for type_, _ in results}, set(SEARCH_SOURCES) - {'college_achievement'})
+        self.assertEqual(self.search('anita professor'), [('faculty', "Anita Raman")])
+        self.assertEqual(self.search('robot', types='course,company'), [('course', "B.E. Robotics"), ('company', "Robotics Inc")])
+        self.assertEqual(len(self.search('robot', limit=2)), 2)
+
+        with self.assertNumQueries(1):
+            self.search('robotics workshop')
+
+    def test_documents_follow_model_changes(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.department.name = "Mechatronics"
+            self.department.save()
+        self.assertIn(('course', "B.E. Robotics"), self.search('mechatronics'))
+        self.assertIn(('faculty', "Anita Raman"), self.search('mechatronics'))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.professor.name = "Dean"
+            self.professor.save()
+        self.assertEqual(self.search('dean'), [('faculty', "Anita Raman")])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.news.tags.add(TagModel.objects.create(tag_name="Drones"))
+        self.assertEqual(self.search('drones'), [('news', "Robotics Workshop")])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.news.is_published = False
+            self.news.save()
+        self.assertEqual(self.search('workshop'), [])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.faculty.delete()
+        self.assertEqual(self.search('anita'), [])
+
+    def test_only_renames_reindex_dependent_documents(self):
+        with mock.patch('base.signals.index_search_documents') as index:
+            with self.captureOnCommitCallbacks(execute=True):
+                self.department.ug = True
+                self.department.save()
+                self.course.slug = "be-robotics-2025"
+                self.course.save()
+                self.professor.save()
+        # Only the saved rows' own documents are rebuilt
+        self.assertEqual(
+            sorted((entity_type, set(ids)) for (entity_type, ids), _ in index.call_args_list),
+            [('course', {self.course.id}), ('department', {self.department.id})]
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.course.name = "B.E. Mechatronics"
+            self.course.save()
+        self.assertEqual(self.search('mechatronics'), [('course', "B.E. Mechatronics")])
+
+    def test_bulk_rebuild_matches_signal_maintained_documents(self):
+        documents = set(SearchDocument.objects.values_list('entity_type', 'object_id', 'title'))
+        SearchDocument.objects.all().delete()
+        for entity_type in SEARCH_SOURCES:
+            index_search_documents(entity_type)
+        self.assertEqual(set(SearchDocument.objects.values_list('entity_type', 'object_id', 'title')), documents)
+        self.assertEqual(len(self.search('robot')), 6)
+
+    def test_invalid_requests_are_rejected(self):
+        self.assertEqual(self.client.get(self.url).status_code, 400)
+        self.assertEqual(self.client.get(self.url, {'q': 'robot', 'types': 'planets'}).status_code, 400)
+        self.assertEqual(self.client.get(self.url, {'q': 'robot', 'limit': 500}).status_code, 400)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class AutocompleteTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.url = reverse('base:autocomplete')
+        department = Department.objects.create(name="Computer Science", slug="cse")
+        Course.objects.create(name="Computer Networks", slug="cn", department=department)
+        Faculty.objects.create(name="Anita Raman", slug="anita-raman", department=department)
+        Faculty.objects.create(name="Raman Kumar", slug="dr-raman-kumar", department=department)
+
+    def names(self, q, **params):
+        response = self.client.get(self.url, {'q': q, **params})
+        self.assertEqual(response.status_code, 200)
+        return [(result['type'], result['name']) for result in response.json()['results']]
+
+    def test_prefix_matches_are_ranked(self):
+        self.assertEqual(self.names('comp'), [('department', "Computer Science"), ('course', "Computer Networks")])
+        self.assertEqual(self.names('ram'), [('faculty', "Raman Kumar"), ('faculty', "Anita Raman")])
+        self.assertEqual(self.names('RAMAN k'), [('faculty', "Raman Kumar")])
+        self.assertEqual(self.names('dr raman'), [('faculty', "Raman Kumar")])
+        self.assertEqual(self.names('comp', types='course'), [('course', "Computer Networks")])
+        self.assertEqual(self.names('comp', limit=1), [('department', "Computer Science")])
+        self.assertEqual(self.names('zzz'), [])
+        self.assertEqual(self.client.get(self.url, {'q': 'a', 'types': 'news'}).status_code, 400)
+
+    def test_lookups_skip_the_database_until_names_change(self):
+        self.names('comp')
+        with self.assertNumQueries(0):
+            self.names('comp')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Department.objects.create(name="Computational Biology", slug="cb")
+        self.assertEqual(self.names('computa'), [('department', "Computational Biology")])
+
+    def test_nodes_keep_only_the_best_entries(self):
+        trie = build_trie('faculty', [(i, f"Name {i:03d}", None) for i in range(50)])
+        self.assertEqual(len(trie.find('name')), 20)
+        self.assertEqual(trie.find('name')[0][1]['name'], "Name 000")
+        self.assertEqual([entry['id'] for _, entry in trie.find('name 04')], list(range(40, 50)))
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class FuzzyFacultySearchTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        for name in ("Lakshmi Narayanan", "Karthick Raja", "R. Srinivasan", "Mohammed Ismail", "Anita Raman"):
+            Faculty.objects.create(name=name)
+
+    def fuzzy(self, term, **params):
+        return self.client.get(reverse('base:search_faculty', args=[term]), {'fuzzy': 'true', **params})
+
+    def test_transliteration_variants_and_typos_match(self):
+        for term, expected in (
+            ("Laxmi", "Lakshmi Narayanan"),
+            ("karthik", "Karthick Raja"),
+            ("Sreenivasan", "R. Srinivasan"),
+            ("Muhammad", "Mohammed Ismail"),
+            ("Anitha Ramen", "Anita Raman"),
+        ):
+            response = self.fuzzy(term)
+            self.assertEqual(response.status_code, 200, term)
+            self.assertEqual(response.json()[0]['name'], expected, term)
+
+    def test_candidates_are_ranked_and_index_is_cached(self):
+        self.fuzzy("raja")
+        with self.assertNumQueries(1):
+            results = self.fuzzy("raman", limit=2).json()
+        self.assertEqual(results[0]['name'], "Anita Raman")
+        self.assertLessEqual(len(results), 2)
+        self.assertEqual([r['match_score'] for r in results], sorted((r['match_score'] for r in results), reverse=True))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Faculty.objects.create(name="Priya Dharshini")
+        self.assertEqual(self.fuzzy("priyadarshini").json()[0]['name'], "Priya Dharshini")
+
+    def test_no_candidates_or_bad_limit(self):
+        self.assertEqual(self.fuzzy("xyz").status_code, 404)
+        self.assertEqual(self.fuzzy("raja", limit=0).status_code, 400)
+        # Without fuzzy the partial match is unchanged
+        self.assertEqual(self.client.get(reverse('base:search_faculty', args=["Laxmi"])).status_code, 404)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class FacultyByDepartmentTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.department = Department.objects.create(name="Computer Science", slug="cse")
+        self.professor = Designation.objects.create(name="Professor")
+        self.assistant = Designation.objects.create(name="Assistant Professor")
+        self.head = Designation.objects.create(name="Professor & Head")
+        Faculty.objects.create(name="Anita Raman", designation=self.assistant, department=self.department)
+        Faculty.objects.create(name="Zubair Khan", designation=self.professor, department=self.department)
+        Faculty.objects.create(name="Mohan Kumar", department=self.department)
+        Faculty.objects.create(name="Priya Dharshini", designation=self.head, department=self.department)
+
+    def fetch(self, **params):
+        return self.client.get(reverse('base:faculty_by_department', args=['cse']), params)
+
+    def test_rank_is_derived_from_designation_name(self):
+        self.assertEqual((self.head.is_hod, self.professor.rank), (True, 1))
+        self.assertLess(self.professor.rank, self.assistant.rank)
+        self.assertTrue(Faculty.objects.get(name="Priya Dharshini").is_hod)
+
+        self.professor.name = "Director"
+        self.professor.save()
+        self.assertTrue(Faculty.objects.get(name="Zubair Khan").is_hod)
+        self.assistant.delete()
+        self.assertEqual(Faculty.objects.get(name="Anita Raman").designation_rank, Faculty().designation_rank)
+
+    def test_hod_and_ordered_members_in_one_query(self):
+        find_department('cse')
+        with self.assertNumQueries(1):
+            data = self.fetch().json()
+        self.assertEqual(data['hod']['name'], "Priya Dharshini")
+        self.assertNotIn('bio', data['hod'])
+        self.assertEqual(
+            [faculty['name'] for faculty in data['faculty_members']],
+            ["Zubair Khan", "Anita Raman", "Mohan Kumar"]
+        )
+        self.assertEqual(data['faculty_count'], 4)
+
+        full = self.fetch(view='full').json()
+        self.assertIn('bio', full['hod'])
+        self.assertEqual(self.fetch(view='bogus').status_code, 400)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class SlugGenerationTests(TestCase):
+    def test_collisions_get_the_lowest_free_suffix_from_one_query(self):
+        slugs = [NewsEvents.objects.create(heading="Annual Day").slug for _ in range(3)]
+        self.assertEqual(slugs, ["annual-day", "annual-day-1", "annual-day-2"])
+        NewsEvents.objects.filter(slug="annual-day-1").delete()
+        NewsEvents.objects.create(heading="Annual Day Celebrations")
+        with self.assertNumQueries(1):
+            self.assertEqual(unique_slug(NewsEvents, "Annual Day"), "annual-day-1")
+
+    def test_every_seo_model_generates_slugs(self):
+        self.assertEqual(Department.objects.create(name="Civil Engineering").slug, "civil-engineering")
+        self.assertEqual(Course.objects.create(name="Civil Engineering").slug, "civil-engineering")
+        Faculty.objects.create(name="R. Kumar")
+        faculty = Faculty.objects.create(name="R Kumar")
+        self.assertEqual(faculty.slug, "r-kumar-1")
+        self.assertEqual(faculty.canonical_url, "/faculty/r-kumar-1/")
+
+    def test_slug_taken_by_a_concurrent_save_is_retried(self):
+        Faculty.objects.create(name="Anita Raman")
+        # The first allocation misses the row saved "concurrently" above
+        with mock.patch(
+            'base.models.department_model.unique_slug',
+            side_effect=["anita-raman", unique_slug(Faculty, "Anita Raman")]
+        ):
+            faculty = Faculty.objects.create(name="Anita Raman")
+        self.assertEqual(faculty.slug, "anita-raman-1")
+        self.assertEqual(Faculty.objects.get(pk=faculty.pk).canonical_url, "/faculty/anita-raman-1/")
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class FacultyImportTests(TestCase):
+    def setUp(self):
+        self.department = Department.objects.create(name="Computer Science", slug="cse")
+        self.professor = Designation.objects.create(name="Professor")
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def run_import(self, rows, *args):
+        path = os.path.join(self.directory.name, 'faculty.jsonl')
+        with open(path, 'w', encoding='utf-8') as import_file:
+            import_file.write('\n'.join(json.dumps(row) for row in rows))
+        stdout, stderr = StringIO(), StringIO()
+        with CaptureQueriesContext(connection) as queries:
+            call_command('import_faculty', path, *args, stdout=stdout, stderr=stderr)
+        return len(queries), stderr.getvalue()
+
+    def test_query_count_does_not_grow_with_rows(self):
+        rows = [{'name': f"Faculty {i}", 'department': 'cse', 'designation': 'Professor'} for i in range(65)]
+        # An explicit batch size below every backend's parameter limit (~31 Faculty rows on SQLite)
+        few, _ = self.run_import(rows[:5], '--batch-size', '20')
+        many, _ = self.run_import(rows[5:25], '--batch-size', '20')
+        self.assertEqual(few, many)
+        # Only the INSERT is repeated per batch
+        two_batches, _ = self.run_import(rows[25:], '--batch-size', '20')
+        self.assertEqual(two_batches, many + 1)
+
+        faculty = Faculty.objects.get(name="Faculty 7")
+        self.assertEqual((faculty.slug, faculty.designation_rank), ("faculty-7", self.professor.rank))
+        self.assertIn("Faculty 7 - Professor at Computer Science", faculty.meta_title)
+        self.assertTrue(faculty.schema_json)
+
+    def test_rows_update_by_name_and_department_and_bad_rows_are_reported(self):
+        Faculty.objects.create(name="Anita Raman", department=self.department, slug="anita")
+        Faculty.objects.create(name="R. Kumar")
+        _, errors = self.run_import([
+            {'name': "anita raman", 'department': "Computer Science", 'qualification': "PhD"},
+            {'name': "R Kumar", 'designation': "Head of Department"},
+            {'name': "Mohan", 'department': "unknown"},
+            {'qualification': "M.E."},
+        ])
+        self.assertIn("Unknown department 'unknown'", errors)
+        self.assertIn("name is required", errors)
+
+        anita = Faculty.objects.get(slug="anita")
+        self.assertEqual(anita.qualification, "PhD")
+        kumar = Faculty.objects.get(slug="r-kumar-1")
+        self.assertTrue(kumar.is_hod)
+        self.assertEqual(Faculty.objects.count(), 3)
+
+    def write_images(self, *names):
+        for name in names:
+            with open(os.path.join(self.directory.name, name), 'wb') as image_file:
+                image_file.write(b'image')
+
+    def test_failed_uploads_are_reported_per_row(self):
+        self.write_images('good.png', 'bad.png')
+        storage = Faculty._meta.get_field('image').storage
+
+        def save(name, content, max_length=None):
+            if 'bad' in name:
+                raise OSError("bucket unavailable")
+            return name
+
+        with mock.patch.object(storage, 'save', side_effect=save):
+            _, errors = self.run_import([
+                {'name': "Good Image", 'image': 'good.png', 'designation': "Professor"},
+                {'name': "Bad Image", 'image': 'bad.png', 'designation': "Lecturer"},
+            ])
+        self.assertIn("Line 2: Image upload failed: bucket unavailable", errors)
+        self.assertEqual(list(Faculty.objects.values_list('name', flat=True)), ["Good Image"])
+        # Designations are only created for rows that are written
+        self.assertFalse(Designation.objects.filter(name="Lecturer").exists())
+
+    def test_failed_write_removes_designations_and_uploads(self):
+        self.write_images('photo.png')
+        storage = Faculty._meta.get_field('image').storage
+        with mock.patch.object(storage, 'save', side_effect=lambda name, content, max_length=None: name), \
+                mock.patch.object(storage, 'delete') as delete, \
+                mock.patch('base.faculty_import.faculty_bulk_written', side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                self.run_import([{'name': "New Faculty", 'image': 'photo.png', 'designation': "Lecturer"}])
+        delete.assert_called_once()
+        self.assertFalse(Designation.objects.filter(name="Lecturer").exists())
+        self.assertFalse(Faculty.objects.filter(name="New Faculty").exists())
+
+    def test_dry_run_writes_nothing(self):
+        self.run_import([{'name': "New Faculty", 'designation': "Lecturer"}], '--dry-run')
+        self.assertFalse(Faculty.objects.filter(name="New Faculty").exists())
+        self.assertFalse(Designation.objects.filter(name="Lecturer").exists())
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class ResponseCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.department = Department.objects.create(name="Computer Science", slug="cse")
+        Faculty.objects.create(name="Anita Raman", department=self.department)
+        Company.objects.create(name="Acme")
+
+    def get(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_repeated_get_is_served_from_cache(self):
+        url = reverse('base:faculty_list')
+        first = self.get(f'{url}?view=full&department_id=cse')
+        with self.assertNumQueries(0):
+            # Same parameters in another order share the entry
+            self.assertEqual(self.get(f'{url}?department_id=cse&view=full'), first)
+
+    def test_save_evicts_only_dependent_endpoints(self):
+        faculty_url, companies_url = reverse('base:faculty_list'), reverse('base:companies_list')
+        self.get(faculty_url)
+        self.get(companies_url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Faculty.objects.create(name="Mohan Kumar", department=self.department)
+        self.assertEqual(len(self.get(faculty_url)), 2)
+        with self.assertNumQueries(0):
+            self.get(companies_url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.department.name = "Computer Science and Engineering"
+            self.department.save()
+        self.assertEqual(self.get(faculty_url)[0]['department']['name'], "Computer Science and Engineering")
+
+    def test_m2m_changes_evict_dependent_endpoints(self):
+        news_event = NewsEvents.objects.create(heading="Annual Day")
+        tag = TagModel.objects.create(tag_name="Culturals")
+        url = reverse('base:get_news_event', args=[news_event.id])
+        self.assertEqual(self.get(url)['tags'], [])
+        with self.captureOnCommitCallbacks(execute=True):
+            news_event.tags.add(tag)
+        self.assertEqual(len(self.get(url)['tags']), 1)
+
+    @override_settings(CACHES=COMPRESSED_DB_CACHES)
+    def test_responses_are_shared_through_the_database_cache(self):
+        cache.clear()
+        url = reverse('base:faculty_list')
+        first = self.get(url)
+        self.assertTrue(CacheEntry.objects.filter(key__contains=RESPONSE_CACHE_PREFIX).exists())
+
+        # Another instance starts with an empty LRU: versions and data are one read each
+        cache.clear_local()
+        with self.assertNumQueries(2):
+            self.assertEqual(self.get(url), first)
+        with self.assertNumQueries(0):
+            self.get(url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Faculty.objects.create(name="Mohan Kumar", department=self.department)
+        self.assertEqual(len(self.get(url)), 2)
+
+    def test_errors_are_not_cached(self):
+        url = reverse('base:faculty_detail', args=[999])
+        self.assertEqual(self.client.get(url).status_code, 404)
+        Faculty.objects.filter(name="Anita Raman").update(id=999)
+        self.assertEqual(self.client.get(url).status_code, 200)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class ConditionalGetTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.department = Department.objects.create(name="Computer Science", slug="cse")
+        Faculty.objects.create(name="Anita Raman", department=self.department)
+        self.url = reverse('base:faculty_list')
+
+    def test_matching_etag_gets_304_without_queries(self):
+        first = self.client.get(self.url)
+        self.assertTrue(first['ETag'].startswith('W/"'))
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+        self.assertEqual(response['ETag'], first['ETag'])
+
+        # Another query string is another representation
+        other = self.client.get(self.url, {'view': 'full'}, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(other.status_code, 200)
+
+    def test_content_change_invalidates_validators(self):
+        first = self.client.get(self.url)
+        with self.captureOnCommitCallbacks(execute=True):
+            Faculty.objects.create(name="Mohan Kumar", department=self.department)
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()), 2)
+        self.assertNotEqual(response['ETag'], first['ETag'])
+
+    def test_if_modified_since(self):
+        first = self.client.get(self.url)
+        response = self.client.get(self.url, HTTP_IF_MODIFIED_SINCE=first['Last-Modified'])
+        self.assertEqual(response.status_code, 304)
+        # If-None-Match takes precedence over If-Modified-Since
+        response = self.client.get(
+            self.url, HTTP_IF_MODIFIED_SINCE=first['Last-Modified'], HTTP_IF_NONE_MATCH='"stale"'
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_validators_change_with_the_url_bucket(self):
+        # Cached bodies hold signed storage URLs, so a new bucket means a new body
+        bucket = url_bucket()
+        with mock.patch('base.response_cache.url_bucket', return_value=bucket):
+            first = self.client.get(self.url)
+            self.assertEqual(self.client.get(self.url, HTTP_IF_NONE_MATCH=first['ETag']).status_code, 304)
+        with mock.patch('base.response_cache.url_bucket', return_value=bucket + 1):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=first['ETag'])
+            self.assertEqual(response.status_code, 200)
+            self.assertNotEqual(response['ETag'], first['ETag'])
+            self.assertEqual(
+                parse_http_date(response['Last-Modified']), (bucket + 1) * RESPONSE_CACHE_URL_BUCKET
+            )
+            response = self.client.get(self.url, HTTP_IF_MODIFIED_SINCE=first['Last-Modified'])
+            self.assertEqual(response.status_code, 200)
+
+    def test_errors_carry_no_validators(self):
+        response = self.client.get(self.url, {'view': 'bogus'})
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(response.has_header('ETag'))
+
+
+class CachePolicyTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        department = Department.objects.create(name="Computer Science", slug="cse")
+        Faculty.objects.create(name="Anita Raman", department=department)
+
+    def cache_control(self, response):
+        return {directive.strip() for directive in response['Cache-Control'].split(',')}
+
+    def test_public_content_is_cacheable_at_the_edge(self):
+        response = self.client.get(reverse('base:faculty_list'))
+        self.assertEqual(
+            self.cache_control(response),
+            {'public', 'max-age=0', 's-maxage=60', 'stale-while-revalidate=600', 'stale-if-error=86400'}
+        )
+        self.assertIn('Origin', response['Vary'])
+
+        # 304s keep the policy so the edge can refresh its copy
+        response = self.client.get(reverse('base:faculty_list'), HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 304)
+        self.assertIn('s-maxage=60', self.cache_control(response))
+
+    def test_form_listings_are_never_stored(self):
+        for name in ('get_all_contact_forms', 'get_all_career_forms', 'get_all_grievances'):
+            response = self.client.get(reverse(f'base:{name}'))
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(self.cache_control(response), {'private', 'no-store'})
+
+    def test_no_store_responses_stay_out_of_the_edge(self):
+        response = CONTENT.apply(RequestFactory().get('/'), HttpResponse(headers={'Cache-Control': 'no-store'}))
+        self.assertEqual(self.cache_control(response), {'private', 'no-store'})
+
+    def test_errors_and_writes_are_never_stored(self):
+        response = self.client.get(reverse('base:faculty_list'), {'view': 'bogus'})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.cache_control(response), {'private', 'no-store'})
+
+        response = self.client.post(reverse('base:submit_contact_form'), {})
+        self.assertEqual(self.cache_control(response), {'private', 'no-store'})
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class SingleFlightTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        model_versions((Company,))
+        self.builds = []
+        self.release = threading.Event()
+        self.content = 'first'
+
+        @cache_response(Company)
+        def view(request):
+            self.builds.append(self.content)
+            self.release.wait(5)
+            return Response({'content': self.content})
+        self.view = view
+
+    def get(self, results):
+        response = self.view(Request(RequestFactory().get('/api/v1/companies/')))
+        results.append((response.data, response.has_header('ETag')))
+        if not response.has_header('ETag'):
+            self.stale_cache_control = response.get('Cache-Control', '')
+
+    def wait_for_builds(self, count):
+        deadline = time.monotonic() + 5
+        while len(self.builds) < count and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def test_concurrent_misses_build_once(self):
+        results = []
+        threads = [threading.Thread(target=self.get, args=(results,)) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        self.wait_for_builds(1)
+        # Let the other threads reach the lock while the first one builds
+        time.sleep(0.2)
+        self.release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(self.builds, ['first'])
+        self.assertEqual(results, [({'content': 'first'}, True)] * 5)
+
+    def test_stale_response_served_while_rebuilding(self):
+        self.release.set()
+        self.get([])
+        bump_model_versions(Company)
+        self.content = 'second'
+        self.release.clear()
+
+        builder_results, results = [], []
+        builder = threading.Thread(target=self.get, args=(builder_results,))
+        builder.start()
+        self.wait_for_builds(2)
+        # The builder holds the lock, so this request does not wait for it
+        self.get(results)
+        self.release.set()
+        builder.join()
+
+        self.assertEqual(results, [({'content': 'first'}, False)])
+        self.assertIn('no-store', self.stale_cache_control)
+        self.assertEqual(builder_results, [({'content': 'second'}, True)])
+        self.assertEqual(self.builds, ['first', 'second'])
+
+    def test_waiter_builds_when_lock_is_never_released(self):
+        self.release.set()
+        with mock.patch('base.response_cache.RESPONSE_CACHE_WAIT', 0.2), \
+                mock.patch('base.response_cache.acquire_build_lock', return_value=None):
+            results = []
+            self.get(results)
+        self.assertEqual(results, [({'content': 'first'}, True)])
+        self.assertEqual(self.builds, ['first'])
+
+    @override_settings(CACHES=COMPRESSED_DB_CACHES)
+    def test_waiter_sees_the_lock_released_by_another_process(self):
+        cache.clear_local()
+        self.assertIsNotNone(acquire_build_lock('key'))
+        # Held in this process's LRU, then released by the builder on another instance
+        self.assertIsNotNone(cache.get(f'{RESPONSE_CACHE_LOCK_PREFIX}:key'))
+        CacheEntry.objects.all().delete()
+
+        started = time.monotonic()
+        with mock.patch('base.response_cache.RESPONSE_CACHE_WAIT', 1):
+            self.assertIsNone(wait_for_build('key'))
+        self.assertLess(time.monotonic() - started, 0.5)
+
+    @mock.patch('base.response_cache.RESPONSE_CACHE_LOCK_TIMEOUT', 0.1)
+    def test_lock_lease_expires(self):
+        token = acquire_build_lock('key')
+        self.assertIsNotNone(token)
+        self.assertIsNone(acquire_build_lock('key'))
+        time.sleep(0.2)
+        self.assertIsNotNone(acquire_build_lock('key'))
+        # The expired holder must not release the new holder's lock
+        release_build_lock('key', token)
+        self.assertIsNone(acquire_build_lock('key'))
+
+
+class CompressedDatabaseCacheTests(TestCase):
+    def setUp(self):
+        self.backend = CompressedDatabaseCache('tests', {'OPTIONS': {'MAX_ENTRIES': 10, 'CULL_PROBABILITY': 0}})
+        self.backend.clear_local()
+
+    def stored(self, key):
+        return bytes(CacheEntry.objects.get(key=self.backend.make_key(key)).value)
+
+    def test_values_round_trip_compressed_when_smaller(self):
+        payload = [{'id': i, 'name': 'Computer Science and Engineering', 'slug': 'cse'} for i in range(50)]
+        self.backend.set_many({'page': payload, 'count': 3})
+        self.assertTrue(self.stored('page').startswith(b'z'))
+        self.assertTrue(self.stored('count').startswith(b'p'))
+
+        self.backend.clear_local()
+        with self.assertNumQueries(1):
+            self.assertEqual(self.backend.get_many(['page', 'count', 'absent']), {'page': payload, 'count': 3})
+        # Hot keys are then served from the process
+        with self.assertNumQueries(0):
+            self.assertEqual(self.backend.get('count'), 3)
+
+        self.backend.set('count', 4)
+        self.assertEqual(self.backend.get('count'), 4)
+        self.assertEqual(CacheEntry.objects.count(), 2)
+
+    def test_expired_entries_are_skipped_then_culled(self):
+        CacheEntry.objects.create(
+            key=self.backend.make_key('old'), value=encode_value('stale', 256), expires=time.time() - 1
+        )
+        self.assertIsNone(self.backend.get('old'))
+        self.assertFalse(self.backend.has_key('old'))
+
+        # An expired key can be added again
+        self.assertTrue(self.backend.add('old', 'fresh'))
+        self.assertEqual(self.backend.get('old'), 'fresh')
+
+        CacheEntry.objects.filter(key=self.backend.make_key('old')).update(expires=time.time() - 1)
+        self.backend.cull()
+        self.assertFalse(CacheEntry.objects.exists())
+
+    def test_add_is_decided_by_the_database(self):
+        other_process = CompressedDatabaseCache('other', {'OPTIONS': {'CULL_PROBABILITY': 0}})
+        other_process.clear_local()
+        self.assertTrue(self.backend.add('lock', 'a', 30))
+        self.assertFalse(other_process.add('lock', 'b', 30))
+        self.assertEqual(other_process.get('lock'), 'a')
+
+        self.assertTrue(self.backend.delete('lock'))
+        self.assertTrue(other_process.add('lock', 'b', 30))
+
+    def test_get_shared_reads_past_the_local_copy(self):
+        other_process = CompressedDatabaseCache('other', {'OPTIONS': {'CULL_PROBABILITY': 0}})
+        self.assertTrue(self.backend.add('lock', 'a', 30))
+        other_process.delete('lock')
+        self.assertEqual(self.backend.get('lock'), 'a')
+        self.assertIsNone(self.backend.get_shared('lock'))
+
+    def test_benchmark_command_runs(self):
+        stdout = StringIO()
+        call_command('benchmark_cache', keys=2, stdout=stdout)
+        output = stdout.getvalue()
+        for backend in ('DatabaseCache', 'CompressedDatabaseCache'):
+            self.assertIn(f'{backend:<24} get_many', output)
+            self.assertIn(f'{backend:<24} stored', output)
+        # Benchmark keys and the stock backend's table are cleaned up
+        self.assertFalse(CacheEntry.objects.exists())
+        self.assertNotIn('base_benchmark_cache', connection.introspection.table_names())
+
+    def test_cull_trims_to_max_entries(self):
+        self.backend.set_many({f'key{i}': i for i in range(12)}, timeout=None)
+        self.backend.set_many({f'short{i}': i for i in range(3)}, timeout=60)
+        self.backend.cull()
+        # Down to MAX_ENTRIES minus a third of it, soonest expiring first
+        self.assertEqual(CacheEntry.objects.count(), 7)
+        self.assertFalse(CacheEntry.objects.filter(key__contains='short').exists())
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class ReferenceDataTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.designation = Designation.objects.create(name="Professor")
+        Department.objects.create(name="Computer Science", slug="cse")
+        Company.objects.create(name="Acme", image="companies/acme.png")
+        TagModel.objects.create(tag_name="Culturals")
+        TagModel.objects.create(tag_name="Sports")
+
+    def test_tables_are_kept_until_their_model_changes(self):
+        self.assertEqual([row['name'] for row in DESIGNATION_TABLE.rows()], ["Professor"])
+        with self.assertNumQueries(0):
+            rows = DESIGNATION_TABLE.rows()
+        # Callers get copies
+        rows[0]['name'] = "Changed"
+        self.assertEqual(DESIGNATION_TABLE.rows()[0]['name'], "Professor")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.designation.name = "Associate Professor"
+            self.designation.save()
+        self.assertEqual(DESIGNATION_TABLE.rows()[0]['name'], "Associate Professor")
+
+    def test_tag_search_filters_in_memory(self):
+        response = self.client.get(reverse('base:get_all_tags'), {'search': 'CULT'})
+        self.assertEqual([tag['tag_name'] for tag in response.json()], ["Culturals"])
+
+    def test_bundle_version_lets_clients_skip_refetching(self):
+        url = reverse('base:reference_data')
+        bundle = self.client.get(url).json()
+        self.assertFalse(bundle['unchanged'])
+        self.assertEqual([department['slug'] for department in bundle['departments']], ['cse'])
+        self.assertEqual(len(bundle['tags']), 2)
+
+        response = self.client.get(url, {'version': bundle['version']}).json()
+        self.assertEqual(response, {'version': bundle['version'], 'unchanged': True})
+
+        # A new content version with the same content keeps the hash, even though
+        # signed storage URLs differ on every call
+        signatures = iter(range(100))
+        with mock.patch.object(
+            Company._meta.get_field('image').storage, 'url',
+            side_effect=lambda name: f'https://storage.example/{name}?signature={next(signatures)}'
+        ):
+            bump_model_versions(Company)
+            reloaded = self.client.get(url).json()
+            self.assertEqual(reloaded['version'], bundle['version'])
+            self.assertEqual(reloaded['companies'][0]['image'], 'https://storage.example/companies/acme.png?signature=0')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Company.objects.create(name="Globex")
+        response = self.client.get(url, {'version': bundle['version']}).json()
+        self.assertFalse(response['unchanged'])
+        self.assertEqual(len(response['companies']), 2)
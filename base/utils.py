@@ -0,0 +1,86 @@
+import re
+import unicodedata
+from collections import Counter
+from html import unescape
+from django.utils.text import slugify
+
+
+def normalize_name(name):
+    """Lookup form of a display name: accents stripped, case folded, whitespace collapsed.
+
+    Stored in the indexed `name_normalized` columns so name lookups are exact
+    matches that behave the same under every database collation.
+    """
+    if not name:
+        return ''
+    name = unicodedata.normalize('NFKD', str(name))
+    name = ''.join(char for char in name if not unicodedata.combining(char))
+    return re.sub(r'\s+', ' ', name).strip().casefold()
+
+
+# Search term columns hold at most this many characters; longer words are truncated
+MAX_TERM_LENGTH = 64
+
+# Occurrences of a word counted per field, so repeated body text cannot outrank a title
+MAX_OCCURRENCES = 5
+
+
+def plain_text(html):
+    """Text of an HTML fragment: tags removed, entities decoded, whitespace collapsed"""
+    if not html:
+        return ''
+    text = unescape(re.sub(r'<[^>]+>', ' ', str(html)))
+    return re.sub(r'\s+', ' ', text).strip()
+
+
+def search_words(text):
+    """Words of free text or HTML in search index form, folded like normalize_name()"""
+    return [word[:MAX_TERM_LENGTH] for word in re.findall(r'\w+', normalize_name(plain_text(text)))]
+
+
+def weigh_search_terms(weighted_texts):
+    """{term: weight} for (text, weight per occurrence) pairs"""
+    weights = Counter()
+    for text, weight in weighted_texts:
+        for term, count in Counter(search_words(text)).items():
+            weights[term] += weight * min(count, MAX_OCCURRENCES)
+    return dict(weights)
+
+
+# Characters kept free at the end of a generated slug for its "-N" suffix
+SLUG_SUFFIX_ROOM = 8
+
+
+def slug_base(model, text):
+    """slugify(text) cut to fit model.slug with room for a suffix; '' if nothing is sluggable"""
+    max_length = model._meta.get_field('slug').max_length
+    return slugify(text or '')[:max_length - SLUG_SUFFIX_ROOM].strip('-')
+
+
+def next_free_slug(base, taken):
+    """`base`, or its "-N" variant with the lowest N, that is not in the `taken` slugs"""
+    if base not in taken:
+        return base
+    suffix = re.compile(re.escape(base) + r'-(\d+)')
+    used = {int(match.group(1)) for match in map(suffix.fullmatch, taken) if match}
+    counter = 1
+    while counter in used:
+        counter += 1
+    return f"{base}-{counter}"
+
+
+def unique_slug(model, text, exclude_id=None):
+    """Free slug for `text` in model.slug: slugify(text), or the first free "-N" variant.
+
+    All taken variants are read with one prefix query and the lowest free
+    suffix is picked in Python. Two concurrent saves can still pick the same
+    slug; the unique constraint rejects the second, which SEOMixin.save()
+    retries. Returns None when `text` has no sluggable characters.
+    """
+    base = slug_base(model, text)
+    if not base:
+        return None
+    taken = set(
+        model.objects.filter(slug__startswith=base).exclude(pk=exclude_id).values_list('slug', flat=True)
+    )
+    return next_free_slug(base, taken)
@@ -8,6 +8,8 @@ from django.db.models import Q
 from base.models.achivements_model import CollegeAchievement, StudentAchievement
 from base.models.department_model import Department
 from base.models.course_model import Course
+from base.pagination import PAGINATION_PARAMETERS, list_response
+from base.response_cache import cache_response
 
 
 def achievement_to_dto(achievement, achievement_type="college"):
@@ -126,12 +128,13 @@ def create_college_achievement(request):
             type=openapi.TYPE_STRING,
             required=False
         )
-    ],
+    ] + PAGINATION_PARAMETERS,
     responses={
         200: openapi.Response(description="College achievements retrieved successfully")
     }
 )
 @api_view(['GET'])
+@cache_response(CollegeAchievement, Department, Course)
 def get_all_college_achievements(request):
     """Get all college achievements with optional filtering"""
     queryset = CollegeAchievement.objects.select_related('department', 'course')
@@ -153,8 +156,7 @@ def get_all_college_achievements(request):
             Q(course__name__icontains=search_term)
         )
     
-    achievements = [achievement_to_dto(achievement, "college") for achievement in queryset]
-    return Response(achievements)
+    return list_response(request, queryset, lambda achievement: achievement_to_dto(achievement, "college"))
 
 
 @swagger_auto_schema(
@@ -167,6 +169,7 @@ def get_all_college_achievements(request):
     }
 )
 @api_view(['GET'])
+@cache_response(CollegeAchievement, Department, Course)
 def get_college_achievement(request, achievement_id):
     """Get college achievement details"""
     achievement = get_object_or_404(
@@ -325,12 +328,13 @@ def create_student_achievement(request):
             type=openapi.TYPE_STRING,
             required=False
         )
-    ],
+    ] + PAGINATION_PARAMETERS,
     responses={
         200: openapi.Response(description="Student achievements retrieved successfully")
     }
 )
 @api_view(['GET'])
+@cache_response(StudentAchievement, Department, Course)
 def get_all_student_achievements(request):
     """Get all student achievements with optional filtering"""
     queryset = StudentAchievement.objects.select_related('department', 'course')
@@ -353,8 +357,7 @@ def get_all_student_achievements(request):
             Q(course__name__icontains=search_term)
         )
     
-    achievements = [achievement_to_dto(achievement, "student") for achievement in queryset]
-    return Response(achievements)
+    return list_response(request, queryset, lambda achievement: achievement_to_dto(achievement, "student"))
 
 
 @swagger_auto_schema(
@@ -367,6 +370,7 @@ def get_all_student_achievements(request):
     }
 )
 @api_view(['GET'])
+@cache_response(StudentAchievement, Department, Course)
 def get_student_achievement(request, achievement_id):
     """Get student achievement details"""
     achievement = get_object_or_404(
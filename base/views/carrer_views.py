@@ -7,6 +7,8 @@ from drf_yasg import openapi
 from django.db.models import Q
 from base.models.carrer_model import CareerOpening, CareerSuccess, Company
 from base.models.department_model import Department
+from base.pagination import PAGINATION_PARAMETERS, list_response
+from base.response_cache import cache_response
 
 
 def career_opening_to_dto(opening):
@@ -161,12 +163,13 @@ def create_career_opening(request):
             type=openapi.TYPE_STRING,
             required=False
         )
-    ],
+    ] + PAGINATION_PARAMETERS,
     responses={
         200: openapi.Response(description="Career openings retrieved successfully")
     }
 )
 @api_view(['GET'])
+@cache_response(CareerOpening, Department)
 def get_all_career_openings(request):
     """Get all career openings with optional filtering"""
     queryset = CareerOpening.objects.select_related('department')
@@ -193,8 +196,7 @@ def get_all_career_openings(request):
             Q(department__name__icontains=search_term)
         )
     
-    openings = [career_opening_to_dto(opening) for opening in queryset]
-    return Response(openings)
+    return list_response(request, queryset, career_opening_to_dto)
 
 
 @swagger_auto_schema(
@@ -207,6 +209,7 @@ def get_all_career_openings(request):
     }
 )
 @api_view(['GET'])
+@cache_response(CareerOpening, Department)
 def get_career_opening(request, opening_id):
     """Get career opening details"""
     opening = get_object_or_404(
@@ -382,12 +385,13 @@ def create_career_success(request):
             type=openapi.TYPE_STRING,
             required=False
         )
-    ],
+    ] + PAGINATION_PARAMETERS,
     responses={
         200: openapi.Response(description="Career successes retrieved successfully")
     }
 )
 @api_view(['GET'])
+@cache_response(CareerSuccess, Company, Department)
 def get_all_career_successes(request):
     """Get all career success stories with optional filtering"""
     queryset = CareerSuccess.objects.select_related('department')
@@ -409,8 +413,7 @@ def get_all_career_successes(request):
             Q(department__name__icontains=search_term)
         )
     
-    successes = [career_success_to_dto(success) for success in queryset]
-    return Response(successes)
+    return list_response(request, queryset, career_success_to_dto)
 
 
 @swagger_auto_schema(
@@ -423,6 +426,7 @@ def get_all_career_successes(request):
     }
 )
 @api_view(['GET'])
+@cache_response(CareerSuccess, Company, Department)
 def get_career_success(request, success_id):
     """Get career success details"""
     success = get_object_or_404(
@@ -6,6 +6,9 @@ from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 from base.models.commitee_model import Committee, CommitteeCategory
 from django.db.models import Q
+from base.pagination import PAGINATION_PARAMETERS, list_response
+from base.reference_data import ReferenceTable
+from base.response_cache import cache_response
 
 
 def committee_category_to_dto(category):
@@ -19,6 +22,12 @@ def committee_category_to_dto(category):
     }
 
 
+COMMITTEE_CATEGORY_TABLE = ReferenceTable(
+    'committee_categories', CommitteeCategory,
+    lambda: [committee_category_to_dto(category) for category in CommitteeCategory.objects.all()]
+)
+
+
 def committee_to_dto(committee):
     """Convert Committee model to DTO"""
     return {
@@ -45,11 +54,10 @@ def committee_to_dto(committee):
     }
 )
 @api_view(['GET'])
+@cache_response(CommitteeCategory)
 def get_all_committee_categories(request):
     """Get all committee categories"""
-    categories = CommitteeCategory.objects.all()
-    categories_dto = [committee_category_to_dto(category) for category in categories]
-    return Response(categories_dto, status=status.HTTP_200_OK)
+    return Response(COMMITTEE_CATEGORY_TABLE.rows(), status=status.HTTP_200_OK)
 
 
 @swagger_auto_schema(
@@ -157,12 +165,13 @@ def delete_committee_category(request, category_id):
             type=openapi.TYPE_STRING,
             required=False
         )
-    ],
+    ] + PAGINATION_PARAMETERS,
     responses={
         200: openapi.Response(description="Committee members retrieved successfully")
     }
 )
 @api_view(['GET'])
+@cache_response(Committee, CommitteeCategory)
 def get_all_committee_members(request):
     """Get all committee members with optional filtering"""
     queryset = Committee.objects.select_related('category')
@@ -181,8 +190,7 @@ def get_all_committee_members(request):
             Q(position__icontains=search_term)
         )
     
-    committees_dto = [committee_to_dto(committee) for committee in queryset]
-    return Response(committees_dto, status=status.HTTP_200_OK)
+    return list_response(request, queryset, committee_to_dto)
 
 
 @swagger_auto_schema(
@@ -242,6 +250,7 @@ def create_committee_member(request):
     }
 )
 @api_view(['GET'])
+@cache_response(Committee, CommitteeCategory)
 def get_committee_member(request, member_id):
     """Get committee member details"""
     committee = get_object_or_404(Committee.objects.select_related('category'), id=member_id)
@@ -329,6 +338,7 @@ def delete_committee_member(request, member_id):
     }
 )
 @api_view(['GET'])
+@cache_response(Committee, CommitteeCategory)
 def search_committee_members(request, search_term):
     """Search committee members by name, designation, or position"""
     committees = Committee.objects.select_related('category').filter(
@@ -5,14 +5,16 @@ from rest_framework import status
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 from base.models.carrer_model import Company
+from base.reference_data import ReferenceTable
+from base.response_cache import cache_response
 
 
-def company_to_dto(company):
-    """Convert Company model to DTO"""
+def company_to_dto(company, file_names=False):
+    """Convert Company model to DTO; `file_names` gives storage names instead of URLs"""
     return {
         'id': company.id,
         'name': company.name,
-        'image': company.image.url if company.image else None,
+        'image': (company.image.name if file_names else company.image.url) if company.image else None,
         'website': company.website,
         'description': company.description,
         'created_at': company.created_at,
@@ -20,6 +22,13 @@ def company_to_dto(company):
     }
 
 
+COMPANY_TABLE = ReferenceTable(
+    'companies', Company,
+    lambda: [company_to_dto(company, file_names=True) for company in Company.objects.all()],
+    file_fields=('image',)
+)
+
+
 # ============================================================================
 # COMPANY CRUD ENDPOINTS
 # ============================================================================
@@ -33,10 +42,10 @@ def company_to_dto(company):
     }
 )
 @api_view(['GET'])
+@cache_response(Company)
 def get_all_companies(request):
     """Get all companies"""
-    companies = Company.objects.all()
-    companies_data = [company_to_dto(company) for company in companies]
+    companies_data = COMPANY_TABLE.rows()
 
     return Response({
         'companies': companies_data,
@@ -108,6 +117,7 @@ def create_company(request):
     }
 )
 @api_view(['GET'])
+@cache_response(Company)
 def get_company(request, company_id):
     """Get company details by ID"""
     try:
@@ -231,6 +241,7 @@ def delete_company(request, company_id):
     }
 )
 @api_view(['GET'])
+@cache_response(Company)
 def search_companies(request, search_term):
     """Search companies by name"""
     companies = Company.objects.filter(
@@ -1,4 +1,5 @@
 from django.shortcuts import get_object_or_404
+from django.db.models import Prefetch
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
 from rest_framework import status
@@ -7,9 +8,14 @@ from drf_yasg import openapi
 from base.models.course_model import (
     Course, AboutTheCourseModel, NumberDataATD, QuickLinksModel,
     SubjectsModel, LabModel, CurriculumModel, BenefitsModel,
-    CTAModel, CourseBanner, POPSOPEO
+    CourseContact, CTAModel, CourseBanner, POPSOPEO
 )
 from base.models.department_model import Department
+from base.department_lookup import find_department, resolve_department
+from base.utils import normalize_name
+from base.pagination import PAGINATION_PARAMETERS, list_response
+from base.projections import VIEW_PARAMETER, wants_full_view
+from base.response_cache import cache_response
 
 
 def course_to_dto(course):
@@ -52,6 +58,32 @@ def course_to_dto(course):
         }
 
 
+# Columns needed by course_list_to_dto(); descriptions and SEO fields stay in MySQL
+COURSE_LIST_FIELDS = (
+    'name', 'slug', 'department', 'ug', 'pg', 'phd', 'created_at', 'updated_at',
+    'department__name', 'department__slug',
+)
+
+
+def course_list_to_dto(course):
+    """Convert Course model to the slim list DTO (no descriptions or rich-text fields)"""
+    return {
+        'id': course.id,
+        'name': course.name or '',
+        'slug': course.slug or None,
+        'department': {
+            'id': course.department.id,
+            'name': course.department.name or '',
+            'slug': course.department.slug or None
+        } if course.department else None,
+        'ug': bool(course.ug),
+        'pg': bool(course.pg),
+        'phd': bool(course.phd),
+        'created_at': course.created_at.isoformat() if course.created_at else None,
+        'updated_at': course.updated_at.isoformat() if course.updated_at else None,
+    }
+
+
 def number_data_to_dto(number_data):
     """Convert NumberDataATD model to DTO"""
     return {
@@ -166,6 +198,45 @@ def banner_to_dto(banner):
     }
 
 
+# Every table course_page_to_dto() reads (see base/response_cache.py)
+COURSE_PAGE_MODELS = (
+    Course, Department, AboutTheCourseModel, NumberDataATD, QuickLinksModel, SubjectsModel,
+    LabModel, CurriculumModel, BenefitsModel, CourseContact, CTAModel, CourseBanner, POPSOPEO
+)
+
+
+def course_page_queryset():
+    """Course queryset with every course page relation prefetched (one query per relation)"""
+    return Course.objects.select_related('department').prefetch_related(
+        Prefetch(
+            'about_sections',
+            queryset=AboutTheCourseModel.objects.prefetch_related('number_data')
+        ),
+        'quick_links', 'subjects', 'labs', 'curriculum', 'benefits',
+        'contacts', 'cta_sections', 'banners', 'po_pso_peo'
+    )
+
+
+def course_page_to_dto(course):
+    """Convert a course loaded through course_page_queryset() to the course page DTO"""
+    return {
+        'course': course_to_dto(course),
+        'about_sections': [about_course_to_dto(about) for about in course.about_sections.all()],
+        'quick_links': [quick_link_to_dto(link) for link in course.quick_links.all()],
+        'subjects': [subject_to_dto(subject) for subject in course.subjects.all()],
+        'labs': [lab_to_dto(lab) for lab in course.labs.all()],
+        'curriculum': [curriculum_to_dto(curr) for curr in course.curriculum.all()],
+        'benefits': [benefit_to_dto(benefit) for benefit in course.benefits.all()],
+        'contacts': [contact_to_dto(contact) for contact in course.contacts.all()],
+        'cta_sections': [cta_to_dto(cta) for cta in course.cta_sections.all()],
+        'banners': [banner_to_dto(banner) for banner in course.banners.all()],
+        'po_pso_peo': [
+            {'name': item.name, 'content': item.content}
+            for item in course.po_pso_peo.all()
+        ],
+    }
+
+
 @swagger_auto_schema(
     method='get',
     operation_description="Get all courses. Optionally filter by department using 'department' query parameter (can be department slug or ID)",
@@ -177,8 +248,9 @@ def banner_to_dto(banner):
             description="Filter courses by department. Can be department slug (e.g., 'computer-science') or department ID (e.g., '1')",
             type=openapi.TYPE_STRING,
             required=False
-        )
-    ],
+        ),
+        VIEW_PARAMETER
+    ] + PAGINATION_PARAMETERS,
     responses={
         200: openapi.Response(
             description="Courses retrieved successfully",
@@ -203,37 +275,32 @@ def banner_to_dto(banner):
     }
 )
 @api_view(['GET'])
+@cache_response(Course, Department)
 def get_all_courses(request):
     """Get all courses, optionally filtered by department (slug or ID)"""
-    courses = Course.objects.all()
+    try:
+        full_view = wants_full_view(request)
+    except ValueError as e:
+        return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    if full_view:
+        courses = Course.objects.select_related('department')
+    else:
+        courses = Course.objects.select_related('department').only(*COURSE_LIST_FIELDS)
     
     # Filter by department if provided
     department_param = request.query_params.get('department')
     if department_param:
-        try:
-            # Try to match by slug first
-            try:
-                department = Department.objects.get(slug=department_param)
-            except Department.DoesNotExist:
-                # If slug doesn't match, try ID
-                try:
-                    department = Department.objects.get(id=int(department_param))
-                except (ValueError, Department.DoesNotExist):
-                    return Response(
-                        {"error": f"Department '{department_param}' not found"},
-                        status=status.HTTP_404_NOT_FOUND
-                    )
-            
-            courses = courses.filter(department=department)
-        except Exception as e:
+        department = find_department(department_param)
+        if department is None:
             return Response(
-                {"error": f"Error filtering by department: {str(e)}"},
-                status=status.HTTP_400_BAD_REQUEST
+                {"error": f"Department '{department_param}' not found"},
+                status=status.HTTP_404_NOT_FOUND
             )
+        courses = courses.filter(department=department)
     
     try:
-        courses_dto = [course_to_dto(course) for course in courses]
-        return Response(courses_dto, status=status.HTTP_200_OK)
+        return list_response(request, courses, course_to_dto if full_view else course_list_to_dto)
     except Exception as e:
         import traceback
         return Response(
@@ -286,110 +353,20 @@ def get_all_courses(request):
     }
 )
 @api_view(['GET'])
+@cache_response(*COURSE_PAGE_MODELS)
 def get_course_by_name(request, course_name):
     """Get complete course details by name with all related data"""
-    try:
-        # Case-insensitive search for course by name
-        course = Course.objects.get(name__iexact=course_name)
-    except Course.DoesNotExist:
+    # Exact match on the indexed normalized name; duplicates resolve to the oldest course
+    course = course_page_queryset().filter(
+        name_normalized=normalize_name(course_name)
+    ).order_by('id').first()
+    if course is None:
         return Response(
             {"error": f"Course '{course_name}' not found"}, 
             status=status.HTTP_404_NOT_FOUND
         )
-    
-    # Get PO-PSO-PEO
-    po_pso_peo = POPSOPEO.objects.filter(course=course)
-    po_pso_peo_data = [
-        {'name': item.name, 'content': item.content}
-        for item in po_pso_peo
-    ]
-    
-    # Return the same comprehensive data structure as get_course_detail
-    course_dto = {
-        'course': course_to_dto(course),
-        'about_sections': [about_course_to_dto(about) for about in course.about_sections.all()],
-        'quick_links': [quick_link_to_dto(link) for link in course.quick_links.all()],
-        'subjects': [subject_to_dto(subject) for subject in course.subjects.all()],
-        'labs': [lab_to_dto(lab) for lab in course.labs.all()],
-        'curriculum': [curriculum_to_dto(curr) for curr in course.curriculum.all()],
-        'benefits': [benefit_to_dto(benefit) for benefit in course.benefits.all()],
-        'contacts': [contact_to_dto(contact) for contact in course.contacts.all()],
-        'cta_sections': [cta_to_dto(cta) for cta in course.cta_sections.all()],
-        'banners': [banner_to_dto(banner) for banner in course.banners.all()],
-        'po_pso_peo': po_pso_peo_data,
-    }
-    
-    return Response(course_dto, status=status.HTTP_200_OK)
-
-
-# ============================================================================
-# DEPARTMENT-COURSE RELATIONSHIP ENDPOINTS
-# ============================================================================
-
-@swagger_auto_schema(
-    method='get',
-    operation_description="Get all courses for a specific department",
-    operation_id="get_courses_by_department",
-    responses={
-        200: openapi.Response(description="List of courses for the department"),
-        404: openapi.Response(description="Department not found")
-    }
-)
-@api_view(['GET'])
-def get_courses_by_department(request, department_id):
-    """Get all courses for a specific department (by ID or slug)"""
-    try:
-        dept_id = int(department_id)
-        department = get_object_or_404(Department, id=dept_id)
-    except ValueError:
-        department = get_object_or_404(Department, slug=department_id)
 
-    courses = Course.objects.filter(department=department)
-    course_dtos = [course_to_dto(course) for course in courses]
-
-    return Response({
-        'department': {
-            'id': department.id,
-            'name': department.name,
-            'slug': department.slug
-        },
-        'courses': course_dtos,
-        'total_courses': len(course_dtos)
-    }, status=status.HTTP_200_OK)
-
-
-@swagger_auto_schema(
-    method='get',
-    operation_description="Get department details for a specific course",
-    operation_id="get_course_department",
-    responses={
-        200: openapi.Response(description="Department details for the course"),
-        404: openapi.Response(description="Course not found")
-    }
-)
-@api_view(['GET'])
-def get_course_department(request, course_id):
-    """Get department details for a specific course"""
-    try:
-        course = Course.objects.select_related('department').get(id=course_id)
-    except Course.DoesNotExist:
-        return Response({"error": "Course not found"}, status=status.HTTP_404_NOT_FOUND)
-
-    return Response({
-        'course': {
-            'id': course.id,
-            'name': course.name
-        },
-        'department': {
-            'id': course.department.id,
-            'name': course.department.name,
-            'ug': course.department.ug,
-            'pg': course.department.pg,
-            'phd': course.department.phd,
-            'vision': course.department.vision,
-            'mission': course.department.mission
-        }
-    }, status=status.HTTP_200_OK)
+    return Response(course_page_to_dto(course), status=status.HTTP_200_OK)
 
 
 @swagger_auto_schema(
@@ -429,6 +406,7 @@ def get_course_department(request, course_id):
     }
 )
 @api_view(['GET'])
+@cache_response(Course, Department)
 def search_courses_by_name(request, search_term):
     """Search courses by name with partial matching"""
     courses = Course.objects.filter(name__icontains=search_term)
@@ -462,6 +440,7 @@ def search_courses_by_name(request, search_term):
     }
 )
 @api_view(['GET'])
+@cache_response(Course, QuickLinksModel)
 def get_course_quick_links(request, course_id):
     """Get quick links for a specific course"""
     course = get_object_or_404(Course, id=course_id)
@@ -488,6 +467,7 @@ def get_course_quick_links(request, course_id):
     }
 )
 @api_view(['GET'])
+@cache_response(Course, SubjectsModel)
 def get_course_subjects(request, course_id):
     """Get subjects for a specific course"""
     course = get_object_or_404(Course, id=course_id)
@@ -514,6 +494,7 @@ def get_course_subjects(request, course_id):
     }
 )
 @api_view(['GET'])
+@cache_response(Course, LabModel)
 def get_course_labs(request, course_id):
     """Get labs for a specific course"""
     course = get_object_or_404(Course, id=course_id)
@@ -540,6 +521,7 @@ def get_course_labs(request, course_id):
     }
 )
 @api_view(['GET'])
+@cache_response(Course, CurriculumModel)
 def get_course_curriculum(request, course_id):
     """Get curriculum for a specific course"""
     course = get_object_or_404(Course, id=course_id)
@@ -566,6 +548,7 @@ def get_course_curriculum(request, course_id):
     }
 )
 @api_view(['GET'])
+@cache_response(Course, BenefitsModel)
 def get_course_benefits(request, course_id):
     """Get benefits for a specific course"""
     course = get_object_or_404(Course, id=course_id)
@@ -592,6 +575,7 @@ def get_course_benefits(request, course_id):
     }
 )
 @api_view(['GET'])
+@cache_response(Course, CourseContact)
 def get_course_contacts(request, course_id):
     """Get contacts for a specific course"""
     course = get_object_or_404(Course, id=course_id)
@@ -608,6 +592,7 @@ def get_course_contacts(request, course_id):
     }
 )
 @api_view(['GET'])
+@cache_response(NumberDataATD)
 def get_featured_number_data(request):
     """Get all featured number data across courses"""
     featured_data = NumberDataATD.objects.filter(featured=True)
@@ -659,33 +644,11 @@ def get_featured_number_data(request):
     }
 )
 @api_view(['GET'])
+@cache_response(*COURSE_PAGE_MODELS)
 def get_course_detail(request, course_id):
     """Get complete course details by ID with all related data"""
-    course = get_object_or_404(Course, id=course_id)
-    
-    # Get PO-PSO-PEO
-    po_pso_peo = POPSOPEO.objects.filter(course=course)
-    po_pso_peo_data = [
-        {'name': item.name, 'content': item.content}
-        for item in po_pso_peo
-    ]
-    
-    # Return the same comprehensive data structure as get_course_by_name
-    course_dto = {
-        'course': course_to_dto(course),
-        'about_sections': [about_course_to_dto(about) for about in course.about_sections.all()],
-        'quick_links': [quick_link_to_dto(link) for link in course.quick_links.all()],
-        'subjects': [subject_to_dto(subject) for subject in course.subjects.all()],
-        'labs': [lab_to_dto(lab) for lab in course.labs.all()],
-        'curriculum': [curriculum_to_dto(curr) for curr in course.curriculum.all()],
-        'benefits': [benefit_to_dto(benefit) for benefit in course.benefits.all()],
-        'contacts': [contact_to_dto(contact) for contact in course.contacts.all()],
-        'cta_sections': [cta_to_dto(cta) for cta in course.cta_sections.all()],
-        'banners': [banner_to_dto(banner) for banner in course.banners.all()],
-        'po_pso_peo': po_pso_peo_data,
-    }
-    
-    return Response(course_dto, status=status.HTTP_200_OK)
+    course = get_object_or_404(course_page_queryset(), id=course_id)
+    return Response(course_page_to_dto(course), status=status.HTTP_200_OK)
 
 
 # ============================================================================
@@ -702,13 +665,10 @@ def get_course_detail(request, course_id):
     }
 )
 @api_view(['GET'])
+@cache_response(Course, Department)
 def get_courses_by_department(request, department_id):
     """Get all courses for a specific department (by ID or slug)"""
-    try:
-        dept_id = int(department_id)
-        department = get_object_or_404(Department, id=dept_id)
-    except ValueError:
-        department = get_object_or_404(Department, slug=department_id)
+    department = resolve_department(department_id)
 
     courses = Course.objects.filter(department=department)
     course_dtos = [course_to_dto(course) for course in courses]
@@ -734,6 +694,7 @@ def get_courses_by_department(request, department_id):
     }
 )
 @api_view(['GET'])
+@cache_response(Course, Department)
 def get_course_department(request, course_id):
     """Get department details for a specific course"""
     try:
@@ -767,6 +728,7 @@ def get_course_department(request, course_id):
     }
 )
 @api_view(['GET'])
+@cache_response(Course)
 def get_courses_without_department(request):
     """Get all courses that don't have a department assigned"""
     courses = Course.objects.filter(department__isnull=True)
@@ -1,14 +1,21 @@
-from django.shortcuts import get_object_or_404
+from django.db import transaction
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
+from rest_framework import status
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
-from ..serializers import DepartmentStatisticsSerializer
-from base.models.department_model import (
-    Department, AboutDepartment, NumberData, QuickLink,
-    ProgramOffered, Curriculum, DepartmentContact,
-    CTA, Facility, Banner, DepartmentStatistics
+from ..serializers import DepartmentStatisticsSerializer, DepartmentStatisticsBulkSerializer
+from base.department_lookup import resolve_department
+from base.department_page import (
+    DEPARTMENT_PAGE_MODELS, featured_statistic_to_dto, statistic_to_dto, get_department_page,
+    get_department_pages, parse_department_sections
 )
+from base.models.course_model import Course
+from base.models.department_model import Department, Facility, DepartmentStatistics, ProgramOffered
+from base.projections import VIEW_PARAMETER, wants_full_view
+from base.reference_data import ReferenceTable
+from base.response_cache import cache_response
+from base.signals import statistics_bulk_written
 
 @swagger_auto_schema(
     method='get',
@@ -21,6 +28,20 @@ from base.models.department_model import (
             description="ID of the department to retrieve",
             type=openapi.TYPE_INTEGER,
             required=True
+        ),
+        openapi.Parameter(
+            'include',
+            openapi.IN_QUERY,
+            description="Comma separated sections to return (e.g. 'banners,programs'). Defaults to all sections",
+            type=openapi.TYPE_STRING,
+            required=False
+        ),
+        openapi.Parameter(
+            'exclude',
+            openapi.IN_QUERY,
+            description="Comma separated sections to leave out (e.g. 'vision,mission,facilities')",
+            type=openapi.TYPE_STRING,
+            required=False
         )
     ],
     responses={
@@ -47,179 +68,144 @@ from base.models.department_model import (
                 }
             }
         ),
+        400: "Unknown section in include/exclude",
         404: "Department not found"
     }
 )
 @api_view(['GET'])
+@cache_response(*DEPARTMENT_PAGE_MODELS)
 def get_department_detail(request, department_id):
-    """Get all details for a specific department (by ID)"""
+    """Get all details for a specific department (by ID or slug), optionally limited to some sections"""
     try:
-        # Try to parse as integer first
-        dept_id = int(department_id)
-        department = get_object_or_404(Department, id=dept_id)
-    except ValueError:
-        # If not an integer, treat as slug
-        department = get_object_or_404(Department, slug=department_id)
-    
-    # Get related data
-    about_sections = AboutDepartment.objects.filter(department=department)
-    about_data = []
-    for section in about_sections:
-        numbers = NumberData.objects.filter(about_department=section)
-        about_data.append({
-            'heading': section.heading,
-            'content': section.content,
-            'image': section.image.url if section.image else None,
-            'alt': section.alt,
-            'numbers': [
-                {
-                    'number': num.number,
-                    'symbol': num.symbol,
-                    'text': num.text,
-                    'featured': num.featured,
-                    'unique_id': num.unique_id
-                } for num in numbers
-            ]
-        })
-    
-    # Get quick links
-    quick_links = QuickLink.objects.filter(department=department)
-    quick_links_data = [
-        {'name': link.name, 'link': link.link}
-        for link in quick_links
-    ]
-    
-    # Get programs (ordered by display_order)
-    programs = department.get_ordered_programs()
-    programs_data = [
-        {
-            'id': prog.id,
-            'course': {
-                'id': prog.course.id if prog.course else None,
-                'name': prog.course.name if prog.course else None,
-                'slug': prog.course.slug if prog.course else None
-            } if prog.course else None,
-            'display_order': prog.display_order,
-            'description': prog.description,
-            'explore_link': prog.explore_link,
-            'apply_link': prog.apply_link
-        }
-        for prog in programs
-    ]
-    
-    # Get curriculum
-    curriculum = Curriculum.objects.filter(department=department)
-    curriculum_data = [
-        {
-            'id': curr.id,
-            'title': curr.title,
-            'description': curr.description,
-            'file': curr.file.url if curr.file else None
-        }
-        for curr in curriculum
-    ]
-    
-    # Get benefits (Benefit model removed - return empty list)
-    benefits_data = []
-    
-    # Get contacts
-    contacts = DepartmentContact.objects.filter(department=department)
-    contacts_data = [
-        {
-            'name': contact.name,
-            'position': contact.position,
-            'email': contact.email,
-            'phone': contact.phone,
-            'image': contact.image.url if contact.image else None,
-            'alt': contact.alt,
-            'heading': contact.heading
-        }
-        for contact in contacts
-    ]
-    
-    # Get CTAs
-    ctas = CTA.objects.filter(department=department)
-    ctas_data = [
-        {'heading': cta.heading, 'link': cta.link}
-        for cta in ctas
-    ]
-    
-    # Get facilities
-    facilities = Facility.objects.filter(department=department)
-    facilities_data = [
-        {
-            'id': fac.id,
-            'heading': fac.heading,
-            'description': fac.description,
-            'image': fac.image.url if fac.image else None,
-            'alt': fac.alt
-        }
-        for fac in facilities
-    ]
-    
-    # Get banners
-    banners = Banner.objects.filter(department=department)
-    banners_data = [
-        {
-            'image': banner.image.url if banner.image else None,
-            'alt': banner.alt
-        }
-        for banner in banners
-    ]
+        sections = parse_department_sections(
+            request.query_params.get('include'),
+            request.query_params.get('exclude')
+        )
+    except ValueError as e:
+        return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
-    # Get statistics
-    statistics = DepartmentStatistics.objects.filter(department=department)
-    statistics_data = [
-        {
-            'id': stat.id,
-            'name': stat.name,
-            'number': stat.number,
-            'suffix': stat.suffix,
-            'featured': stat.featured,
-            'display_order': stat.display_order,
-            'display_value': f"{stat.number}{stat.suffix}" if stat.suffix else str(stat.number)
-        }
-        for stat in statistics
-    ]
+    # Served from the pre-rendered snapshot (see base/department_page.py)
+    return Response(get_department_page(department_id, sections))
+
+
+MAX_BATCH_DEPARTMENTS = 50
 
-    # Compile all data
+
+@swagger_auto_schema(
+    method='get',
+    operation_description="Get full details for several departments in one request",
+    operation_id="get_departments_batch",
+    manual_parameters=[
+        openapi.Parameter(
+            'ids',
+            openapi.IN_QUERY,
+            description="Comma separated department IDs (e.g. '1,2,3')",
+            type=openapi.TYPE_STRING,
+            required=False
+        ),
+        openapi.Parameter(
+            'slugs',
+            openapi.IN_QUERY,
+            description="Comma separated department slugs (e.g. 'cse,ece')",
+            type=openapi.TYPE_STRING,
+            required=False
+        ),
+        openapi.Parameter(
+            'include',
+            openapi.IN_QUERY,
+            description="Comma separated sections to return. Defaults to all sections",
+            type=openapi.TYPE_STRING,
+            required=False
+        ),
+        openapi.Parameter(
+            'exclude',
+            openapi.IN_QUERY,
+            description="Comma separated sections to leave out",
+            type=openapi.TYPE_STRING,
+            required=False
+        )
+    ],
+    responses={
+        200: openapi.Response(
+            description="Departments retrieved successfully",
+            examples={
+                "application/json": {
+                    "departments": [],
+                    "not_found": ["unknown-slug"]
+                }
+            }
+        ),
+        400: "Missing, invalid or too many identifiers"
+    }
+)
+@api_view(['GET'])
+@cache_response(*DEPARTMENT_PAGE_MODELS)
+def get_departments_batch(request):
+    """Get detail pages for several departments (by IDs and/or slugs) with a fixed number of queries"""
     try:
-        department_data = {
-            'id': department.id,
-            'name': department.name,
-            'slug': department.slug,
-            'ug': department.ug,
-            'pg': department.pg,
-            'phd': department.phd,
-            'vision': department.vision,
-            'mission': department.mission,
-            'programs_image': department.programs_image.url if department.programs_image else None,
-            'programs_image_alt': department.programs_image_alt,
-            'facilities_overview': department.facilities_overview,
-            'about_sections': about_data,
-            'quick_links': quick_links_data,
-            'programs': programs_data,
-            'curriculum': curriculum_data,
-            'benefits': benefits_data,
-            'contacts': contacts_data,
-            'ctas': ctas_data,
-            'facilities': facilities_data,
-            'banners': banners_data,
-            'statistics': statistics_data
-        }
-        
-        return Response(department_data)
-    except Exception as e:
-        import traceback
+        ids = [int(value) for value in request.query_params.get('ids', '').split(',') if value.strip()]
+    except ValueError:
+        return Response({"error": "ids must be comma separated integers"}, status=status.HTTP_400_BAD_REQUEST)
+    slugs = [value.strip() for value in request.query_params.get('slugs', '').split(',') if value.strip()]
+
+    if not ids and not slugs:
+        return Response({"error": "Provide ids and/or slugs"}, status=status.HTTP_400_BAD_REQUEST)
+    if len(ids) + len(slugs) > MAX_BATCH_DEPARTMENTS:
         return Response(
-            {"error": f"Error serializing department data: {str(e)}", "traceback": traceback.format_exc()},
-            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            {"error": f"At most {MAX_BATCH_DEPARTMENTS} departments can be requested at once"},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    try:
+        sections = parse_department_sections(
+            request.query_params.get('include'),
+            request.query_params.get('exclude')
         )
+    except ValueError as e:
+        return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    departments, not_found = get_department_pages(ids, slugs, sections)
+    return Response({'departments': departments, 'not_found': not_found})
+
+
+# Columns needed by the department list; vision, mission and SEO fields stay in MySQL
+DEPARTMENT_LIST_FIELDS = ('name', 'slug', 'ug', 'pg', 'phd', 'programs_image', 'programs_image_alt')
+
+
+def department_list_to_dto(dept, full_view=False, file_names=False):
+    """Convert a Department loaded with DEPARTMENT_LIST_FIELDS to a list entry DTO.
+
+    `file_names` gives storage names instead of URLs.
+    """
+    data = {
+        'id': dept.id,
+        'name': dept.name,
+        'slug': dept.slug,
+        'ug': dept.ug,
+        'pg': dept.pg,
+        'phd': dept.phd,
+        'programs_image': (
+            (dept.programs_image.name if file_names else dept.programs_image.url) if dept.programs_image else None
+        ),
+        'programs_image_alt': dept.programs_image_alt,
+    }
+    if full_view:
+        data['facilities_overview'] = dept.facilities_overview
+    return data
+
+
+DEPARTMENT_TABLE = ReferenceTable(
+    'departments', Department,
+    lambda: [department_list_to_dto(dept, file_names=True) for dept in Department.objects.only(*DEPARTMENT_LIST_FIELDS)],
+    file_fields=('programs_image',)
+)
+
 
 @swagger_auto_schema(
     method='get',
     operation_description="Get a list of all departments with basic information",
     operation_id="get_all_departments",
+    manual_parameters=[VIEW_PARAMETER],
     responses={
         200: openapi.Response(
             description="List of departments retrieved successfully",
@@ -240,25 +226,19 @@ def get_department_detail(request, department_id):
     }
 )
 @api_view(['GET'])
+@cache_response(Department)
 def get_all_departments(request):
     """Get a list of all departments with basic information"""
-    departments = Department.objects.all()
-    departments_data = [
-        {
-            'id': dept.id,
-            'name': dept.name,
-            'slug': dept.slug,
-            'ug': dept.ug,
-            'pg': dept.pg,
-            'phd': dept.phd,
-            'programs_image': dept.programs_image.url if dept.programs_image else None,
-            'programs_image_alt': dept.programs_image_alt,
-            'facilities_overview': dept.facilities_overview
-        }
-        for dept in departments
-    ]
-    
-    return Response({'departments': departments_data})
+    try:
+        full_view = wants_full_view(request)
+    except ValueError as e:
+        return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    if not full_view:
+        return Response({'departments': DEPARTMENT_TABLE.rows()})
+
+    departments = Department.objects.only(*DEPARTMENT_LIST_FIELDS, 'facilities_overview')
+    return Response({'departments': [department_list_to_dto(dept, full_view=True) for dept in departments]})
 
 @swagger_auto_schema(
     method='get',
@@ -294,13 +274,10 @@ def get_all_departments(request):
     }
 )
 @api_view(['GET'])
+@cache_response(Department, ProgramOffered, Course)
 def get_department_programs(request, department_id):
     """Get all programs for a specific department (by ID or slug)"""
-    try:
-        dept_id = int(department_id)
-        department = get_object_or_404(Department, id=dept_id)
-    except ValueError:
-        department = get_object_or_404(Department, slug=department_id)
+    department = resolve_department(department_id)
     programs = department.get_ordered_programs()
 
     programs_data = [
@@ -356,13 +333,10 @@ def get_department_programs(request, department_id):
     }
 )
 @api_view(['GET'])
+@cache_response(Department, Facility)
 def get_department_facilities(request, department_id):
     """Get all facilities for a specific department (by ID or slug)"""
-    try:
-        dept_id = int(department_id)
-        department = get_object_or_404(Department, id=dept_id)
-    except ValueError:
-        department = get_object_or_404(Department, slug=department_id)
+    department = resolve_department(department_id)
     facilities = Facility.objects.filter(department=department)
     
     facilities_data = [
@@ -402,28 +376,13 @@ def get_department_facilities(request, department_id):
     }
 )
 @api_view(['GET'])
+@cache_response(Department, DepartmentStatistics)
 def get_department_statistics(request, department_id):
     """Get all statistics for a specific department (by ID or slug)"""
-    try:
-        dept_id = int(department_id)
-        department = get_object_or_404(Department, id=dept_id)
-    except ValueError:
-        department = get_object_or_404(Department, slug=department_id)
+    department = resolve_department(department_id)
 
     statistics = DepartmentStatistics.objects.filter(department=department)
-    statistics_data = [
-        {
-            'id': stat.id,
-            'name': stat.name,
-            'number': stat.number,
-            'suffix': stat.suffix,
-            'description': stat.description,
-            'featured': stat.featured,
-            'display_order': stat.display_order,
-            'display_value': f"{stat.number}{stat.suffix}" if stat.suffix else str(stat.number)
-        }
-        for stat in statistics
-    ]
+    statistics_data = [statistic_to_dto(stat) for stat in statistics]
 
     return Response({
         'department': {
@@ -455,7 +414,6 @@ def get_department_statistics(request, department_id):
             'name': openapi.Schema(type=openapi.TYPE_STRING, description="Name of the statistic"),
             'number': openapi.Schema(type=openapi.TYPE_INTEGER, description="Numeric value"),
             'suffix': openapi.Schema(type=openapi.TYPE_STRING, description="Suffix text"),
-            'description': openapi.Schema(type=openapi.TYPE_STRING, description="Description of the statistic"),
             'featured': openapi.Schema(type=openapi.TYPE_BOOLEAN, description="Mark as featured"),
             'display_order': openapi.Schema(type=openapi.TYPE_INTEGER, description="Display order")
         }
@@ -469,11 +427,7 @@ def get_department_statistics(request, department_id):
 @api_view(['POST'])
 def create_department_statistic(request, department_id):
     """Create a new statistic for a department (by ID or slug)"""
-    try:
-        dept_id = int(department_id)
-        department = get_object_or_404(Department, id=dept_id)
-    except ValueError:
-        department = get_object_or_404(Department, slug=department_id)
+    department = resolve_department(department_id)
 
     data = request.data.copy()
     data['department'] = department.id
@@ -483,21 +437,161 @@ def create_department_statistic(request, department_id):
         statistic = serializer.save()
         return Response({
             'message': 'Statistic created successfully',
-            'statistic': {
-                'id': statistic.id,
-                'name': statistic.name,
-                'number': statistic.number,
-                'suffix': statistic.suffix,
-                'description': statistic.description,
-                'featured': statistic.featured,
-                'display_order': statistic.display_order,
-                'display_value': f"{statistic.number}{statistic.suffix}" if statistic.suffix else str(statistic.number)
-            }
+            'statistic': statistic_to_dto(statistic)
         }, status=201)
 
     return Response(serializer.errors, status=400)
 
 
+BULK_STATISTIC_FIELDS = ['name', 'number', 'suffix', 'featured', 'display_order']
+
+
+@swagger_auto_schema(
+    method='post',
+    operation_description=(
+        "Create and update several statistics of a department in one transaction. "
+        "Items with an `id` update that statistic, items without one are created. "
+        "`order` lists statistic IDs in their new display order. "
+        "With `partial` set, invalid items are reported and the valid ones are still written."
+    ),
+    operation_id="bulk_write_department_statistics",
+    manual_parameters=[
+        openapi.Parameter(
+            'department_id',
+            openapi.IN_PATH,
+            description="ID or slug of the department",
+            type=openapi.TYPE_STRING,
+            required=True
+        )
+    ],
+    request_body=openapi.Schema(
+        type=openapi.TYPE_OBJECT,
+        properties={
+            'statistics': openapi.Schema(
+                type=openapi.TYPE_ARRAY,
+                items=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        'id': openapi.Schema(type=openapi.TYPE_INTEGER, description="Statistic to update (omit to create)"),
+                        'name': openapi.Schema(type=openapi.TYPE_STRING, description="Name of the statistic"),
+                        'number': openapi.Schema(type=openapi.TYPE_INTEGER, description="Numeric value"),
+                        'suffix': openapi.Schema(type=openapi.TYPE_STRING, description="Suffix text"),
+                        'featured': openapi.Schema(type=openapi.TYPE_BOOLEAN, description="Mark as featured"),
+                        'display_order': openapi.Schema(type=openapi.TYPE_INTEGER, description="Display order")
+                    }
+                )
+            ),
+            'order': openapi.Schema(
+                type=openapi.TYPE_ARRAY,
+                items=openapi.Schema(type=openapi.TYPE_INTEGER),
+                description="Statistic IDs in display order; overrides display_order of the listed rows"
+            ),
+            'partial': openapi.Schema(type=openapi.TYPE_BOOLEAN, description="Write valid items even if others fail")
+        }
+    ),
+    responses={
+        200: openapi.Response(description="Statistics written successfully"),
+        400: openapi.Response(description="Invalid data (nothing written)"),
+        404: openapi.Response(description="Department not found")
+    }
+)
+@api_view(['POST'])
+def bulk_write_department_statistics(request, department_id):
+    """Create, update and reorder statistics of a department (by ID or slug) in one transaction"""
+    department = resolve_department(department_id)
+
+    items = request.data.get('statistics', [])
+    order = request.data.get('order', [])
+    partial = request.data.get('partial') in (True, 'true', 'True', '1')
+    if not isinstance(items, list) or not isinstance(order, list):
+        return Response(
+            {"error": "'statistics' and 'order' must be lists"},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    if not items and not order:
+        return Response(
+            {"error": "Provide 'statistics' and/or 'order'"},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    serializer = DepartmentStatisticsBulkSerializer(data=items, many=True)
+    if serializer.is_valid():
+        validated = list(serializer.validated_data)
+        errors = [{} for _ in items]
+    else:
+        errors = serializer.errors
+        if not isinstance(errors, list):
+            return Response(errors, status=status.HTTP_400_BAD_REQUEST)
+        # Re-run field validation for the items that passed (no queries involved)
+        validated = [
+            serializer.child.run_validation(item) if not item_errors else None
+            for item, item_errors in zip(items, errors)
+        ]
+        errors = [dict(item_errors) for item_errors in errors]
+
+    # Every referenced ID must belong to this department - one query for all of them
+    try:
+        order = [int(stat_id) for stat_id in order]
+    except (TypeError, ValueError):
+        return Response({"error": "'order' must contain statistic IDs"}, status=status.HTTP_400_BAD_REQUEST)
+    item_ids = [data['id'] for data in validated if data and 'id' in data]
+    existing = DepartmentStatistics.objects.filter(department=department).in_bulk(item_ids + order)
+
+    unknown_order = [stat_id for stat_id in order if stat_id not in existing]
+    if unknown_order or len(set(order)) != len(order):
+        return Response(
+            {"error": "'order' must list distinct statistics of this department", "unknown_ids": unknown_order},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    seen_ids = set()
+    for index, data in enumerate(validated):
+        if not data or 'id' not in data:
+            continue
+        if data['id'] not in existing:
+            errors[index]['id'] = ["Statistic not found in this department"]
+        elif data['id'] in seen_ids:
+            errors[index]['id'] = ["Statistic listed more than once"]
+        seen_ids.add(data['id'])
+
+    has_errors = any(errors)
+    if has_errors and not partial:
+        return Response({'errors': errors}, status=status.HTTP_400_BAD_REQUEST)
+
+    to_create, to_update = [], {}
+    for data, item_errors in zip(validated, errors):
+        if item_errors:
+            continue
+        stat_id = data.pop('id', None)
+        if stat_id is None:
+            to_create.append(DepartmentStatistics(department=department, **data))
+        else:
+            stat = existing[stat_id]
+            for field, value in data.items():
+                setattr(stat, field, value)
+            to_update[stat_id] = stat
+
+    for position, stat_id in enumerate(order):
+        stat = to_update.setdefault(stat_id, existing[stat_id])
+        stat.display_order = position
+
+    with transaction.atomic():
+        if to_create:
+            DepartmentStatistics.objects.bulk_create(to_create)
+        if to_update:
+            DepartmentStatistics.objects.bulk_update(list(to_update.values()), BULK_STATISTIC_FIELDS)
+        statistics_bulk_written(department.id)
+
+    statistics = DepartmentStatistics.objects.filter(department=department)
+    return Response({
+        'message': 'Statistics written successfully',
+        'created': len(to_create),
+        'updated': len(to_update),
+        'statistics': [statistic_to_dto(stat) for stat in statistics],
+        'errors': errors if has_errors else []
+    }, status=status.HTTP_200_OK)
+
+
 @swagger_auto_schema(
     method='get',
     operation_description="Get all featured statistics across all departments",
@@ -507,27 +601,11 @@ def create_department_statistic(request, department_id):
     }
 )
 @api_view(['GET'])
+@cache_response(DepartmentStatistics, Department)
 def get_all_featured_statistics(request):
     """Get all featured statistics across all departments"""
     featured_stats = DepartmentStatistics.objects.filter(featured=True).select_related('department')
-
-    statistics_data = [
-        {
-            'id': stat.id,
-            'name': stat.name,
-            'number': stat.number,
-            'suffix': stat.suffix,
-            'description': stat.description,
-            'featured': stat.featured,
-            'display_order': stat.display_order,
-            'display_value': f"{stat.number}{stat.suffix}" if stat.suffix else str(stat.number),
-            'department': {
-                'id': stat.department.id,
-                'name': stat.department.name
-            }
-        }
-        for stat in featured_stats
-    ]
+    statistics_data = [featured_statistic_to_dto(stat) for stat in featured_stats]
 
     return Response({
         'featured_statistics': statistics_data,
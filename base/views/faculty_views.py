@@ -4,8 +4,15 @@ from rest_framework.response import Response
 from rest_framework import status
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
-from base.models.faculty_model import Faculty, Designation, FacultyBanner
 from base.models.department_model import Department
+from base.models.faculty_model import Faculty, Designation, FacultyBanner
+from base.department_lookup import find_department, resolve_department
+from base.fuzzy_names import DEFAULT_FUZZY_RESULTS, MAX_FUZZY_RESULTS, search_faculty_names
+from base.utils import normalize_name
+from base.pagination import PAGINATION_PARAMETERS, list_response
+from base.projections import VIEW_PARAMETER, wants_full_view
+from base.reference_data import ReferenceTable
+from base.response_cache import cache_response
 
 
 # ============================================================================
@@ -23,6 +30,11 @@ def designation_to_dto(designation):
     }
 
 
+DESIGNATION_TABLE = ReferenceTable(
+    'designations', Designation, lambda: [designation_to_dto(designation) for designation in Designation.objects.all()]
+)
+
+
 def faculty_banner_to_dto(banner):
     """Convert FacultyBanner model to DTO"""
     return {
@@ -34,9 +46,22 @@ def faculty_banner_to_dto(banner):
     }
 
 
-def faculty_to_dto(faculty, include_full_details=False):
-    """Convert Faculty model to DTO"""
-    basic_dto = {
+# Tables every faculty DTO reads (see base/response_cache.py)
+FACULTY_MODELS = (Faculty, Designation, Department)
+
+
+# Columns needed by faculty_list_to_dto(); bio, publications and SEO fields stay in MySQL
+FACULTY_LIST_FIELDS = (
+    'name', 'slug', 'alt', 'image', 'mail_id', 'phone_number', 'link',
+    'created_at', 'updated_at', 'designation', 'department',
+    'designation__name', 'designation__unique_id', 'designation__created_at', 'designation__updated_at',
+    'department__name', 'department__slug',
+)
+
+
+def faculty_list_to_dto(faculty):
+    """Convert Faculty model to the slim list DTO (no rich-text or SEO fields)"""
+    return {
         'id': faculty.id,
         'name': faculty.name,
         'slug': faculty.slug,
@@ -53,6 +78,13 @@ def faculty_to_dto(faculty, include_full_details=False):
         'link': faculty.link,
         'created_at': faculty.created_at.isoformat() if faculty.created_at else None,
         'updated_at': faculty.updated_at.isoformat() if faculty.updated_at else None,
+    }
+
+
+def faculty_to_dto(faculty, include_full_details=False):
+    """Convert Faculty model to DTO"""
+    basic_dto = faculty_list_to_dto(faculty)
+    basic_dto.update({
         # SEO fields
         'meta_title': faculty.meta_title,
         'meta_description': faculty.meta_description,
@@ -65,7 +97,7 @@ def faculty_to_dto(faculty, include_full_details=False):
         'twitter_image': faculty.twitter_image,
         'schema_json': faculty.schema_json,
         'keywords': faculty.keywords,
-    }
+    })
     
     if include_full_details:
         basic_dto.update({
@@ -108,11 +140,10 @@ def faculty_to_dto(faculty, include_full_details=False):
     }
 )
 @api_view(['GET'])
+@cache_response(Designation)
 def get_all_designations(request):
     """Get all designations"""
-    designations = Designation.objects.all()
-    designations_dto = [designation_to_dto(designation) for designation in designations]
-    return Response(designations_dto, status=status.HTTP_200_OK)
+    return Response(DESIGNATION_TABLE.rows(), status=status.HTTP_200_OK)
 
 
 @swagger_auto_schema(
@@ -134,6 +165,7 @@ def get_all_designations(request):
     }
 )
 @api_view(['GET'])
+@cache_response(Designation, Faculty)
 def get_designation_detail(request, designation_id):
     """Get designation details with faculty count"""
     designation = get_object_or_404(Designation, id=designation_id)
@@ -164,8 +196,9 @@ def get_designation_detail(request, designation_id):
             description="Filter by designation ID",
             type=openapi.TYPE_INTEGER,
             required=False
-        )
-    ],
+        ),
+        VIEW_PARAMETER
+    ] + PAGINATION_PARAMETERS,
     responses={
         200: openapi.Response(
             description="Faculty members retrieved successfully",
@@ -194,29 +227,32 @@ def get_designation_detail(request, designation_id):
     }
 )
 @api_view(['GET'])
+@cache_response(*FACULTY_MODELS)
 def get_all_faculty(request):
     """Get all faculty members with optional filtering"""
+    try:
+        full_view = wants_full_view(request)
+    except ValueError as e:
+        return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
     faculty_queryset = Faculty.objects.select_related('designation', 'department')
+    if not full_view:
+        faculty_queryset = faculty_queryset.only(*FACULTY_LIST_FIELDS)
     
     # Filter by department if provided (supports both ID and slug)
     department_param = request.GET.get('department_id')
     if department_param:
-        try:
-            try:
-                department = Department.objects.get(slug=department_param)
-            except Department.DoesNotExist:
-                department = Department.objects.get(id=int(department_param))
+        department = find_department(department_param)
+        if department:
             faculty_queryset = faculty_queryset.filter(department=department)
-        except (ValueError, Department.DoesNotExist):
-            pass  # Invalid department parameter, return all
+        # Invalid department parameter, return all
     
     # Filter by designation if provided
     designation_id = request.GET.get('designation_id')
     if designation_id:
         faculty_queryset = faculty_queryset.filter(designation_id=designation_id)
     
-    faculty_dto = [faculty_to_dto(faculty) for faculty in faculty_queryset]
-    return Response(faculty_dto, status=status.HTTP_200_OK)
+    return list_response(request, faculty_queryset, faculty_to_dto if full_view else faculty_list_to_dto)
 
 
 @swagger_auto_schema(
@@ -268,6 +304,7 @@ def get_all_faculty(request):
     }
 )
 @api_view(['GET'])
+@cache_response(*FACULTY_MODELS, FacultyBanner)
 def get_faculty_detail(request, faculty_id):
     """Get complete faculty details with all related data"""
     faculty = get_object_or_404(Faculty.objects.select_related('designation', 'department'), id=faculty_id)
@@ -294,11 +331,14 @@ def get_faculty_detail(request, faculty_id):
     }
 )
 @api_view(['GET'])
+@cache_response(*FACULTY_MODELS, FacultyBanner)
 def get_faculty_by_name(request, faculty_name):
     """Get complete faculty details by name with all related data"""
-    try:
-        faculty = Faculty.objects.select_related('designation', 'department').get(name__iexact=faculty_name)
-    except Faculty.DoesNotExist:
+    # Exact match on the indexed normalized name; duplicates resolve to the oldest faculty member
+    faculty = Faculty.objects.select_related('designation', 'department').filter(
+        name_normalized=normalize_name(faculty_name)
+    ).order_by('id').first()
+    if faculty is None:
         return Response(
             {"error": f"Faculty '{faculty_name}' not found"}, 
             status=status.HTTP_404_NOT_FOUND
@@ -310,7 +350,10 @@ def get_faculty_by_name(request, faculty_name):
 
 @swagger_auto_schema(
     method='get',
-    operation_description="Search faculty by name (partial match)",
+    operation_description=(
+        "Search faculty by name. By default a case-insensitive partial match; with `fuzzy=true` a typo and "
+        "transliteration tolerant match (e.g. 'Laxmi' finds 'Lakshmi') returning ranked candidates with a `match_score`"
+    ),
     operation_id="search_faculty_by_name",
     manual_parameters=[
         openapi.Parameter(
@@ -319,16 +362,35 @@ def get_faculty_by_name(request, faculty_name):
             description="Search term to find faculty (partial match, case-insensitive)",
             type=openapi.TYPE_STRING,
             required=True
+        ),
+        openapi.Parameter(
+            'fuzzy',
+            openapi.IN_QUERY,
+            description="Set to true for typo-tolerant matching ranked by similarity",
+            type=openapi.TYPE_BOOLEAN,
+            required=False
+        ),
+        openapi.Parameter(
+            'limit',
+            openapi.IN_QUERY,
+            description=f"Fuzzy mode only: maximum number of candidates (default {DEFAULT_FUZZY_RESULTS}, max {MAX_FUZZY_RESULTS})",
+            type=openapi.TYPE_INTEGER,
+            required=False
         )
     ],
     responses={
         200: openapi.Response(description="Faculty members found successfully"),
+        400: openapi.Response(description="Invalid limit"),
         404: openapi.Response(description="No faculty found")
     }
 )
 @api_view(['GET'])
+@cache_response(*FACULTY_MODELS)
 def search_faculty_by_name(request, search_term):
-    """Search faculty by name with partial matching"""
+    """Search faculty by name with partial or (?fuzzy=true) typo-tolerant matching"""
+    if request.GET.get('fuzzy', '').lower() == 'true':
+        return search_faculty_fuzzy(request, search_term)
+
     faculty_queryset = Faculty.objects.select_related('designation', 'department').filter(name__icontains=search_term)
     
     if not faculty_queryset.exists():
@@ -341,9 +403,41 @@ def search_faculty_by_name(request, search_term):
     return Response(faculty_dto, status=status.HTTP_200_OK)
 
 
+def search_faculty_fuzzy(request, search_term):
+    """Ranked faculty candidates for a possibly misspelled name"""
+    try:
+        limit = int(request.GET.get('limit') or DEFAULT_FUZZY_RESULTS)
+    except ValueError:
+        return Response({"error": "limit must be an integer"}, status=status.HTTP_400_BAD_REQUEST)
+    if not 1 <= limit <= MAX_FUZZY_RESULTS:
+        return Response(
+            {"error": f"limit must be between 1 and {MAX_FUZZY_RESULTS}"},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    matches = search_faculty_names(search_term, limit)
+    faculty_by_id = Faculty.objects.select_related('designation', 'department').in_bulk(
+        [faculty_id for faculty_id, _ in matches]
+    )
+    faculty_dto = [
+        dict(faculty_to_dto(faculty_by_id[faculty_id]), match_score=score)
+        for faculty_id, score in matches
+        if faculty_id in faculty_by_id
+    ]
+    if not faculty_dto:
+        return Response(
+            {"error": f"No faculty found matching '{search_term}'"},
+            status=status.HTTP_404_NOT_FOUND
+        )
+    return Response(faculty_dto, status=status.HTTP_200_OK)
+
+
 @swagger_auto_schema(
     method='get',
-    operation_description="Get faculty by department",
+    operation_description=(
+        "Get faculty by department. The head of department is returned separately; "
+        "other members are ordered by designation seniority, then name"
+    ),
     operation_id="get_faculty_by_department",
     manual_parameters=[
         openapi.Parameter(
@@ -352,51 +446,51 @@ def search_faculty_by_name(request, search_term):
             description="ID of the department",
             type=openapi.TYPE_INTEGER,
             required=True
-        )
+        ),
+        VIEW_PARAMETER
     ],
     responses={
         200: openapi.Response(description="Faculty members retrieved successfully"),
+        400: openapi.Response(description="Unknown view"),
         404: openapi.Response(description="Department not found")
     }
 )
 @api_view(['GET'])
+@cache_response(*FACULTY_MODELS, FacultyBanner)
 def get_faculty_by_department(request, department_id):
     """Get all faculty members of a specific department (by ID or slug)"""
     try:
-        dept_id = int(department_id)
-        department = get_object_or_404(Department, id=dept_id)
-    except ValueError:
-        department = get_object_or_404(Department, slug=department_id)
-    
-    faculty_queryset = department.faculty_members.select_related('designation').all()
-    
-    # Identify HOD (Head of Department) - typically has "Head" or "HOD" in designation
+        full_view = wants_full_view(request)
+    except ValueError as e:
+        return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    department = resolve_department(department_id)
+
+    # Heads rank first (designation_rank is copied from the designation on save),
+    # so one query on faculty_dept_rank_idx returns the HOD and the ordered members
+    faculty_queryset = Faculty.objects.filter(department=department).select_related(
+        'designation', 'department'
+    ).order_by('designation_rank', 'name', 'id')
+    if not full_view:
+        faculty_queryset = faculty_queryset.only(*FACULTY_LIST_FIELDS, 'is_hod', 'designation_rank')
+    faculty_members = list(faculty_queryset)
+
     hod = None
-    hod_designation_keywords = ['head', 'hod', 'chair', 'director', 'principal']
-    regular_faculty = []
-    
-    for faculty in faculty_queryset:
-        if faculty.designation:
-            designation_lower = faculty.designation.name.lower()
-            if any(keyword in designation_lower for keyword in hod_designation_keywords):
-                if not hod:  # Take first HOD found
-                    hod = faculty_to_dto(faculty, include_full_details=True)
-                else:
-                    regular_faculty.append(faculty_to_dto(faculty))
-            else:
-                regular_faculty.append(faculty_to_dto(faculty))
-        else:
-            regular_faculty.append(faculty_to_dto(faculty))
-    
+    if faculty_members and faculty_members[0].is_hod:
+        # Take the first HOD found; any others are listed with the members
+        head = faculty_members.pop(0)
+        hod = faculty_to_dto(head, include_full_details=True) if full_view else faculty_list_to_dto(head)
+
+    to_dto = faculty_to_dto if full_view else faculty_list_to_dto
     response_data = {
         'department': {
             'id': department.id,
             'name': department.name,
             'slug': department.slug,
         },
-        'faculty_count': faculty_queryset.count(),
+        'faculty_count': len(faculty_members) + (hod is not None),
         'hod': hod,  # Head of Department (if exists)
-        'faculty_members': regular_faculty  # All other faculty
+        'faculty_members': [to_dto(faculty) for faculty in faculty_members]  # All other faculty
     }
     
     return Response(response_data, status=status.HTTP_200_OK)
@@ -421,6 +515,7 @@ def get_faculty_by_department(request, department_id):
     }
 )
 @api_view(['GET'])
+@cache_response(*FACULTY_MODELS)
 def get_faculty_by_designation(request, designation_id):
     """Get all faculty members with a specific designation"""
     designation = get_object_or_404(Designation, id=designation_id)
@@ -458,6 +553,7 @@ def get_faculty_by_designation(request, designation_id):
     }
 )
 @api_view(['GET'])
+@cache_response(Faculty, FacultyBanner)
 def get_faculty_banners(request, faculty_id):
     """Get all banners for a specific faculty"""
     faculty = get_object_or_404(Faculty, id=faculty_id)
@@ -11,6 +11,7 @@ from base.models.forms_models import ContactForm, CareerForm, GrievanceForm
 from base.models.department_model import Department
 from base.models.commitee_model import CommitteeCategory
 from base.models.faculty_model import Faculty
+from base.pagination import PAGINATION_PARAMETERS, list_response
 
 
 def contact_form_to_dto(form):
@@ -157,7 +158,7 @@ def submit_contact_form(request):
             type=openapi.TYPE_STRING,
             required=False
         )
-    ],
+    ] + PAGINATION_PARAMETERS,
     responses={
         200: openapi.Response(description="Contact forms retrieved successfully")
     }
@@ -175,8 +176,7 @@ def get_all_contact_forms(request):
             Q(phone__icontains=search_term)
         )
     
-    forms_dto = [contact_form_to_dto(form) for form in queryset]
-    return Response(forms_dto)
+    return list_response(request, queryset, contact_form_to_dto)
 
 
 # ============================================================================
@@ -286,7 +286,7 @@ def submit_career_form(request):
             type=openapi.TYPE_STRING,
             required=False
         )
-    ],
+    ] + PAGINATION_PARAMETERS,
     responses={
         200: openapi.Response(description="Career applications retrieved successfully")
     }
@@ -309,8 +309,7 @@ def get_all_career_forms(request):
             Q(current_opening__icontains=search_term)
         )
     
-    forms_dto = [career_form_to_dto(form) for form in queryset]
-    return Response(forms_dto)
+    return list_response(request, queryset, career_form_to_dto)
 
 
 # ============================================================================
@@ -417,7 +416,7 @@ def submit_grievance_form(request):
             type=openapi.TYPE_STRING,
             required=False
         )
-    ],
+    ] + PAGINATION_PARAMETERS,
     responses={
         200: openapi.Response(description="Grievances retrieved successfully")
     }
@@ -453,8 +452,7 @@ def get_all_grievances(request):
             Q(reference_number__icontains=search_term)
         )
     
-    grievances_dto = [grievance_form_to_dto(grievance) for grievance in queryset]
-    return Response(grievances_dto)
+    return list_response(request, queryset, grievance_form_to_dto)
 
 
 @swagger_auto_schema(
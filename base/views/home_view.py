@@ -0,0 +1,40 @@
+from django.conf import settings
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
+from rest_framework import status
+from drf_yasg.utils import swagger_auto_schema
+from drf_yasg import openapi
+from base.home_page import get_home_page
+
+
+@swagger_auto_schema(
+    method='get',
+    operation_description=(
+        "Get everything the homepage shows in one request: featured department statistics, "
+        "featured course numbers, placement and research statistics, featured news and companies. "
+        "With DEBUG enabled the response also carries per-section build timings in milliseconds."
+    ),
+    operation_id="get_home_page",
+    responses={
+        200: openapi.Response(
+            description="Homepage data retrieved successfully",
+            examples={
+                "application/json": {
+                    "featured_statistics": [],
+                    "featured_data": [],
+                    "placements": [],
+                    "research": [],
+                    "featured_news": [],
+                    "companies": []
+                }
+            }
+        )
+    }
+)
+@api_view(['GET'])
+def get_home_page_data(request):
+    """Get all featured homepage content in one response (cached as a single unit)"""
+    payload, timings, cached = get_home_page()
+    if settings.DEBUG:
+        payload = dict(payload, debug={'cached': cached, 'timings_ms': timings})
+    return Response(payload, status=status.HTTP_200_OK)
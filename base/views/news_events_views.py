@@ -4,10 +4,15 @@ from rest_framework.response import Response
 from rest_framework import status
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
-from django.db.models import Q
+from django.db.models import Prefetch
 from base.models.news_events_models import NewsEvents, MetaData, TagModel, ImageModel
 from base.models.department_model import Department
 from datetime import datetime
+from base.news_search import search_news_events
+from base.pagination import PAGINATION_PARAMETERS, list_response
+from base.projections import VIEW_PARAMETER, wants_full_view
+from base.reference_data import ReferenceTable
+from base.response_cache import cache_response
 
 
 def metadata_to_dto(metadata):
@@ -45,6 +50,9 @@ def tag_to_dto(tag):
     }
 
 
+TAG_TABLE = ReferenceTable('tags', TagModel, lambda: [tag_to_dto(tag) for tag in TagModel.objects.all()])
+
+
 def image_to_dto(image):
     """Convert ImageModel to DTO"""
     return {
@@ -57,6 +65,15 @@ def image_to_dto(image):
     }
 
 
+def active_images_prefetch():
+    """Prefetch of active images, oldest first, into `active_images` for get_primary_image()"""
+    return Prefetch(
+        'images',
+        queryset=ImageModel.objects.filter(is_active=True).order_by('id'),
+        to_attr='active_images'
+    )
+
+
 def news_events_to_dto(news_event, include_full_details=False):
     """Convert NewsEvents model to DTO"""
     dto = {
@@ -100,8 +117,9 @@ def news_events_to_dto(news_event, include_full_details=False):
         })
     else:
         # Include basic relations for list views
+        primary_image = news_event.get_primary_image()
         dto.update({
-            'primary_image': image_to_dto(news_event.get_primary_image()) if news_event.get_primary_image() else None,
+            'primary_image': image_to_dto(primary_image) if primary_image else None,
             'tags_count': news_event.tags.count(),
             'images_count': news_event.images.count(),
             'has_metadata': news_event.metadata is not None,
@@ -110,6 +128,46 @@ def news_events_to_dto(news_event, include_full_details=False):
     return dto
 
 
+# Tables every news/event DTO reads (see base/response_cache.py)
+NEWS_EVENT_MODELS = (NewsEvents, Department, TagModel, ImageModel, MetaData)
+
+
+# Columns needed by news_events_list_to_dto(); content and SEO fields stay in MySQL
+NEWS_EVENTS_LIST_FIELDS = (
+    'heading', 'slug', 'date', 'link', 'category', 'department', 'metadata',
+    'is_published', 'is_featured', 'unique_id', 'created_at', 'updated_at',
+    'department__name', 'department__slug',
+)
+
+
+def news_events_list_to_dto(news_event):
+    """Convert NewsEvents model to the slim list DTO (no content or SEO fields)"""
+    primary_image = news_event.get_primary_image()
+    return {
+        'id': news_event.id,
+        'heading': news_event.heading,
+        'slug': news_event.slug,
+        'date': news_event.date.isoformat() if news_event.date else None,
+        'link': news_event.link,
+        'category': news_event.get_category_display(),
+        'category_value': news_event.category,
+        'department': {
+            'id': news_event.department.id,
+            'name': news_event.department.name,
+            'slug': news_event.department.slug
+        } if news_event.department else None,
+        'is_published': news_event.is_published,
+        'is_featured': news_event.is_featured,
+        'unique_id': str(news_event.unique_id),
+        'created_at': news_event.created_at.isoformat() if news_event.created_at else None,
+        'updated_at': news_event.updated_at.isoformat() if news_event.updated_at else None,
+        'primary_image': image_to_dto(primary_image) if primary_image else None,
+        'tags_count': len(news_event.tags.all()),
+        'images_count': len(news_event.images.all()),
+        'has_metadata': news_event.metadata_id is not None,
+    }
+
+
 # ============================================================================
 # NEWS & EVENTS ENDPOINTS
 # ============================================================================
@@ -248,7 +306,7 @@ def create_news_event(request):
         openapi.Parameter(
             'search',
             openapi.IN_QUERY,
-            description="Search in heading, content, or tags",
+            description="Search heading, content, tags and department name. Every word must match (as a word prefix); results are ordered by relevance",
             type=openapi.TYPE_STRING,
             required=False
         ),
@@ -258,16 +316,32 @@ def create_news_event(request):
             description="Filter by tag name",
             type=openapi.TYPE_STRING,
             required=False
-        )
-    ],
+        ),
+        VIEW_PARAMETER
+    ] + PAGINATION_PARAMETERS,
     responses={
         200: openapi.Response(description="News and events retrieved successfully")
     }
 )
 @api_view(['GET'])
+@cache_response(*NEWS_EVENT_MODELS)
 def get_all_news_events(request):
     """Get all news and events with optional filtering"""
-    queryset = NewsEvents.objects.select_related('department', 'metadata').prefetch_related('tags', 'images')
+    try:
+        full_view = wants_full_view(request)
+    except ValueError as e:
+        return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    if full_view:
+        queryset = NewsEvents.objects.select_related('department', 'metadata').prefetch_related(
+            'tags', 'images', active_images_prefetch()
+        )
+    else:
+        queryset = NewsEvents.objects.select_related('department').only(*NEWS_EVENTS_LIST_FIELDS).prefetch_related(
+            Prefetch('tags', queryset=TagModel.objects.only('id')),
+            'images',
+            active_images_prefetch()
+        )
     
     # Apply filters
     department_id = request.GET.get('department_id')
@@ -308,18 +382,12 @@ def get_all_news_events(request):
     if tag:
         queryset = queryset.filter(tags__tag_name__icontains=tag)
     
-    # Search functionality
+    # Search functionality (ranked by relevance, see base/news_search.py)
     search_term = request.GET.get('search')
     if search_term:
-        queryset = queryset.filter(
-            Q(heading__icontains=search_term) |
-            Q(content__icontains=search_term) |
-            Q(tags__tag_name__icontains=search_term) |
-            Q(department__name__icontains=search_term)
-        ).distinct()
+        queryset = search_news_events(queryset, search_term)
     
-    news_events = [news_events_to_dto(news_event) for news_event in queryset]
-    return Response(news_events)
+    return list_response(request, queryset, news_events_to_dto if full_view else news_events_list_to_dto)
 
 
 @swagger_auto_schema(
@@ -332,6 +400,7 @@ def get_all_news_events(request):
     }
 )
 @api_view(['GET'])
+@cache_response(*NEWS_EVENT_MODELS)
 def get_news_event(request, news_id):
     """Get news/event details"""
     news_event = get_object_or_404(
@@ -484,15 +553,17 @@ def create_tag(request):
     }
 )
 @api_view(['GET'])
+@cache_response(TagModel)
 def get_all_tags(request):
     """Get all tags with optional search"""
-    queryset = TagModel.objects.all()
-    
+    tags = TAG_TABLE.rows()
+
     search_term = request.GET.get('search')
     if search_term:
-        queryset = queryset.filter(tag_name__icontains=search_term)
-    
-    tags = [tag_to_dto(tag) for tag in queryset]
+        # Case-insensitive substring match, like icontains
+        search_term = search_term.casefold()
+        tags = [tag for tag in tags if search_term in (tag['tag_name'] or '').casefold()]
+
     return Response(tags)
 
 
@@ -548,12 +619,13 @@ def create_image(request):
             type=openapi.TYPE_BOOLEAN,
             required=False
         )
-    ],
+    ] + PAGINATION_PARAMETERS,
     responses={
         200: openapi.Response(description="Images retrieved successfully")
     }
 )
 @api_view(['GET'])
+@cache_response(ImageModel)
 def get_all_images(request):
     """Get all images with optional filtering"""
     queryset = ImageModel.objects.all()
@@ -562,8 +634,7 @@ def get_all_images(request):
     if is_active is not None:
         queryset = queryset.filter(is_active=is_active.lower() == 'true')
     
-    images = [image_to_dto(image) for image in queryset]
-    return Response(images)
+    return list_response(request, queryset, image_to_dto)
 
 
 # ============================================================================
@@ -6,6 +6,8 @@ from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 from django.db.models import Q
 from base.models.placement_name_model import PlacementName, PlacementImageModel, ResearchName
+from base.pagination import PAGINATION_PARAMETERS, list_response
+from base.response_cache import cache_response
 
 
 def placement_name_to_dto(placement):
@@ -129,12 +131,13 @@ def create_placement_name(request):
             type=openapi.TYPE_STRING,
             required=False
         )
-    ],
+    ] + PAGINATION_PARAMETERS,
     responses={
         200: openapi.Response(description="Placement statistics retrieved successfully")
     }
 )
 @api_view(['GET'])
+@cache_response(PlacementName)
 def get_all_placement_names(request):
     """Get all placement statistics with optional filtering"""
     queryset = PlacementName.objects.all()
@@ -152,8 +155,7 @@ def get_all_placement_names(request):
             Q(placement_number__icontains=search_term)
         )
     
-    placements = [placement_name_to_dto(placement) for placement in queryset]
-    return Response(placements)
+    return list_response(request, queryset, placement_name_to_dto)
 
 
 @swagger_auto_schema(
@@ -166,6 +168,7 @@ def get_all_placement_names(request):
     }
 )
 @api_view(['GET'])
+@cache_response(PlacementName)
 def get_placement_name(request, placement_id):
     """Get placement statistic details"""
     placement = get_object_or_404(PlacementName, id=placement_id)
@@ -285,12 +288,13 @@ def create_placement_image(request):
             type=openapi.TYPE_STRING,
             required=False
         )
-    ],
+    ] + PAGINATION_PARAMETERS,
     responses={
         200: openapi.Response(description="Placement images retrieved successfully")
     }
 )
 @api_view(['GET'])
+@cache_response(PlacementImageModel)
 def get_all_placement_images(request):
     """Get all placement images with optional search"""
     queryset = PlacementImageModel.objects.all()
@@ -299,8 +303,7 @@ def get_all_placement_images(request):
     if search_term:
         queryset = queryset.filter(alt__icontains=search_term)
     
-    images = [placement_image_to_dto(image) for image in queryset]
-    return Response(images)
+    return list_response(request, queryset, placement_image_to_dto)
 
 
 @swagger_auto_schema(
@@ -313,6 +316,7 @@ def get_all_placement_images(request):
     }
 )
 @api_view(['GET'])
+@cache_response(PlacementImageModel)
 def get_placement_image(request, image_id):
     """Get placement image details"""
     placement_image = get_object_or_404(PlacementImageModel, id=image_id)
@@ -444,12 +448,13 @@ def create_research_name(request):
             type=openapi.TYPE_STRING,
             required=False
         )
-    ],
+    ] + PAGINATION_PARAMETERS,
     responses={
         200: openapi.Response(description="Research statistics retrieved successfully")
     }
 )
 @api_view(['GET'])
+@cache_response(ResearchName)
 def get_all_research_names(request):
     """Get all research statistics with optional filtering"""
     queryset = ResearchName.objects.all()
@@ -467,8 +472,7 @@ def get_all_research_names(request):
             Q(number__icontains=search_term)
         )
     
-    research_list = [research_name_to_dto(research) for research in queryset]
-    return Response(research_list)
+    return list_response(request, queryset, research_name_to_dto)
 
 
 @swagger_auto_schema(
@@ -481,6 +485,7 @@ def get_all_research_names(request):
     }
 )
 @api_view(['GET'])
+@cache_response(ResearchName)
 def get_research_name(request, research_id):
     """Get research statistic details"""
     research = get_object_or_404(ResearchName, id=research_id)
@@ -0,0 +1,74 @@
+import hashlib
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
+from rest_framework import status
+from drf_yasg.utils import swagger_auto_schema
+from drf_yasg import openapi
+from base.response_cache import cache_response
+from base.views.commitee_views import COMMITTEE_CATEGORY_TABLE
+from base.views.company_views import COMPANY_TABLE
+from base.views.document_view import DEPARTMENT_TABLE
+from base.views.faculty_views import DESIGNATION_TABLE
+from base.views.news_events_views import TAG_TABLE
+
+# Bundle key -> ReferenceTable, in the order the version hash covers them
+REFERENCE_DATA_TABLES = {
+    'designations': DESIGNATION_TABLE,
+    'committee_categories': COMMITTEE_CATEGORY_TABLE,
+    'tags': TAG_TABLE,
+    'companies': COMPANY_TABLE,
+    'departments': DEPARTMENT_TABLE,
+}
+
+
+def reference_data():
+    """({bundle key: rows}, version hash that changes only when the content of a table does)"""
+    tables, hashes = {}, []
+    for key, table in REFERENCE_DATA_TABLES.items():
+        tables[key], table_hash = table.get()
+        hashes.append(table_hash)
+    return tables, hashlib.sha1(':'.join(hashes).encode()).hexdigest()
+
+
+@swagger_auto_schema(
+    method='get',
+    operation_description=(
+        "Get designations, committee categories, tags, companies and the department list in one "
+        "request, with a version hash of their content. Pass the last version seen as ?version= "
+        "and only {version, unchanged: true} is returned while nothing has changed."
+    ),
+    operation_id="get_reference_data",
+    manual_parameters=[
+        openapi.Parameter(
+            'version',
+            openapi.IN_QUERY,
+            description="Version hash from an earlier response",
+            type=openapi.TYPE_STRING,
+            required=False
+        )
+    ],
+    responses={
+        200: openapi.Response(
+            description="Reference data retrieved successfully",
+            examples={
+                "application/json": {
+                    "version": "3f7a...",
+                    "unchanged": False,
+                    "designations": [],
+                    "committee_categories": [],
+                    "tags": [],
+                    "companies": [],
+                    "departments": []
+                }
+            }
+        )
+    }
+)
+@api_view(['GET'])
+@cache_response(*(table.model for table in REFERENCE_DATA_TABLES.values()))
+def get_reference_data(request):
+    """Get every reference table in one response, or only its version if the client has it"""
+    tables, version = reference_data()
+    if request.GET.get('version') == version:
+        return Response({'version': version, 'unchanged': True}, status=status.HTTP_200_OK)
+    return Response({'version': version, 'unchanged': False, **tables}, status=status.HTTP_200_OK)
@@ -0,0 +1,159 @@
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
+from rest_framework import status
+from drf_yasg.utils import swagger_auto_schema
+from drf_yasg import openapi
+from base.autocomplete import (
+    AUTOCOMPLETE_SOURCES, DEFAULT_AUTOCOMPLETE_RESULTS, MAX_AUTOCOMPLETE_RESULTS,
+    get_autocomplete_index
+)
+from base.site_search import (
+    DEFAULT_SEARCH_LIMIT, MAX_SEARCH_LIMIT, SEARCH_SOURCES,
+    parse_search_types, search_documents
+)
+
+
+@swagger_auto_schema(
+    method='get',
+    operation_description=(
+        "Search departments, courses, faculty, news & events, achievements and companies in one request. "
+        "Every word of `q` must match (as a word prefix); results are ranked by relevance and tagged with their type."
+    ),
+    operation_id="site_search",
+    manual_parameters=[
+        openapi.Parameter(
+            'q',
+            openapi.IN_QUERY,
+            description="Search text",
+            type=openapi.TYPE_STRING,
+            required=True
+        ),
+        openapi.Parameter(
+            'types',
+            openapi.IN_QUERY,
+            description=f"Comma separated types to search. Defaults to all: {', '.join(SEARCH_SOURCES)}",
+            type=openapi.TYPE_STRING,
+            required=False
+        ),
+        openapi.Parameter(
+            'limit',
+            openapi.IN_QUERY,
+            description=f"Maximum number of results (default {DEFAULT_SEARCH_LIMIT}, max {MAX_SEARCH_LIMIT})",
+            type=openapi.TYPE_INTEGER,
+            required=False
+        )
+    ],
+    responses={
+        200: openapi.Response(
+            description="Search results retrieved successfully",
+            examples={
+                "application/json": {
+                    "query": "robotics",
+                    "results": [
+                        {
+                            "type": "news",
+                            "id": 12,
+                            "title": "Robotics Workshop",
+                            "subtitle": "Events",
+                            "slug": "robotics-workshop",
+                            "rank": 10
+                        }
+                    ]
+                }
+            }
+        ),
+        400: "Missing query, unknown type or invalid limit"
+    }
+)
+@api_view(['GET'])
+def site_search(request):
+    """Search every public content type through the site search index"""
+    query = request.query_params.get('q', '').strip()
+    if not query:
+        return Response({"error": "q is required"}, status=status.HTTP_400_BAD_REQUEST)
+
+    try:
+        types = parse_search_types(request.query_params.get('types'))
+    except ValueError as e:
+        return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    try:
+        limit = int(request.query_params.get('limit') or DEFAULT_SEARCH_LIMIT)
+    except ValueError:
+        return Response({"error": "limit must be an integer"}, status=status.HTTP_400_BAD_REQUEST)
+    if not 1 <= limit <= MAX_SEARCH_LIMIT:
+        return Response(
+            {"error": f"limit must be between 1 and {MAX_SEARCH_LIMIT}"},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    return Response({'query': query, 'results': search_documents(query, types, limit)})
+
+
+@swagger_auto_schema(
+    method='get',
+    operation_description=(
+        "Typeahead suggestions for department, course and faculty names, served from an in-memory prefix index. "
+        "`q` matches the start of the name or of any later word in it; whole-name matches come first, then shorter names."
+    ),
+    operation_id="autocomplete",
+    manual_parameters=[
+        openapi.Parameter(
+            'q',
+            openapi.IN_QUERY,
+            description="Typed prefix",
+            type=openapi.TYPE_STRING,
+            required=True
+        ),
+        openapi.Parameter(
+            'types',
+            openapi.IN_QUERY,
+            description=f"Comma separated types to suggest. Defaults to all: {', '.join(AUTOCOMPLETE_SOURCES)}",
+            type=openapi.TYPE_STRING,
+            required=False
+        ),
+        openapi.Parameter(
+            'limit',
+            openapi.IN_QUERY,
+            description=f"Maximum number of suggestions (default {DEFAULT_AUTOCOMPLETE_RESULTS}, max {MAX_AUTOCOMPLETE_RESULTS})",
+            type=openapi.TYPE_INTEGER,
+            required=False
+        )
+    ],
+    responses={
+        200: openapi.Response(
+            description="Suggestions retrieved successfully",
+            examples={
+                "application/json": {
+                    "query": "comp",
+                    "results": [
+                        {"type": "department", "id": 1, "name": "Computer Science", "slug": "cse"}
+                    ]
+                }
+            }
+        ),
+        400: "Unknown type or invalid limit"
+    }
+)
+@api_view(['GET'])
+def autocomplete(request):
+    """Suggest department, course and faculty names starting with the typed prefix"""
+    query = request.query_params.get('q', '')
+
+    try:
+        types = parse_search_types(request.query_params.get('types'), AUTOCOMPLETE_SOURCES)
+    except ValueError as e:
+        return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    try:
+        limit = int(request.query_params.get('limit') or DEFAULT_AUTOCOMPLETE_RESULTS)
+    except ValueError:
+        return Response({"error": "limit must be an integer"}, status=status.HTTP_400_BAD_REQUEST)
+    if not 1 <= limit <= MAX_AUTOCOMPLETE_RESULTS:
+        return Response(
+            {"error": f"limit must be between 1 and {MAX_AUTOCOMPLETE_RESULTS}"},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    results = get_autocomplete_index().lookup(query, types, limit)
+    return Response({'query': query, 'results': results})
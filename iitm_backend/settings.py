@@ -104,6 +104,22 @@ DATABASES = {
     }
 }
 
+# Cache shared by every serverless instance through the database (see
+# base/db_cache.py). Tests whose query counts assume an in-memory cache
+# override this with override_settings(CACHES=...).
+CACHES = {
+    'default': {
+        'BACKEND': 'base.db_cache.CompressedDatabaseCache',
+        'LOCATION': 'default',
+        'TIMEOUT': 300,
+        'OPTIONS': {
+            'MAX_ENTRIES': 20000,
+            'LOCAL_TIMEOUT': 5,
+            'LOCAL_MAX_ENTRIES': 1000,
+        },
+    }
+}
+
 
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators